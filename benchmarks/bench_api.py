@@ -0,0 +1,269 @@
+"""End-to-end API load benchmark against the in-process fake EDGAR server.
+
+Usage::
+
+    python benchmarks/bench_api.py                                  # every scenario, 10s each
+    python benchmarks/bench_api.py --scenario financials --concurrency 32 --duration 20
+    python benchmarks/bench_api.py --latency 0.05 --jitter 0.02 --error-rate 0.01
+    python benchmarks/bench_api.py --save baseline.json
+    python benchmarks/bench_api.py --compare baseline.json --max-regression 0.15
+
+Each scenario runs in a fresh subprocess, so peak RSS is per scenario and caches start
+cold. The app is driven through ``httpx.ASGITransport`` (no socket between the load
+generator and the API); the SEC side is the fake server from ``fake_edgar.py``. Unless
+``--sec-rps`` is given the outbound rate limiter is replaced with an effectively
+unlimited one, so the hot paths rather than the SEC's 10 req/s budget are measured.
+Every ticker in the working set is requested once before measuring unless ``--cold``.
+
+``--compare`` exits non-zero when a scenario's req/s drops, or its p99 grows, by more
+than ``--max-regression`` relative to the saved results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fake_edgar import FakeEdgarServer, FixtureSet  # noqa: E402
+
+from sec_edgar_api.app import create_app  # noqa: E402
+from sec_edgar_api.clients.rate_limiter import TokenBucketRateLimiter  # noqa: E402
+from sec_edgar_api.config import get_settings  # noqa: E402
+from sec_edgar_api.dependencies import close_http_client, get_rate_limiter  # noqa: E402
+
+Request = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def _ticker(tickers: list[str], rng: random.Random) -> str:
+    return rng.choice(tickers)
+
+
+def build_scenarios(tickers: list[str]) -> dict[str, Request]:
+    return {
+        "financials": lambda client, rng: client.get(f"/financials/{_ticker(tickers, rng)}"),
+        "income-statement": lambda client, rng: client.get(
+            f"/financials/{_ticker(tickers, rng)}/income-statement"
+        ),
+        "financials-batch": lambda client, rng: client.post(
+            "/financials/batch",
+            json={"tickers": rng.sample(tickers, min(10, len(tickers)))},
+        ),
+        "company-10k": lambda client, rng: client.get(
+            f"/filings/10-k/{_ticker(tickers, rng)}?limit=5"
+        ),
+        "filings-10k": lambda client, rng: client.get(
+            f"/filings/10-k?max_companies={len(tickers)}&limit_per_company=2"
+        ),
+    }
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    requests: int
+    errors: int
+    requests_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_rss_mb: float
+    sec_requests: int
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    scale = 1024**2 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    send: Request,
+    *,
+    concurrency: int,
+    duration: float,
+    seed: int,
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(index: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed + index)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await send(client, rng)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return latencies, errors
+
+
+async def run_scenario(args: argparse.Namespace) -> ScenarioResult:
+    fixtures = FixtureSet(
+        companies=args.companies,
+        filings_per_company=args.filings,
+        untracked_concepts=args.facts_concepts,
+    )
+    tickers = fixtures.tickers[: args.tickers]
+    send = build_scenarios(tickers)[args.scenario]
+    server = FakeEdgarServer(
+        fixtures, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate
+    )
+    with server:
+        overrides = {"requests_per_second": args.sec_rps} if args.sec_rps else {}
+        settings = server.settings(**overrides)
+        app = create_app(settings)
+        app.dependency_overrides[get_settings] = lambda: settings
+        if not args.sec_rps:
+            limiter = TokenBucketRateLimiter(1_000_000, 1_000_000)
+            app.dependency_overrides[get_rate_limiter] = lambda: limiter
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=None
+            ) as client:
+                if not args.cold:
+                    for ticker in tickers:
+                        await client.get(f"/financials/{ticker}")
+                        await client.get(f"/filings/10-k/{ticker}?limit=1")
+                sec_before = server.stats.requests
+                started = time.perf_counter()
+                latencies, errors = await drive(
+                    client,
+                    send,
+                    concurrency=args.concurrency,
+                    duration=args.duration,
+                    seed=args.seed,
+                )
+                elapsed = time.perf_counter() - started
+        finally:
+            await close_http_client()
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return ScenarioResult(
+        scenario=args.scenario,
+        requests=len(latencies),
+        errors=errors,
+        requests_per_second=len(latencies) / elapsed,
+        p50_ms=cuts[49] * 1000,
+        p99_ms=cuts[98] * 1000,
+        peak_rss_mb=peak_rss_mb(),
+        sec_requests=server.stats.requests - sec_before,
+    )
+
+
+def run_isolated(scenario: str, argv: list[str]) -> ScenarioResult:
+    completed = subprocess.run(
+        [sys.executable, __file__, *argv, "--scenario", scenario, "--child"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return ScenarioResult(**json.loads(completed.stdout.splitlines()[-1]))
+
+
+def find_regressions(
+    results: list[ScenarioResult], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[str]:
+    problems = []
+    for result in results:
+        previous = baseline.get(result.scenario)
+        if previous is None:
+            continue
+        if result.requests_per_second < previous["requests_per_second"] * (1 - threshold):
+            problems.append(
+                f"{result.scenario}: {result.requests_per_second:.0f} req/s "
+                f"vs {previous['requests_per_second']:.0f}"
+            )
+        if result.p99_ms > previous["p99_ms"] * (1 + threshold):
+            problems.append(
+                f"{result.scenario}: p99 {result.p99_ms:.1f} ms vs {previous['p99_ms']:.1f}"
+            )
+    return problems
+
+
+def main() -> None:
+    scenarios = list(build_scenarios([]))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=scenarios, action="append")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per scenario")
+    parser.add_argument("--tickers", type=int, default=50, help="working set of companies")
+    parser.add_argument("--companies", type=int, default=10_000, help="size of ticker list")
+    parser.add_argument("--filings", type=int, default=1_000, help="submissions rows")
+    parser.add_argument("--facts-concepts", type=int, default=400, help="untracked concepts")
+    parser.add_argument("--latency", type=float, default=0.0, help="SEC delay per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform SEC delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of SEC 503s")
+    parser.add_argument("--sec-rps", type=float, help="keep the real limiter at this rate")
+    parser.add_argument("--cold", action="store_true", help="skip the warm-up pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results to check against")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        args.scenario = args.scenario[0]
+        print(json.dumps(asdict(asyncio.run(run_scenario(args)))))
+        return
+
+    passthrough = _strip_option(sys.argv[1:], "--scenario")
+    print(
+        f"{'scenario':<18} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'errors':>7} {'SEC reqs':>9} {'peak RSS MB':>12}"
+    )
+    results = []
+    for scenario in args.scenario or scenarios:
+        result = run_isolated(scenario, passthrough)
+        results.append(result)
+        print(
+            f"{result.scenario:<18} {result.requests_per_second:>9.1f} {result.p50_ms:>9.1f} "
+            f"{result.p99_ms:>9.1f} {result.errors:>7} {result.sec_requests:>9} "
+            f"{result.peak_rss_mb:>12.0f}"
+        )
+
+    if args.save:
+        args.save.write_text(json.dumps({r.scenario: asdict(r) for r in results}, indent=2))
+    if args.compare:
+        problems = find_regressions(
+            results, json.loads(args.compare.read_text()), args.max_regression
+        )
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+
+
+def _strip_option(argv: list[str], option: str) -> list[str]:
+    stripped: list[str] = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == option:
+            skip = True
+        elif not arg.startswith(f"{option}="):
+            stripped.append(arg)
+    return stripped
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Micro-benchmark of FinancialsService metric extraction on a large-filer payload.
+
+Usage::
+
+    python benchmarks/bench_entry_keys.py --entries 3000 --repeat 20
+
+Compares the previous strptime-per-comparison selection against normalized entries on a
+cold payload (normalization included) and on a warm, cached ``CompanyFacts`` view.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable, Mapping
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sec_edgar_api.services.company_facts import CompanyFacts  # noqa: E402
+from sec_edgar_api.services.financials_service import FinancialsService  # noqa: E402
+
+FORMS = ("10-K", "10-Q", "10-Q", "10-Q", "8-K")
+
+
+def build_payload(entries_per_unit: int) -> dict[str, Any]:
+    """Build a companyfacts payload with every tracked concept in two units."""
+    rng = random.Random(0)
+    concepts = {}
+    for concept in sorted(FinancialsService.tracked_concepts()):
+        units = {}
+        for unit in ("USD", "USD/shares"):
+            entries = []
+            for row in range(entries_per_unit):
+                year = 1995 + row % 30
+                entries.append(
+                    {
+                        "start": f"{year}-01-01",
+                        "end": f"{year}-{1 + row % 12:02d}-28",
+                        "val": rng.randint(0, 10**11),
+                        "accn": f"0000320193-{year % 100:02d}-{row:06d}",
+                        "fy": year,
+                        "fp": "FY",
+                        "form": FORMS[row % len(FORMS)],
+                        "filed": f"{year + 1}-{1 + row % 12:02d}-{1 + row % 28:02d}",
+                    }
+                )
+            units[unit] = entries
+        concepts[concept] = {"label": concept, "units": units}
+    return {"cik": 320193, "entityName": "Benchmark Inc", "facts": {"us-gaap": concepts}}
+
+
+def legacy_sort_key(entry: Mapping[str, Any]) -> tuple[int, date, date]:
+    fiscal_year = entry.get("fy") if isinstance(entry.get("fy"), int) else 0
+
+    def parse(value: str | None) -> date:
+        try:
+            return datetime.strptime(value or "", "%Y-%m-%d").date()
+        except ValueError:
+            return date.min
+
+    return fiscal_year, parse(entry.get("filed")), parse(entry.get("end"))
+
+
+def legacy_extract(payload: Mapping[str, Any], history_length: int) -> None:
+    """Selection as FinancialsService performed it before entries were normalized."""
+    us_gaap = payload["facts"]["us-gaap"]
+    for names in FinancialsService.FINANCIAL_CONCEPTS.values():
+        first = names if isinstance(names, str) else names[0]
+        concept = us_gaap[first]
+        candidates = []
+        for unit, entries in concept["units"].items():
+            filtered = [e for e in entries if e["form"].upper().startswith("10-K")] or entries
+            candidates.append((unit, filtered, max(filtered, key=legacy_sort_key)))
+        _, entries, _ = max(candidates, key=lambda item: legacy_sort_key(item[2]))
+        max(entries, key=legacy_sort_key)
+        sorted(entries, key=legacy_sort_key, reverse=True)[:history_length]
+
+
+def time_best(function: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=3000, help="entries per concept unit")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    service = FinancialsService(client=None)
+    payload = build_payload(args.entries)
+    warm = CompanyFacts(payload)
+    options = {
+        "concepts": FinancialsService.FINANCIAL_CONCEPTS,
+        "form_filter": "10-K",
+        "history_lengths": {alias: 5 for alias in FinancialsService.FINANCIAL_CONCEPTS},
+    }
+
+    def normalized_cold() -> None:
+        service._extract_metrics(CompanyFacts(payload), **options)
+
+    def normalized_warm() -> None:
+        service._extract_metrics(warm, **options)
+
+    results = {
+        "legacy (strptime per key)": time_best(lambda: legacy_extract(payload, 5), args.repeat),
+        "normalized, cold payload": time_best(normalized_cold, args.repeat),
+        "normalized, cached payload": time_best(normalized_warm, args.repeat),
+    }
+    baseline = results["legacy (strptime per key)"]
+    for name, seconds in results.items():
+        print(f"{name:<28} {seconds * 1000:>9.2f} ms  {baseline / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
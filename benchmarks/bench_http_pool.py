@@ -0,0 +1,157 @@
+"""Throughput of the SEC HTTP client under different pool configurations.
+
+Usage::
+
+    python benchmarks/bench_http_pool.py --requests 2000 --concurrency 50 --latency 0.005
+
+Requests go to an in-process HTTP/1.1 stub server split across two virtual hosts, like
+www.sec.gov and data.sec.gov. The server reports how many TCP connections each
+configuration opened. HTTP/2 needs TLS with ALPN, which the stub does not provide. Pass
+``--h2-url`` pointing at an HTTP/2 server (for example hypercorn with a self-signed
+certificate) to add HTTP/1.1 vs HTTP/2 rows against it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sec_edgar_api.clients.transport import build_transport  # noqa: E402
+from sec_edgar_api.config import Settings  # noqa: E402
+
+BODY = b'{"cik": 320193, "filings": {"recent": {"form": ["10-K"]}}}' * 20
+
+
+class StubServer:
+    """Minimal keep-alive HTTP/1.1 server answering every GET with a fixed JSON body."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+        self._second: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        # A second loopback address on the same port gives the client a distinct host.
+        self._second = await asyncio.start_server(self._handle, "127.0.0.2", port)
+        return port
+
+    async def stop(self) -> None:
+        for server in (self._server, self._second):
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                await asyncio.sleep(self.latency)
+                close = b"connection: close" in head.lower()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    + f"content-length: {len(BODY)}\r\n".encode()
+                    + (b"connection: close\r\n" if close else b"")
+                    + b"\r\n"
+                    + BODY
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_load(
+    client: httpx.AsyncClient, urls: list[str], total: int, concurrency: int
+) -> float:
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for index in range(total):
+        queue.put_nowait(urls[index % len(urls)])
+
+    async def worker() -> None:
+        while not queue.empty():
+            url = queue.get_nowait()
+            response = await client.get(url)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+CONFIGURATIONS: dict[str, dict[str, object]] = {
+    "httpx defaults": {},
+    "no keepalive": {"http_max_keepalive_connections": 0, "http_max_connections_per_host": None},
+    "pool 20, per-host 10 (default)": {},
+    "pool 100, no per-host cap": {
+        "http_max_connections": 100,
+        "http_max_keepalive_connections": 100,
+        "http_max_connections_per_host": None,
+    },
+    "pool 10, per-host 5": {
+        "http_max_connections": 10,
+        "http_max_keepalive_connections": 10,
+        "http_max_connections_per_host": 5,
+    },
+}
+
+
+def build_client(name: str, overrides: dict[str, object]) -> httpx.AsyncClient:
+    if name == "httpx defaults":
+        return httpx.AsyncClient()
+    settings = Settings(**overrides)
+    return httpx.AsyncClient(transport=build_transport(settings))
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = StubServer(args.latency)
+    port = await server.start()
+    # Two loopback hosts stand in for www.sec.gov and data.sec.gov.
+    urls = [f"http://127.0.0.1:{port}/submissions", f"http://127.0.0.2:{port}/companyfacts"]
+    print(f"{'configuration':<32} {'req/s':>9} {'connections':>12}")
+    try:
+        for name, overrides in CONFIGURATIONS.items():
+            before = server.connections
+            async with build_client(name, overrides) as client:
+                elapsed = await run_load(client, urls, args.requests, args.concurrency)
+            opened = server.connections - before
+            print(f"{name:<32} {args.requests / elapsed:>9.0f} {opened:>12}")
+    finally:
+        await server.stop()
+
+    if args.h2_url:
+        for http2 in (False, True):
+            settings = Settings(http2=http2, http_max_connections_per_host=None)
+            transport = build_transport(settings)
+            async with httpx.AsyncClient(transport=transport, verify=False) as client:
+                elapsed = await run_load(client, [args.h2_url], args.requests, args.concurrency)
+            label = f"{'HTTP/2' if http2 else 'HTTP/1.1'} -> --h2-url"
+            print(f"{label:<32} {args.requests / elapsed:>9.0f} {'-':>12}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.005, help="server delay per request")
+    parser.add_argument("--h2-url", help="HTTPS URL of an HTTP/2-capable server")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
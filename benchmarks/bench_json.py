@@ -0,0 +1,131 @@
+"""Compare JSON codecs on companyfacts-sized payloads.
+
+Usage::
+
+    python benchmarks/bench_json.py                        # synthetic ~40 MB fixture
+    python benchmarks/bench_json.py --fixture CIK0000320193.json --repeat 5
+
+Each codec runs in a fresh subprocess so its peak RSS is measured in isolation.
+Download a real fixture from https://data.sec.gov/api/xbrl/companyfacts/ (with a
+User-Agent header) for the most representative numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sec_edgar_api import json_codec  # noqa: E402
+
+FORMS = ("10-K", "10-Q", "8-K", "10-K/A")
+
+
+def build_fixture(path: Path, size_mb: float) -> None:
+    """Write a synthetic companyfacts document of roughly ``size_mb`` megabytes."""
+    rng = random.Random(0)
+    entry_bytes = 190
+    entries_per_concept = 400
+    concept_count = max(1, int(size_mb * 1024**2 / (entry_bytes * entries_per_concept)))
+    concepts = {}
+    for index in range(concept_count):
+        entries = []
+        for row in range(entries_per_concept):
+            year = 2000 + row % 25
+            entries.append(
+                {
+                    "start": f"{year}-01-01",
+                    "end": f"{year}-12-31",
+                    "val": rng.randint(-(10**12), 10**12),
+                    "accn": f"0000320193-{year % 100:02d}-{row:06d}",
+                    "fy": year,
+                    "fp": "FY",
+                    "form": FORMS[row % len(FORMS)],
+                    "filed": f"{year + 1}-02-{1 + row % 28:02d}",
+                    "frame": f"CY{year}",
+                }
+            )
+        concepts[f"Concept{index}"] = {
+            "label": f"Concept {index}",
+            "description": "Synthetic concept used for benchmarking.",
+            "units": {"USD": entries},
+        }
+    payload = {"cik": 320193, "entityName": "Benchmark Inc", "facts": {"us-gaap": concepts}}
+    path.write_text(json.dumps(payload))
+
+
+def run_one(codec_name: str, fixture: Path, repeat: int) -> dict[str, float]:
+    codec = json_codec.get_codec(codec_name)
+    body = fixture.read_bytes()
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    decode_times = []
+    encode_times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        payload = codec.loads(body)
+        decode_times.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        codec.dumps(payload)
+        encode_times.append(time.perf_counter() - started)
+        del payload
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    megabytes = len(body) / 1024**2
+    return {
+        "size_mb": megabytes,
+        "decode_mb_s": megabytes / min(decode_times),
+        "encode_mb_s": megabytes / min(encode_times),
+        "peak_rss_delta_mb": (peak_kb - baseline_kb) / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", type=Path, help="companyfacts JSON file to decode")
+    parser.add_argument("--size-mb", type=float, default=40.0, help="synthetic fixture size")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--codec", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.codec:
+        print(json.dumps(run_one(args.codec, args.fixture, args.repeat)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture = args.fixture
+        if fixture is None:
+            fixture = Path(tmp) / "companyfacts.json"
+            build_fixture(fixture, args.size_mb)
+        print(f"{'codec':<8} {'size MB':>8} {'decode MB/s':>12} {'encode MB/s':>12} {'RSS +MB':>8}")
+        for name in json_codec.available_codecs():
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--codec",
+                    name,
+                    "--fixture",
+                    str(fixture),
+                    "--repeat",
+                    str(args.repeat),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{name:<8} {result['size_mb']:>8.1f} {result['decode_mb_s']:>12.1f} "
+                f"{result['encode_mb_s']:>12.1f} {result['peak_rss_delta_mb']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
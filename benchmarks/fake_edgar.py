@@ -0,0 +1,260 @@
+"""In-process fake EDGAR server used by the API benchmarks.
+
+Serves deterministic, realistically sized fixtures on the paths the service calls:
+
+- ``/files/company_tickers.json``: the master ticker list (10,000 companies by default)
+- ``/submissions/CIK##########.json``: 1,000 recent filings per company in the columnar
+  layout (about 4% 10-K), including the columns the parser skips
+- ``/api/xbrl/companyfacts/CIK##########.json``: a large-filer document with every
+  tracked concept plus several hundred untracked ones
+
+Latency (fixed plus uniform jitter) and error injection (503 with ``Retry-After: 0``)
+are configurable. The server runs its own event loop in a background thread, so its work
+does not queue behind the API under test.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sec_edgar_api.config import Settings  # noqa: E402
+from sec_edgar_api.services.financials_service import FinancialsService  # noqa: E402
+
+SUBMISSION_FORMS = ("10-Q", "8-K", "4", "4", "4", "SC 13G/A", "8-K", "10-Q", "S-8", "424B2")
+FACT_FORMS = ("10-K", "10-Q", "10-Q", "10-Q")
+
+_SUBMISSIONS = re.compile(rb"^/submissions/CIK(\d{10})\.json$")
+_COMPANY_FACTS = re.compile(rb"^/api/xbrl/companyfacts/CIK(\d{10})\.json$")
+
+
+@dataclass
+class FixtureSet:
+    """Fixture documents, built once and reused for every company."""
+
+    companies: int = 10_000
+    filings_per_company: int = 1_000
+    untracked_concepts: int = 400
+    entries_per_concept: int = 120
+    tickers: list[str] = field(init=False)
+    tickers_body: bytes = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tickers = [f"T{index:05d}" for index in range(self.companies)]
+        listing = {
+            str(index): {
+                "cik_str": self.cik_for(index),
+                "ticker": ticker,
+                "title": f"Benchmark Company {index}",
+            }
+            for index, ticker in enumerate(self.tickers)
+        }
+        self.tickers_body = json.dumps(listing).encode()
+        self._recent_columns = json.dumps(self._build_recent_columns()).encode()
+        self._facts = json.dumps(self._build_facts()).encode()
+
+    @staticmethod
+    def cik_for(index: int) -> int:
+        return 100_000 + index
+
+    def submissions_body(self, cik: int) -> bytes:
+        index = cik - self.cik_for(0)
+        header = {
+            "cik": str(cik),
+            "name": f"Benchmark Company {index}",
+            "tickers": [self.tickers[index]] if 0 <= index < self.companies else [],
+        }
+        prefix = json.dumps(header).encode()[:-1]
+        return prefix + b', "filings": {"recent": ' + self._recent_columns + b', "files": []}}'
+
+    def company_facts_body(self, cik: int) -> bytes:
+        index = cik - self.cik_for(0)
+        header = json.dumps({"cik": cik, "entityName": f"Benchmark Company {index}"}).encode()
+        return header[:-1] + b', "facts": ' + self._facts + b"}"
+
+    def _build_recent_columns(self) -> dict[str, list[Any]]:
+        rng = random.Random(1)
+        columns: dict[str, list[Any]] = {
+            name: []
+            for name in (
+                "accessionNumber", "filingDate", "reportDate", "acceptanceDateTime", "act",
+                "form", "fileNumber", "filmNumber", "items", "size", "isXBRL",
+                "isInlineXBRL", "primaryDocument", "primaryDocDescription",
+            )
+        }  # fmt: skip
+        filed = date(2024, 12, 31)
+        for row in range(self.filings_per_company):
+            form = "10-K" if row % 25 == 0 else rng.choice(SUBMISSION_FORMS)
+            filed -= timedelta(days=rng.randint(0, 9))
+            columns["accessionNumber"].append(f"0000100000-{filed.year % 100:02d}-{row:06d}")
+            columns["filingDate"].append(filed.isoformat())
+            columns["reportDate"].append(
+                (filed - timedelta(days=60)).isoformat() if form.startswith("10-") else ""
+            )
+            columns["acceptanceDateTime"].append(f"{filed.isoformat()}T16:30:00.000Z")
+            columns["act"].append("34")
+            columns["form"].append(form)
+            columns["fileNumber"].append("001-00000")
+            columns["filmNumber"].append(str(24_000_000 + row))
+            columns["items"].append("2.02,9.01" if form == "8-K" else "")
+            columns["size"].append(rng.randint(5_000, 9_000_000))
+            columns["isXBRL"].append(int(form.startswith("10-")))
+            columns["isInlineXBRL"].append(int(form.startswith("10-")))
+            columns["primaryDocument"].append(f"doc{row}.htm")
+            columns["primaryDocDescription"].append(form)
+        return columns
+
+    def _build_facts(self) -> dict[str, Any]:
+        rng = random.Random(2)
+        names = sorted(FinancialsService.tracked_concepts())
+        names += [f"UntrackedConcept{index:04d}" for index in range(self.untracked_concepts)]
+        us_gaap = {}
+        for name in names:
+            unit = "USD/shares" if "PerShare" in name else "USD"
+            us_gaap[name] = {
+                "label": name,
+                "description": f"Synthetic {name} values.",
+                "units": {unit: self._fact_entries(rng)},
+            }
+        return {"us-gaap": us_gaap}
+
+    def _fact_entries(self, rng: random.Random) -> list[dict[str, Any]]:
+        entries = []
+        for row in range(self.entries_per_concept):
+            year = 2024 - row // 4
+            form = FACT_FORMS[row % len(FACT_FORMS)]
+            quarter = 4 - row % 4
+            start_month = 3 * quarter - 2 if form == "10-Q" else 1
+            entries.append(
+                {
+                    "start": f"{year}-{start_month:02d}-01",
+                    "end": f"{year}-{3 * quarter:02d}-28",
+                    "val": rng.randint(10**6, 10**11),
+                    "accn": f"0000100000-{year % 100:02d}-{row:06d}",
+                    "fy": year,
+                    "fp": "FY" if form == "10-K" else f"Q{quarter}",
+                    "form": form,
+                    "filed": f"{year + 1}-02-{1 + row % 28:02d}",
+                    "frame": f"CY{year}",
+                }
+            )
+        return entries
+
+
+@dataclass
+class ServerStats:
+    requests: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+
+
+class FakeEdgarServer:
+    """Keep-alive HTTP/1.1 server answering the SEC endpoints from a ``FixtureSet``."""
+
+    def __init__(
+        self,
+        fixtures: FixtureSet,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stats = ServerStats()
+        self.port = 0
+        self._rng = random.Random(seed)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def settings(self, **overrides: Any) -> Settings:
+        """Settings pointing every SEC URL at this server."""
+        return Settings(
+            tickers_url=f"{self.base_url}/files/company_tickers.json",
+            submissions_base_url=f"{self.base_url}/submissions/",
+            company_facts_base_url=f"{self.base_url}/api/xbrl/companyfacts/",
+            retry_backoff_base=0.001,
+            **overrides,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, "127.0.0.1", 0), self._loop
+        )
+        self._server = future.result()
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def stop(self) -> None:
+        async def close() -> None:
+            if self._server is not None:
+                self._server.close()
+                await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self) -> FakeEdgarServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _route(self, path: bytes) -> tuple[int, bytes]:
+        if path == b"/files/company_tickers.json":
+            return 200, self.fixtures.tickers_body
+        match = _SUBMISSIONS.match(path)
+        if match:
+            return 200, self.fixtures.submissions_body(int(match.group(1)))
+        match = _COMPANY_FACTS.match(path)
+        if match:
+            return 200, self.fixtures.company_facts_body(int(match.group(1)))
+        return 404, b'{"error": "not found"}'
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ", 2)[1].split(b"?", 1)[0]
+                delay = self.latency + self._rng.uniform(0, self.jitter)
+                if delay:
+                    await asyncio.sleep(delay)
+                self.stats.requests += 1
+                if self._rng.random() < self.error_rate:
+                    self.stats.errors += 1
+                    status, body, extra = 503, b"", b"retry-after: 0\r\n"
+                else:
+                    (status, body), extra = self._route(path), b""
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\ncontent-type: application/json\r\n".encode()
+                    + f"content-length: {len(body)}\r\n".encode()
+                    + extra
+                    + b"\r\n"
+                    + body
+                )
+                self.stats.bytes_sent += len(body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
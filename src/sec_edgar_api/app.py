@@ -4,34 +4,71 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse, Response
 
-from .dependencies import close_http_client
+from .clients.rate_limiter import TokenBucketRateLimiter
+from .clients.retry import CircuitOpenError
+from .config import Settings, get_settings
+from .dependencies import (
+    close_http_client,
+    get_rate_limiter,
+    load_bulk_archives,
+    resume_scan_jobs,
+)
+from .metrics import CONTENT_TYPE, RATE_LIMITER_QUEUE_DEPTH, REGISTRY, RouteMetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .responses import FastJSONResponse
 from .routes import filings, financials
+from .timing import ServerTimingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage startup/shutdown events."""
+    await load_bulk_archives()
+    await resume_scan_jobs(app)
     yield
     await close_http_client()
 
 
-def create_app() -> FastAPI:
+def create_app(settings: Settings | None = None) -> FastAPI:
     """Application factory."""
+    settings = settings or get_settings()
     application = FastAPI(
         title="SEC EDGAR 10-K Aggregator",
         description="Aggregates 10-K filings for publicly traded companies via the SEC EDGAR API.",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     application.include_router(filings.router)
     application.include_router(financials.router)
+    application.add_middleware(RouteMetricsMiddleware)
+    if settings.server_timing_enabled:
+        application.add_middleware(ServerTimingMiddleware)
+    if settings.profiling_enabled:
+        application.add_middleware(ProfilingMiddleware, interval=settings.profiling_interval)
+
+    @application.exception_handler(CircuitOpenError)
+    async def sec_unavailable(request: Request, exc: CircuitOpenError) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+        )
 
     @application.get("/health")
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @application.get("/metrics", include_in_schema=False)
+    async def metrics(
+        rate_limiter: TokenBucketRateLimiter = Depends(get_rate_limiter),
+    ) -> Response:
+        RATE_LIMITER_QUEUE_DEPTH.set(rate_limiter.queue_depth)
+        return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
     return application
 
 
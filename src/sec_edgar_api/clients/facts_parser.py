@@ -0,0 +1,82 @@
+"""Selective decoding of companyfacts documents."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Collection, Mapping
+from typing import Any
+
+from .. import json_codec
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # pragma: no cover - exercised when the streaming extra is absent
+    ijson = None
+
+_START_EVENTS = frozenset({"start_map", "start_array"})
+_END_EVENTS = frozenset({"end_map", "end_array"})
+_TOP_LEVEL_SCALARS = frozenset({"cik", "entityName"})
+
+
+def select_company_facts(body: bytes, concepts: Collection[str]) -> dict[str, Any]:
+    """Decode only the ``cik``, ``entityName`` and listed concepts of a companyfacts body.
+
+    With ijson installed the document is walked as a stream of parser events and only
+    the wanted concepts are built into Python objects; otherwise it is fully decoded and
+    filtered afterwards.
+    """
+    if ijson is None:
+        return filter_company_facts(json_codec.loads(body), concepts)
+    return _select_streaming(body, concepts)
+
+
+def filter_company_facts(payload: Mapping[str, Any], concepts: Collection[str]) -> dict[str, Any]:
+    """Drop every concept not listed in ``concepts`` from a decoded companyfacts payload."""
+    facts = payload.get("facts") or {}
+    return {
+        "cik": payload.get("cik"),
+        "entityName": payload.get("entityName"),
+        "facts": {
+            taxonomy: {name: body for name, body in entries.items() if name in concepts}
+            for taxonomy, entries in facts.items()
+        },
+    }
+
+
+def _select_streaming(body: bytes, concepts: Collection[str]) -> dict[str, Any]:
+    payload: dict[str, Any] = {"cik": None, "entityName": None, "facts": {}}
+    # Keys of the containers enclosing the parser position; the root map contributes None.
+    path: list[str | None] = []
+    key: str | None = None
+    builder: ObjectBuilder | None = None
+    nesting = 0
+    for event, value in ijson.basic_parse(io.BytesIO(body), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in _START_EVENTS:
+                nesting += 1
+            elif event in _END_EVENTS:
+                nesting -= 1
+                if nesting == 0:
+                    payload["facts"][path[2]][key] = builder.value
+                    builder = None
+            continue
+        if event == "map_key":
+            key = value
+        elif event in _START_EVENTS:
+            in_taxonomy = len(path) == 3 and path[1] == "facts"
+            if in_taxonomy and event == "start_map" and key in concepts:
+                builder = ObjectBuilder()
+                builder.event(event, value)
+                nesting = 1
+                continue
+            path.append(key)
+            if len(path) == 3 and path[1] == "facts" and key is not None:
+                payload["facts"][key] = {}
+            key = None
+        elif event in _END_EVENTS:
+            path.pop()
+        elif len(path) == 1 and key in _TOP_LEVEL_SCALARS:
+            payload[key] = value
+    return payload
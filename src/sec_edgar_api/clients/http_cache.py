@@ -0,0 +1,172 @@
+"""Persistent on-disk cache for SEC JSON responses."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from .validators import ResponseValidators
+
+_BODY_SUFFIX = ".json.gz"
+_META_SUFFIX = ".meta.json"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Response body restored from the cache together with its validators."""
+
+    body: bytes
+    validators: ResponseValidators
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+
+class ResponseCache(Protocol):
+    """Blocking response-cache interface used by ``SECEdgarClient``."""
+
+    def get(self, url: str) -> CachedResponse | None: ...
+
+    def put(self, url: str, body: bytes, validators: ResponseValidators) -> None: ...
+
+    def mark_revalidated(self, url: str, validators: ResponseValidators) -> None: ...
+
+
+class DiskResponseCache:
+    """Content-addressed, size-bounded LRU cache of compressed response bodies.
+
+    Entries live under ``directory`` as a gzip body plus a JSON sidecar holding the
+    ETag/Last-Modified validators, named after the SHA-256 of the request URL. File
+    modification times record recency, so the LRU order survives restarts. Methods do
+    blocking file I/O and are meant to be called through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Return the cached response for ``url`` and mark it as recently used."""
+        key = self._key(url)
+        body_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            stored_at = float(meta["stored_at"])
+            body = gzip.decompress(body_path.read_bytes())
+        except (OSError, ValueError, EOFError, KeyError, TypeError):
+            self._discard(key)
+            return None
+        self._mark_used(key, body_path)
+        return CachedResponse(
+            body=body,
+            validators=ResponseValidators(
+                etag=meta.get("etag"), last_modified=meta.get("last_modified")
+            ),
+            stored_at=stored_at,
+        )
+
+    def put(self, url: str, body: bytes, validators: ResponseValidators) -> None:
+        """Store ``body`` for ``url`` and evict least recently used entries if needed."""
+        key = self._key(url)
+        body_path, meta_path = self._paths(key)
+        body_path.parent.mkdir(exist_ok=True)
+        compressed = gzip.compress(body, compresslevel=6)
+        self._atomic_write(body_path, compressed)
+        self._write_meta(meta_path, validators)
+        size = len(compressed) + meta_path.stat().st_size
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+        self._evict()
+
+    def mark_revalidated(self, url: str, validators: ResponseValidators) -> None:
+        """Restart the TTL of an entry after the SEC answered ``304 Not Modified``."""
+        key = self._key(url)
+        body_path, meta_path = self._paths(key)
+        if key in self._entries:
+            self._write_meta(meta_path, validators)
+            self._mark_used(key, body_path)
+
+    def _write_meta(self, meta_path: Path, validators: ResponseValidators) -> None:
+        meta = {
+            "etag": validators.etag,
+            "last_modified": validators.last_modified,
+            "stored_at": time.time(),
+        }
+        self._atomic_write(meta_path, json.dumps(meta).encode())
+
+    def _mark_used(self, key: str, body_path: Path) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        while True:
+            with self._lock:
+                if self._total_bytes <= self._max_bytes or not self._entries:
+                    return
+                key = next(iter(self._entries))
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+
+    def _load_index(self) -> None:
+        found: list[tuple[float, str, int]] = []
+        for body_path in self._directory.glob(f"*/*{_BODY_SUFFIX}"):
+            key = body_path.name.removesuffix(_BODY_SUFFIX)
+            meta_path = body_path.with_name(f"{key}{_META_SUFFIX}")
+            try:
+                stat = body_path.stat()
+                size = stat.st_size + meta_path.stat().st_size
+            except OSError:
+                continue
+            found.append((stat.st_mtime, key, size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        shard = self._directory / key[:2]
+        return shard / f"{key}{_BODY_SUFFIX}", shard / f"{key}{_META_SUFFIX}"
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,90 @@
+"""Request-rate limiting for outbound SEC calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass
+class RateLimiterStats:
+    """Queue-wait metrics collected by a rate limiter."""
+
+    acquisitions: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        if not self.acquisitions:
+            return 0.0
+        return self.total_wait / self.acquisitions
+
+    def record(self, waited: float) -> None:
+        self.acquisitions += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+
+class TokenBucketRateLimiter:
+    """Token bucket that admits callers in arrival order.
+
+    Tokens accrue at ``rate`` per second up to ``burst``. Waiters queue on an
+    ``asyncio.Lock``, whose FIFO wake-up order keeps admission fair: a caller that
+    arrives later can never take a token ahead of one already waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self.stats = RateLimiterStats()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token."""
+        return self._waiting
+
+    async def acquire(self) -> float:
+        """Wait for a token and return the seconds spent queueing."""
+        started = self._clock()
+        self._waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self._waiting -= 1
+        waited = self._clock() - started
+        self.stats.record(waited)
+        return waited
+
+    async def __aenter__(self) -> TokenBucketRateLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
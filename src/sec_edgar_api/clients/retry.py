@@ -0,0 +1,103 @@
+"""Retry and circuit-breaker policies for outbound SEC calls."""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from ..config import Settings
+
+
+class CircuitOpenError(Exception):
+    """Raised when the SEC circuit breaker is open and a request cannot wait it out."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"SEC EDGAR is unavailable; retry in {retry_after:.1f}s.")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Jittered exponential backoff bounded by attempt count and a per-request time budget."""
+
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    budget: float = 60.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RetryPolicy:
+        return cls(
+            max_attempts=settings.retry_max_attempts,
+            backoff_base=settings.retry_backoff_base,
+            backoff_max=settings.retry_backoff_max,
+            budget=settings.retry_budget,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter delay for the given zero-based retry attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Stops outbound traffic after consecutive failures until ``reset_timeout`` elapses.
+
+    Once the timeout passes the breaker is half-open: traffic flows again, the first
+    success closes it and the first failure re-opens it for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "open" if self.retry_after() > 0 else "half-open"
+
+    def retry_after(self) -> float:
+        """Seconds until requests are admitted again (zero when not open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._opened_at is not None or self._consecutive_failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
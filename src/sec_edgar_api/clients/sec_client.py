@@ -2,28 +2,244 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from datetime import date, datetime
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from .. import json_codec
 from ..config import Settings
-from ..models.filings import CompanySummary, Filing
+from ..metrics import (
+    CACHE_LOOKUPS,
+    RATE_LIMITER_WAIT_SECONDS,
+    SEC_DECODE_SECONDS,
+    SEC_REQUEST_SECONDS,
+    SEC_REQUESTS_IN_FLIGHT,
+    SEC_RESPONSE_BYTES,
+)
+from ..models.filings import CompanySummary
+from ..timing import phase
+from .facts_parser import select_company_facts
+from .http_cache import ResponseCache
+from .rate_limiter import TokenBucketRateLimiter
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+from .submissions import FilingRecord, SubmissionsParser
+from .validators import ResponseValidators
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TickerListing:
+    """Parsed SEC master ticker list together with its cache validators."""
+
+    companies: list[CompanySummary]
+    validators: ResponseValidators
 
 
 class SECEdgarClient:
     """HTTP client that wraps SEC endpoints."""
 
-    def __init__(self, http_client: httpx.AsyncClient, settings: Settings) -> None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        settings: Settings,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         self._http = http_client
         self._settings = settings
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            settings.requests_per_second, settings.rate_limit_burst
+        )
+        self._retry_policy = RetryPolicy.from_settings(settings)
+        self._circuit_breaker = circuit_breaker or CircuitBreaker(
+            settings.circuit_failure_threshold, settings.circuit_reset_timeout
+        )
+        self._response_cache = response_cache
+        self._submissions_parser = SubmissionsParser(str(settings.archives_base_url))
+
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """Limiter gating every outbound request issued by this client."""
+        return self._rate_limiter
 
     async def fetch_company_tickers(self) -> list[CompanySummary]:
         """Download the SEC master ticker list."""
-        response = await self._http.get(str(self._settings.tickers_url))
+        response = await self._get(str(self._settings.tickers_url), endpoint="tickers")
         response.raise_for_status()
-        payload: Mapping[str, Any] = response.json()
+        return self._parse_company_tickers(_decode(response.content, "tickers"))
+
+    async def fetch_ticker_listing(
+        self, validators: ResponseValidators | None = None
+    ) -> TickerListing | None:
+        """Download the SEC master ticker list, revalidating against ``validators``.
+
+        Returns ``None`` when the SEC reports the list unchanged since ``validators``.
+        """
+        headers = validators.as_request_headers() if validators else {}
+        response = await self._get(
+            str(self._settings.tickers_url), headers=headers, endpoint="tickers"
+        )
+        if validators and response.status_code == httpx.codes.NOT_MODIFIED:
+            return None
+        response.raise_for_status()
+        payload: Mapping[str, Any] = _decode(response.content, "tickers")
+        return TickerListing(
+            companies=self._parse_company_tickers(payload),
+            validators=ResponseValidators.from_response(response),
+        )
+
+    async def fetch_recent_filings(
+        self,
+        cik: str,
+        *,
+        form_predicate: Callable[[str], bool] | None = None,
+        limit: int | None = None,
+        revalidate: bool = False,
+    ) -> list[FilingRecord]:
+        """Retrieve a single company's recent filings, optionally only matching forms.
+
+        ``revalidate`` bypasses the cache TTL so a known-changed document is re-checked.
+        """
+        payload = await self.fetch_submissions(cik, revalidate=revalidate)
+        with phase("parse"):
+            return self._submissions_parser.parse_recent(
+                payload, form_predicate=form_predicate, limit=limit
+            )
+
+    async def fetch_submissions(self, cik: str, *, revalidate: bool = False) -> Mapping[str, Any]:
+        """Retrieve a company's submissions document (recent filings plus shard list)."""
+        submissions_url = f"{self._settings.submissions_base_url}CIK{cik}.json"
+        return await self._get_cached_json(
+            submissions_url, endpoint="submissions", revalidate=revalidate
+        )
+
+    async def fetch_submissions_shard(self, name: str) -> Mapping[str, Any]:
+        """Retrieve one older-filings shard listed in a submissions document's ``files``."""
+        return await self._get_cached_json(
+            f"{self._settings.submissions_base_url}{name}", endpoint="submissions_shard"
+        )
+
+    async def fetch_company_facts(
+        self, cik: str, *, concepts: Collection[str] | None = None
+    ) -> Mapping[str, Any]:
+        """Retrieve the company facts payload for a single company.
+
+        When ``concepts`` is given only those concepts are decoded, off the event loop;
+        everything else in the document is skipped without building Python objects.
+        """
+        facts_url = f"{self._settings.company_facts_base_url}CIK{cik}.json"
+        body = await self._get_cached_body(facts_url, endpoint="companyfacts")
+        if concepts is None:
+            return _decode(body, "companyfacts")
+        with phase("decode"), SEC_DECODE_SECONDS.time(endpoint="companyfacts"):
+            return await asyncio.to_thread(select_company_facts, body, concepts)
+
+    async def _get_cached_json(self, url: str, *, endpoint: str, revalidate: bool = False) -> Any:
+        body = await self._get_cached_body(url, endpoint=endpoint, revalidate=revalidate)
+        return _decode(body, endpoint)
+
+    async def _get_cached_body(self, url: str, *, endpoint: str, revalidate: bool = False) -> bytes:
+        """GET a document through the disk cache, revalidating stale entries."""
+        cache = self._response_cache
+        if cache is None:
+            response = await self._get(url, endpoint=endpoint)
+            response.raise_for_status()
+            return response.content
+
+        cached = await asyncio.to_thread(cache.get, url)
+        if cached is not None and not revalidate and cached.is_fresh(self._settings.http_cache_ttl):
+            CACHE_LOOKUPS.inc(cache="http_disk", result="hit")
+            return cached.body
+
+        headers = cached.validators.as_request_headers() if cached is not None else None
+        response = await self._get(url, headers=headers, endpoint=endpoint)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            CACHE_LOOKUPS.inc(cache="http_disk", result="revalidated")
+            await asyncio.to_thread(cache.mark_revalidated, url, cached.validators)
+            return cached.body
+        CACHE_LOOKUPS.inc(cache="http_disk", result="miss")
+        response.raise_for_status()
+        validators = ResponseValidators.from_response(response)
+        await asyncio.to_thread(cache.put, url, response.content, validators)
+        return response.content
+
+    async def _get(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        *,
+        endpoint: str = "other",
+    ) -> httpx.Response:
+        """Issue a throttled GET, retrying transient failures within the retry budget.
+
+        Retryable responses that exhaust the policy are returned as-is so callers surface
+        them through ``raise_for_status``. ``endpoint`` labels the request in metrics.
+        """
+        policy = self._retry_policy
+        budget_left = policy.budget
+        attempt = 0
+        while True:
+            breaker_wait = self._circuit_breaker.retry_after()
+            if breaker_wait:
+                if breaker_wait > budget_left:
+                    raise CircuitOpenError(breaker_wait)
+                await asyncio.sleep(breaker_wait)
+                budget_left -= breaker_wait
+
+            with phase("ratelimit"):
+                RATE_LIMITER_WAIT_SECONDS.observe(await self._rate_limiter.acquire())
+            try:
+                response = await self._send(url, headers, endpoint)
+            except httpx.TransportError:
+                self._circuit_breaker.record_failure()
+                delay = policy.backoff(attempt)
+                if attempt + 1 >= policy.max_attempts or delay > budget_left:
+                    raise
+                logger.warning("Transport error fetching %s; retrying in %.2fs", url, delay)
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    self._circuit_breaker.record_success()
+                    return response
+                self._circuit_breaker.record_failure()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = retry_after if retry_after is not None else policy.backoff(attempt)
+                if attempt + 1 >= policy.max_attempts or delay > budget_left:
+                    return response
+                await response.aclose()
+                logger.warning(
+                    "SEC returned %s for %s; retrying in %.2fs", response.status_code, url, delay
+                )
+            await asyncio.sleep(delay)
+            budget_left -= delay
+            attempt += 1
+
+    async def _send(
+        self, url: str, headers: Mapping[str, str] | None, endpoint: str
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        status = "error"
+        try:
+            with phase("download"), SEC_REQUESTS_IN_FLIGHT.track():
+                response = await self._http.get(url, headers=headers)
+            status = str(response.status_code)
+            # Wire bytes (still compressed); responses built in memory only know their content.
+            received = response.num_bytes_downloaded or len(response.content)
+            SEC_RESPONSE_BYTES.inc(amount=received, endpoint=endpoint)
+            return response
+        finally:
+            SEC_REQUEST_SECONDS.observe(
+                time.perf_counter() - started, endpoint=endpoint, status=status
+            )
+
+    @staticmethod
+    def _parse_company_tickers(payload: Mapping[str, Any]) -> list[CompanySummary]:
         summaries: list[CompanySummary] = []
         for item in payload.values():
             cik = str(item["cik_str"]).zfill(10)
@@ -37,71 +253,7 @@ class SECEdgarClient:
         # The SEC file ships as numeric keys, already ordered by CIK.
         return summaries
 
-    async def fetch_recent_filings(self, cik: str) -> list[Filing]:
-        """Retrieve the recent filings for a single company."""
-        submissions_url = f"{self._settings.submissions_base_url}CIK{cik}.json"
-        response = await self._http.get(submissions_url)
-        response.raise_for_status()
-        payload = response.json()
-        return self._parse_recent_filings(payload)
 
-    async def fetch_company_facts(self, cik: str) -> Mapping[str, Any]:
-        """Retrieve the company facts payload for a single company."""
-        facts_url = f"{self._settings.company_facts_base_url}CIK{cik}.json"
-        response = await self._http.get(facts_url)
-        response.raise_for_status()
-        return response.json()
-
-    def _parse_recent_filings(self, payload: Mapping[str, Any]) -> list[Filing]:
-        filings: list[Filing] = []
-        recent = payload.get("filings", {}).get("recent", {})
-        forms = recent.get("form", [])
-        accession_numbers = recent.get("accessionNumber", [])
-        filing_dates = recent.get("filingDate", [])
-        report_periods = recent.get("reportDate", [])
-        primary_docs = recent.get("primaryDocument", [])
-        company_name = payload.get("name")
-        ticker = (payload.get("tickers") or [""])[0]
-        cik = str(payload.get("cik", "")).zfill(10)
-
-        record_count = min(
-            len(forms),
-            len(accession_numbers),
-            len(filing_dates),
-        )
-        for idx in range(record_count):
-            form_type = forms[idx]
-            filings.append(
-                Filing(
-                    cik=cik,
-                    ticker=ticker,
-                    company_name=company_name,
-                    form_type=form_type,
-                    filing_date=self._safe_parse_date(filing_dates, idx),
-                    report_period=self._safe_parse_date(report_periods, idx),
-                    accession_number=accession_numbers[idx],
-                    primary_document_url=self._build_primary_document_url(
-                        cik=cik,
-                        accession=accession_numbers[idx],
-                        document=primary_docs[idx] if idx < len(primary_docs) else None,
-                    ),
-                )
-            )
-        return filings
-
-    def _build_primary_document_url(
-        self, cik: str, accession: str, document: str | None
-    ) -> str | None:
-        if not document:
-            return None
-        sanitized_cik = cik.lstrip("0")
-        accession_fragment = accession.replace("-", "")
-        return (
-            f"{self._settings.archives_base_url}/{sanitized_cik}/{accession_fragment}/{document}"
-        )
-
-    @staticmethod
-    def _safe_parse_date(values: list[str], index: int) -> date | None:
-        if index >= len(values) or not values[index]:
-            return None
-        return datetime.strptime(values[index], "%Y-%m-%d").date()
+def _decode(body: bytes, endpoint: str) -> Any:
+    with phase("decode"), SEC_DECODE_SECONDS.time(endpoint=endpoint):
+        return json_codec.loads(body)
@@ -0,0 +1,79 @@
+"""SEC rate budget shared by every worker process on a host."""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import os
+import struct
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from .rate_limiter import TokenBucketRateLimiter
+
+_STATE = struct.Struct("<d")
+# A schedule further ahead than this can only come from a wall-clock jump backwards.
+_MAX_SCHEDULE_AHEAD = 60.0
+
+
+class FileLockRateLimiter(TokenBucketRateLimiter):
+    """Token bucket whose state lives in a file locked with ``flock``.
+
+    The file holds the time the bucket next runs dry (GCRA's theoretical arrival time).
+    A caller takes the lock just long enough to reserve the next slot, then sleeps
+    without holding it, so one ``rate``/``burst`` budget is split among every process
+    that points at the same file. Within a process callers still queue in arrival
+    order, leaving at most one reservation per process outstanding.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        rate: float,
+        burst: int | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(rate, burst, clock=clock)
+        self._path = path
+        self._fd: int | None = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def acquire(self) -> float:
+        """Wait for a slot in the shared budget and return the seconds spent queueing."""
+        started = self._clock()
+        self._waiting += 1
+        try:
+            async with self._lock:
+                delay = await asyncio.to_thread(self._reserve)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            self._waiting -= 1
+        waited = self._clock() - started
+        self.stats.record(waited)
+        return waited
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _reserve(self) -> float:
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        interval = 1 / self._rate
+        tolerance = (self._capacity - 1) * interval
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            raw = os.pread(self._fd, _STATE.size, 0)
+            now = self._clock()
+            empty_at = _STATE.unpack(raw)[0] if len(raw) == _STATE.size else now
+            if empty_at - now > _MAX_SCHEDULE_AHEAD:
+                empty_at = now
+            start = max(now, empty_at - tolerance)
+            os.pwrite(self._fd, _STATE.pack(max(empty_at, now) + interval), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return start - now
@@ -0,0 +1,149 @@
+"""SQLite-backed response cache shared by every worker process on a host."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .http_cache import CachedResponse
+from .validators import ResponseValidators
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at);
+"""
+
+
+class SQLiteResponseCache:
+    """Size-bounded LRU of compressed response bodies in one SQLite database.
+
+    Drop-in replacement for ``DiskResponseCache`` when several workers serve the API:
+    WAL mode lets them read concurrently while writes serialize in SQLite, and the size
+    budget and LRU order are kept in the database rather than in each process. Methods
+    block and are meant to be called through ``asyncio.to_thread``; each thread gets its
+    own connection.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int, busy_timeout: float = 30.0) -> None:
+        self._path = path
+        self._max_bytes = max_bytes
+        self._busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+    @property
+    def total_bytes(self) -> int:
+        row = self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+        return int(row.fetchone()[0])
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Return the cached response for ``url`` and mark it as recently used."""
+        key = self._key(url)
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, stored_at = row
+        try:
+            body = gzip.decompress(body)
+        except (OSError, EOFError):
+            with connection:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        with connection:
+            connection.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(
+            body=body,
+            validators=ResponseValidators(etag=etag, last_modified=last_modified),
+            stored_at=stored_at,
+        )
+
+    def put(self, url: str, body: bytes, validators: ResponseValidators) -> None:
+        """Store ``body`` for ``url`` and evict least recently used entries if needed."""
+        compressed = gzip.compress(body, compresslevel=6)
+        now = time.time()
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._key(url),
+                    compressed,
+                    validators.etag,
+                    validators.last_modified,
+                    now,
+                    now,
+                    len(compressed),
+                ),
+            )
+            self._evict(connection)
+
+    def mark_revalidated(self, url: str, validators: ResponseValidators) -> None:
+        """Restart the TTL of an entry after the SEC answered ``304 Not Modified``."""
+        now = time.time()
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "UPDATE responses SET etag = ?, last_modified = ?, stored_at = ?, used_at = ? "
+                "WHERE key = ?",
+                (validators.etag, validators.last_modified, now, now, self._key(url)),
+            )
+
+    def close(self) -> None:
+        """Close every thread's connection; later calls open fresh ones."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        # Walk entries from least recently used and drop them until the rest fit.
+        connection.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY used_at DESC, key) AS kept
+                    FROM responses
+                ) WHERE kept > ?
+            )
+            """,
+            (self._max_bytes,),
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Each connection is only used by the thread that opened it, but close() may
+            # run on another one.
+            connection = sqlite3.connect(
+                self._path, timeout=self._busy_timeout, check_same_thread=False
+            )
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connections_lock:
+                self._connections.append(connection)
+                self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
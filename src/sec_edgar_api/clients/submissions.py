@@ -0,0 +1,158 @@
+"""Parsing helpers for SEC submissions payloads."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, NamedTuple
+
+from ..models.filings import Filing
+
+
+@dataclass(frozen=True, slots=True)
+class FilingRecord:
+    """Lightweight filing row used while parsing, filtering and sorting.
+
+    Dates stay ISO strings (which sort chronologically) and the document URL is not
+    validated; ``to_filings`` builds the pydantic ``Filing`` for rows that are returned.
+    """
+
+    cik: str
+    ticker: str
+    company_name: str
+    form_type: str
+    filing_date: str | None
+    report_period: str | None
+    accession_number: str
+    primary_document_url: str | None
+
+
+def is_10k_form(form_type: str) -> bool:
+    """Match 10-K and its variants (10-K/A, 10-K405, 10-KT, ...)."""
+    return form_type.startswith("10-K")
+
+
+def filing_date_key(record: FilingRecord) -> str:
+    """Sort key ordering records by filing date, with undated records oldest."""
+    return record.filing_date or ""
+
+
+def to_filings(records: Iterable[FilingRecord | Filing]) -> list[Filing]:
+    """Convert records (or already-built filings) into API models."""
+    return [Filing.model_validate(record, from_attributes=True) for record in records]
+
+
+class CompanyIdentity(NamedTuple):
+    """Company fields a submissions document carries once rather than per row."""
+
+    cik: str
+    ticker: str
+    company_name: str
+
+
+class SubmissionsShard(NamedTuple):
+    """An older-filings document listed under ``filings.files``."""
+
+    name: str
+    filing_from: str | None
+
+
+class SubmissionsParser:
+    """Turns the columnar ``filings`` arrays of a submissions document into filings."""
+
+    def __init__(self, archives_base_url: str) -> None:
+        self._archives_base_url = archives_base_url
+
+    @staticmethod
+    def identity(payload: Mapping[str, Any]) -> CompanyIdentity:
+        return CompanyIdentity(
+            cik=str(payload.get("cik", "")).zfill(10),
+            ticker=(payload.get("tickers") or [""])[0],
+            company_name=payload.get("name") or "",
+        )
+
+    @staticmethod
+    def shards(payload: Mapping[str, Any]) -> list[SubmissionsShard]:
+        """Return the older-filings shard documents listed in ``filings.files``, newest first."""
+        files = payload.get("filings", {}).get("files") or []
+        return [
+            SubmissionsShard(name=item["name"], filing_from=item.get("filingFrom") or None)
+            for item in files
+            if item.get("name")
+        ]
+
+    def parse_recent(
+        self,
+        payload: Mapping[str, Any],
+        *,
+        form_predicate: Callable[[str], bool] | None = None,
+        limit: int | None = None,
+    ) -> list[FilingRecord]:
+        """Build records for rows whose form matches ``form_predicate``, newest first.
+
+        The ``form`` column is scanned on its own and records are built only for matching
+        rows, stopping once ``limit`` of them have been collected.
+        """
+        if limit is not None and limit <= 0:
+            return []
+        rows = self.iter_rows(
+            payload.get("filings", {}).get("recent", {}),
+            self.identity(payload),
+            form_predicate=form_predicate,
+        )
+        return list(islice(rows, limit))
+
+    def iter_rows(
+        self,
+        columns: Mapping[str, Any],
+        identity: CompanyIdentity,
+        *,
+        form_predicate: Callable[[str], bool] | None = None,
+    ) -> Iterator[FilingRecord]:
+        """Lazily yield records for matching rows of a recent block or shard."""
+        forms = columns.get("form", [])
+        accession_numbers = columns.get("accessionNumber", [])
+        filing_dates = columns.get("filingDate", [])
+        report_periods = columns.get("reportDate", [])
+        primary_docs = columns.get("primaryDocument", [])
+        cik = identity.cik
+
+        record_count = min(
+            len(forms),
+            len(accession_numbers),
+            len(filing_dates),
+        )
+        for idx in range(record_count):
+            form_type = forms[idx]
+            if form_predicate is not None and not form_predicate(form_type):
+                continue
+            yield FilingRecord(
+                cik=cik,
+                ticker=identity.ticker,
+                company_name=identity.company_name,
+                form_type=form_type,
+                filing_date=self._optional_value(filing_dates, idx),
+                report_period=self._optional_value(report_periods, idx),
+                accession_number=accession_numbers[idx],
+                primary_document_url=self._build_primary_document_url(
+                    cik=cik,
+                    accession=accession_numbers[idx],
+                    document=primary_docs[idx] if idx < len(primary_docs) else None,
+                ),
+            )
+
+    def _build_primary_document_url(
+        self, cik: str, accession: str, document: str | None
+    ) -> str | None:
+        if not document:
+            return None
+        sanitized_cik = cik.lstrip("0")
+        accession_fragment = accession.replace("-", "")
+        return f"{self._archives_base_url}/{sanitized_cik}/{accession_fragment}/{document}"
+
+    @staticmethod
+    def _optional_value(values: list[str], index: int) -> str | None:
+        if index >= len(values) or not values[index]:
+            return None
+        return values[index]
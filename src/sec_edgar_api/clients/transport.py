@@ -0,0 +1,93 @@
+"""Connection pool configuration for the shared SEC HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from importlib.util import find_spec
+from typing import cast
+
+import httpx
+
+from ..config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Caps concurrent in-flight requests per host on top of the pool-wide limits.
+
+    httpx only bounds connections for the pool as a whole; the SEC traffic is split
+    between www.sec.gov and data.sec.gov, so one host's backlog could otherwise take
+    every connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: dict[tuple[bytes, bytes, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = request.url
+        key = (url.raw_scheme, url.raw_host, url.port)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self._max_per_host)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        # The slot is held until the body stream closes so the cap reflects open streams,
+        # without buffering the body here.
+        stream = cast(httpx.AsyncByteStream, response.stream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_SlotReleasingStream(stream, semaphore),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its per-host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._semaphore: asyncio.Semaphore | None = semaphore
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+                self._semaphore = None
+
+
+def build_transport(settings: Settings) -> httpx.AsyncBaseTransport:
+    """Build the pooled transport described by the ``http_*`` settings."""
+    http2 = settings.http2
+    if http2 and find_spec("h2") is None:
+        logger.warning("SEC_API_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+        http2 = False
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+    )
+    if settings.http_max_connections_per_host is not None:
+        transport = PerHostLimitTransport(transport, settings.http_max_connections_per_host)
+    return transport
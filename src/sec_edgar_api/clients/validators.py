@@ -0,0 +1,34 @@
+"""HTTP cache validator helpers shared by SEC client components."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class ResponseValidators:
+    """ETag/Last-Modified pair used for conditional revalidation."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> ResponseValidators:
+        return cls(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def as_request_headers(self) -> dict[str, str]:
+        """Return the conditional request headers matching these validators."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
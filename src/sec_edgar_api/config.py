@@ -1,6 +1,7 @@
 """Application configuration and settings management."""
 
 from functools import lru_cache
+from pathlib import Path
 
 from pydantic import Field, HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -36,6 +37,155 @@ class Settings(BaseSettings):
         le=10,
         description="Number of concurrent SEC API requests issued when aggregating filings.",
     )
+    http_max_connections: int = Field(
+        20,
+        ge=1,
+        description="Upper bound on open connections in the shared SEC HTTP pool.",
+    )
+    http_max_keepalive_connections: int = Field(
+        20,
+        ge=0,
+        description="Idle connections kept alive for reuse in the shared SEC HTTP pool.",
+    )
+    http_keepalive_expiry: float = Field(
+        30.0,
+        ge=0,
+        description="Seconds an idle pooled connection is kept before it is closed.",
+    )
+    http_max_connections_per_host: int | None = Field(
+        10,
+        ge=1,
+        description="Concurrent requests allowed per SEC host; unset leaves only the pool cap.",
+    )
+    http2: bool = Field(
+        False,
+        description="Multiplex SEC requests over HTTP/2 (requires the http2 extra).",
+    )
+    requests_per_second: float = Field(
+        10.0,
+        gt=0,
+        le=10,
+        description="Sustained outbound SEC requests per second; the SEC allows at most 10.",
+    )
+    rate_limit_burst: int = Field(
+        10,
+        ge=1,
+        description="Number of SEC requests that may be issued back-to-back before throttling.",
+    )
+    retry_max_attempts: int = Field(
+        4,
+        ge=1,
+        description="Maximum attempts per SEC request, including the first one.",
+    )
+    retry_backoff_base: float = Field(
+        0.5,
+        gt=0,
+        description="Initial backoff ceiling in seconds; doubles with every retry.",
+    )
+    retry_backoff_max: float = Field(
+        30.0,
+        gt=0,
+        description="Upper bound in seconds for a single backoff delay.",
+    )
+    retry_budget: float = Field(
+        60.0,
+        ge=0,
+        description="Total seconds a single SEC request may spend waiting between retries.",
+    )
+    circuit_failure_threshold: int = Field(
+        5,
+        ge=1,
+        description="Consecutive SEC failures that open the circuit breaker.",
+    )
+    circuit_reset_timeout: float = Field(
+        30.0,
+        gt=0,
+        description="Seconds the circuit breaker stays open before admitting traffic again.",
+    )
+    http_cache_dir: Path | None = Field(
+        None,
+        description="Directory for the on-disk submissions/companyfacts cache; unset disables it.",
+    )
+    http_cache_max_bytes: int = Field(
+        2 * 1024**3,
+        ge=0,
+        description="Upper bound on compressed bytes kept in the on-disk response cache.",
+    )
+    http_cache_ttl: float = Field(
+        6 * 3600.0,
+        ge=0,
+        description="Seconds a cached response is served before it is revalidated with the SEC.",
+    )
+    shared_state_dir: Path | None = Field(
+        None,
+        description=(
+            "Directory shared by all worker processes on the host. When set, responses are "
+            "cached in SQLite there and every worker draws from one SEC rate budget."
+        ),
+    )
+    facts_cache_max_bytes: int = Field(
+        512 * 1024**2,
+        ge=0,
+        description="Estimated memory budget for parsed companyfacts payloads kept in-process.",
+    )
+    facts_cache_ttl: float = Field(
+        900.0,
+        ge=0,
+        description="Seconds a parsed companyfacts payload is reused before it is refetched.",
+    )
+    job_checkpoint_dir: Path | None = Field(
+        None,
+        description="Directory for background scan checkpoints; unset keeps jobs in memory only.",
+    )
+    job_checkpoint_interval: float = Field(
+        5.0,
+        gt=0,
+        description="Seconds between checkpoint writes while a background scan is running.",
+    )
+    job_retention_limit: int = Field(
+        100,
+        ge=1,
+        description="Finished scans kept for status and results; older ones are deleted.",
+    )
+    bulk_submissions_path: Path | None = Field(
+        None,
+        description="Local copy of the SEC nightly submissions.zip to load at startup.",
+    )
+    bulk_companyfacts_path: Path | None = Field(
+        None,
+        description="Local copy of the SEC nightly companyfacts.zip to load at startup.",
+    )
+    daily_index_dir: Path | None = Field(
+        None,
+        description="Local mirror of EDGAR daily-index master.*.idx files; unset disables sync.",
+    )
+    sync_state_path: Path = Field(
+        Path(".cache/sync-state.json"),
+        description="File holding the last fully synced daily-index date.",
+    )
+    history_shard_cache_size: int = Field(
+        128,
+        ge=0,
+        description="Older-filings submissions shards kept in memory for history pagination.",
+    )
+    server_timing_enabled: bool = Field(
+        False,
+        description="Add a Server-Timing header with per-phase durations to every response.",
+    )
+    profiling_enabled: bool = Field(
+        False,
+        description="Allow ?profile=1 to return a sampled collapsed-stack profile of a request.",
+    )
+    profiling_interval: float = Field(
+        0.005,
+        gt=0,
+        description="Seconds between stack samples while a request is being profiled.",
+    )
+    ticker_registry_ttl: float = Field(
+        3600.0,
+        gt=0,
+        description="Seconds before the cached SEC ticker list is revalidated in the background.",
+    )
 
     model_config = SettingsConfigDict(env_prefix="SEC_API_", env_file=".env", extra="ignore")
 
@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+from collections.abc import Callable, Mapping
+from typing import Any
+
 import httpx
-from fastapi import Depends
+from fastapi import Depends, FastAPI, params
 
+from .clients.http_cache import DiskResponseCache, ResponseCache
+from .clients.rate_limiter import TokenBucketRateLimiter
+from .clients.retry import CircuitBreaker
 from .clients.sec_client import SECEdgarClient
+from .clients.shared_limiter import FileLockRateLimiter
+from .clients.sqlite_cache import SQLiteResponseCache
+from .clients.submissions import SubmissionsParser
+from .clients.transport import build_transport
 from .config import Settings, get_settings
+from .services.bulk_ingest import ingest_companyfacts_archive, ingest_submissions_archive
+from .services.facts_cache import CompanyFactsCache
 from .services.financials_service import FinancialsService
+from .services.jobs import TenKScanJobManager
+from .services.local_store import LocalEdgarStore
+from .services.screening_service import ScreeningService
+from .services.sync_service import FilingsSyncService
 from .services.tenk_service import TenKService
+from .services.ticker_registry import TickerRegistry
 
 _http_client: httpx.AsyncClient | None = None
+_rate_limiter: TokenBucketRateLimiter | None = None
+_circuit_breaker: CircuitBreaker | None = None
+_response_cache: ResponseCache | None = None
+_ticker_registry: TickerRegistry | None = None
+_local_store = LocalEdgarStore()
 _tenk_service: TenKService | None = None
 _financials_service: FinancialsService | None = None
+_scan_job_manager: TenKScanJobManager | None = None
+_screening_service: ScreeningService | None = None
+_sync_service: FilingsSyncService | None = None
 
 
 async def get_http_client(settings: Settings = Depends(get_settings)) -> httpx.AsyncClient:
@@ -25,45 +52,243 @@ async def get_http_client(settings: Settings = Depends(get_settings)) -> httpx.A
                 "Accept-Encoding": "gzip, deflate",
             },
             timeout=settings.request_timeout,
+            transport=build_transport(settings),
         )
     return _http_client
 
 
+async def get_rate_limiter(settings: Settings = Depends(get_settings)) -> TokenBucketRateLimiter:
+    """Provide the limiter shared by every outbound SEC request.
+
+    With ``shared_state_dir`` set the budget is shared with the other worker processes.
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        if settings.shared_state_dir is not None:
+            _rate_limiter = FileLockRateLimiter(
+                settings.shared_state_dir / "sec-rate-limit.state",
+                settings.requests_per_second,
+                settings.rate_limit_burst,
+            )
+        else:
+            _rate_limiter = TokenBucketRateLimiter(
+                settings.requests_per_second, settings.rate_limit_burst
+            )
+    return _rate_limiter
+
+
+async def get_circuit_breaker(settings: Settings = Depends(get_settings)) -> CircuitBreaker:
+    """Provide the circuit breaker tracking SEC availability for the whole process."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker(
+            settings.circuit_failure_threshold, settings.circuit_reset_timeout
+        )
+    return _circuit_breaker
+
+
+async def get_response_cache(settings: Settings = Depends(get_settings)) -> ResponseCache | None:
+    """Provide the on-disk response cache, or ``None`` when it is not configured."""
+    global _response_cache
+    if _response_cache is None and settings.shared_state_dir is not None:
+        _response_cache = SQLiteResponseCache(
+            settings.shared_state_dir / "responses.sqlite3",
+            max_bytes=settings.http_cache_max_bytes,
+        )
+    elif _response_cache is None and settings.http_cache_dir is not None:
+        _response_cache = DiskResponseCache(
+            settings.http_cache_dir, max_bytes=settings.http_cache_max_bytes
+        )
+    return _response_cache
+
+
 async def get_sec_client(
     http_client: httpx.AsyncClient = Depends(get_http_client),
     settings: Settings = Depends(get_settings),
+    rate_limiter: TokenBucketRateLimiter = Depends(get_rate_limiter),
+    circuit_breaker: CircuitBreaker = Depends(get_circuit_breaker),
+    response_cache: ResponseCache | None = Depends(get_response_cache),
 ) -> SECEdgarClient:
-    return SECEdgarClient(http_client=http_client, settings=settings)
+    return SECEdgarClient(
+        http_client=http_client,
+        settings=settings,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        response_cache=response_cache,
+    )
+
+
+def get_local_store() -> LocalEdgarStore:
+    """Provide the process-wide store populated from local bulk archives."""
+    return _local_store
+
+
+async def load_bulk_archives() -> None:
+    """Load the configured SEC bulk archives into the local store."""
+    settings = get_settings()
+    if settings.bulk_submissions_path is not None:
+        parser = SubmissionsParser(str(settings.archives_base_url))
+        await asyncio.to_thread(
+            ingest_submissions_archive, settings.bulk_submissions_path, _local_store, parser
+        )
+    if settings.bulk_companyfacts_path is not None:
+        await asyncio.to_thread(
+            ingest_companyfacts_archive,
+            settings.bulk_companyfacts_path,
+            _local_store,
+            FinancialsService.tracked_concepts(),
+        )
+
+
+async def get_ticker_registry(
+    settings: Settings = Depends(get_settings),
+    client: SECEdgarClient = Depends(get_sec_client),
+) -> TickerRegistry:
+    """Provide the process-wide ticker registry."""
+    global _ticker_registry
+    if _ticker_registry is None:
+        _ticker_registry = TickerRegistry(client, ttl=settings.ticker_registry_ttl)
+    return _ticker_registry
 
 
 async def get_tenk_service(
     settings: Settings = Depends(get_settings),
-    http_client: httpx.AsyncClient = Depends(get_http_client),
+    client: SECEdgarClient = Depends(get_sec_client),
+    ticker_registry: TickerRegistry = Depends(get_ticker_registry),
+    local_store: LocalEdgarStore = Depends(get_local_store),
 ) -> TenKService:
     global _tenk_service
     if _tenk_service is None:
-        client = SECEdgarClient(http_client=http_client, settings=settings)
-        _tenk_service = TenKService(client=client, settings=settings)
+        _tenk_service = TenKService(
+            client=client,
+            settings=settings,
+            ticker_registry=ticker_registry,
+            local_store=local_store,
+        )
     return _tenk_service
 
 
 async def get_financials_service(
     settings: Settings = Depends(get_settings),
-    http_client: httpx.AsyncClient = Depends(get_http_client),
+    client: SECEdgarClient = Depends(get_sec_client),
+    ticker_registry: TickerRegistry = Depends(get_ticker_registry),
+    local_store: LocalEdgarStore = Depends(get_local_store),
 ) -> FinancialsService:
     global _financials_service
     if _financials_service is None:
-        client = SECEdgarClient(http_client=http_client, settings=settings)
-        _financials_service = FinancialsService(client=client)
+        facts_cache = CompanyFactsCache(
+            max_bytes=settings.facts_cache_max_bytes, ttl=settings.facts_cache_ttl
+        )
+        _financials_service = FinancialsService(
+            client=client,
+            ticker_registry=ticker_registry,
+            facts_cache=facts_cache,
+            local_store=local_store,
+            max_concurrent_requests=settings.max_concurrent_requests,
+        )
     return _financials_service
 
 
+async def get_screening_service(
+    ticker_registry: TickerRegistry = Depends(get_ticker_registry),
+    local_store: LocalEdgarStore = Depends(get_local_store),
+) -> ScreeningService:
+    global _screening_service
+    if _screening_service is None:
+        _screening_service = ScreeningService(local_store, ticker_registry=ticker_registry)
+    return _screening_service
+
+
+async def get_sync_service(
+    settings: Settings = Depends(get_settings),
+    client: SECEdgarClient = Depends(get_sec_client),
+    local_store: LocalEdgarStore = Depends(get_local_store),
+) -> FilingsSyncService | None:
+    """Provide the incremental sync service, or ``None`` when no daily index is configured."""
+    global _sync_service
+    if _sync_service is None and settings.daily_index_dir is not None:
+        _sync_service = FilingsSyncService(
+            client,
+            local_store,
+            index_dir=settings.daily_index_dir,
+            state_path=settings.sync_state_path,
+            max_concurrent_requests=settings.max_concurrent_requests,
+        )
+    return _sync_service
+
+
+async def get_scan_job_manager(
+    settings: Settings = Depends(get_settings),
+    tenk_service: TenKService = Depends(get_tenk_service),
+) -> TenKScanJobManager:
+    """Provide the background scan job manager, resuming checkpointed jobs on creation."""
+    global _scan_job_manager
+    if _scan_job_manager is None:
+        _scan_job_manager = TenKScanJobManager(
+            tenk_service,
+            checkpoint_dir=settings.job_checkpoint_dir,
+            checkpoint_interval=settings.job_checkpoint_interval,
+            max_finished_jobs=settings.job_retention_limit,
+        )
+        await _scan_job_manager.resume_pending()
+    return _scan_job_manager
+
+
+async def resume_scan_jobs(app: FastAPI) -> None:
+    """Resolve the job manager outside a request so interrupted scans restart at startup.
+
+    Providers are resolved through ``app.dependency_overrides``, like a request would.
+    """
+    resolved: dict[Callable[..., Any], Any] = {}
+    settings = await _resolve(get_settings, app.dependency_overrides, resolved)
+    if settings.job_checkpoint_dir is None:
+        return
+    await _resolve(get_scan_job_manager, app.dependency_overrides, resolved)
+
+
+async def _resolve(
+    provider: Callable[..., Any],
+    overrides: Mapping[Callable[..., Any], Callable[..., Any]],
+    resolved: dict[Callable[..., Any], Any],
+) -> Any:
+    """Call ``provider`` with its ``Depends`` parameters filled in, as FastAPI would."""
+    if provider in resolved:
+        return resolved[provider]
+    call = overrides.get(provider, provider)
+    arguments = {
+        name: await _resolve(parameter.default.dependency, overrides, resolved)
+        for name, parameter in inspect.signature(call).parameters.items()
+        if isinstance(parameter.default, params.Depends) and parameter.default.dependency
+    }
+    result = call(**arguments)
+    if inspect.isawaitable(result):
+        result = await result
+    resolved[provider] = result
+    return result
+
+
 async def close_http_client() -> None:
-    """Close the shared HTTP client."""
-    global _http_client
+    """Close the shared HTTP client and reset every singleton built on top of it."""
+    global _http_client, _rate_limiter, _circuit_breaker, _response_cache, _ticker_registry
+    global _tenk_service, _financials_service, _scan_job_manager, _screening_service
+    global _sync_service
+    if _scan_job_manager is not None:
+        await _scan_job_manager.aclose()
+    if _ticker_registry is not None:
+        await _ticker_registry.aclose()
     if _http_client is not None:
         await _http_client.aclose()
-        _http_client = None
-        global _tenk_service, _financials_service
-        _tenk_service = None
-        _financials_service = None
+    if isinstance(_rate_limiter, FileLockRateLimiter):
+        _rate_limiter.close()
+    if isinstance(_response_cache, SQLiteResponseCache):
+        _response_cache.close()
+    _http_client = None
+    _rate_limiter = None
+    _circuit_breaker = None
+    _response_cache = None
+    _ticker_registry = None
+    _tenk_service = None
+    _financials_service = None
+    _scan_job_manager = None
+    _screening_service = None
+    _sync_service = None
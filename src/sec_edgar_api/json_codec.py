@@ -0,0 +1,53 @@
+"""Pluggable JSON codec: orjson when installed, the standard library otherwise."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+
+class JSONCodec(NamedTuple):
+    """A named pair of ``loads``/``dumps`` callables; ``dumps`` returns UTF-8 bytes."""
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+_CODECS: dict[str, JSONCodec] = {"json": JSONCodec("json", json.loads, _stdlib_dumps)}
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the fast-json extra is absent
+    pass
+else:
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    _CODECS["orjson"] = JSONCodec("orjson", orjson.loads, _orjson_dumps)
+
+
+def available_codecs() -> list[str]:
+    return list(_CODECS)
+
+
+def get_codec(name: str | None = None) -> JSONCodec:
+    """Return the codec called ``name``, or the fastest installed one."""
+    if name is None:
+        return _CODECS.get("orjson") or _CODECS["json"]
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(f"JSON codec '{name}' is not available") from None
+
+
+_default = get_codec()
+BACKEND = _default.name
+loads = _default.loads
+dumps = _default.dumps
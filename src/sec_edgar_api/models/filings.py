@@ -31,6 +31,23 @@ class AggregatedFilings(BaseModel):
     """Container returned by the aggregated filings endpoint."""
 
     companies_examined: int
+    companies_failed: int = 0
     total_filings: int
     form_type: str
     filings: list[Filing]
+
+
+class FilingsPage(BaseModel):
+    """One page of a company's filing history."""
+
+    filings: list[Filing]
+    next_cursor: Optional[str] = None
+
+
+class SyncReport(BaseModel):
+    """Outcome of an incremental sync against the EDGAR daily index."""
+
+    days_processed: int = 0
+    companies_refreshed: int = 0
+    watermark: Optional[date] = None
+    failed_ciks: list[str] = []
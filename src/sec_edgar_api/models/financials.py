@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from datetime import date
 
-from typing import Union
+from typing import Literal, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class FinancialMetric(BaseModel):
@@ -51,3 +51,84 @@ class FinancialMetricSeries(BaseModel):
 
 
 MetricValue = Union[FinancialMetric, FinancialMetricSeries]
+
+SeriesPeriod = Literal["FY", "Q"]
+
+
+class SeriesObservation(BaseModel):
+    """One reported value of a concept for a single period."""
+
+    start_date: date | None
+    end_date: date
+    value: float | None
+    fiscal_year: int | None
+    fiscal_period: str | None
+    form: str | None
+    filing_date: date | None
+    accession_number: str | None
+
+
+class ConceptSeries(BaseModel):
+    """Time series of one XBRL concept, per unit, ordered by period end."""
+
+    taxonomy: str | None
+    concept: str
+    label: str | None
+    units: dict[str, list[SeriesObservation]]
+
+
+class CompanyConceptSeries(BaseModel):
+    """Historical time series for the concepts requested for a company."""
+
+    cik: str
+    ticker: str
+    company_name: str | None
+    period: SeriesPeriod | None
+    series: list[ConceptSeries]
+
+
+BatchStatement = Literal["snapshot", "income_statement"]
+
+
+class BatchFinancialsRequest(BaseModel):
+    """Tickers and concept set requested from the batch financials endpoint."""
+
+    tickers: list[str] = Field(..., min_length=1, max_length=1000)
+    statement: BatchStatement = "snapshot"
+    metrics: list[str] | None = Field(
+        None,
+        min_length=1,
+        description="Metric aliases of the statement to return; all of them when omitted.",
+    )
+
+
+class BatchFinancialsItem(BaseModel):
+    """Outcome for one ticker of a batch request: a result or an error."""
+
+    ticker: str
+    result: CompanyFinancialSnapshot | CompanyIncomeStatement | None = None
+    error: str | None = None
+
+
+class BatchFinancialsResponse(BaseModel):
+    """Per-ticker results of a batch financials request, in request order."""
+
+    results: list[BatchFinancialsItem]
+
+
+class ScreenResult(BaseModel):
+    """A company matching a cross-sectional screen, with the metric it was ranked by."""
+
+    cik: str
+    ticker: str | None
+    company_name: str | None
+    metric: FinancialMetric
+
+
+class ScreenResponse(BaseModel):
+    """Ranked output of a cross-sectional metric screen."""
+
+    metric: str
+    companies_screened: int
+    total_matches: int
+    results: list[ScreenResult]
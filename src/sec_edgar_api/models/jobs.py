@@ -0,0 +1,35 @@
+"""Pydantic models describing background 10-K scan jobs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+JobState = Literal["running", "completed", "failed", "cancelled"]
+
+
+class ScanJobRequest(BaseModel):
+    """Parameters for a background 10-K aggregation job."""
+
+    limit_per_company: int = Field(1, ge=1, le=10)
+    max_companies: int | None = Field(None, ge=1)
+
+
+class ScanJobStatus(BaseModel):
+    """Progress report for a background 10-K aggregation job."""
+
+    job_id: str
+    state: JobState
+    limit_per_company: int
+    max_companies: int | None
+    companies_total: int | None
+    companies_done: int
+    companies_failed: int
+    filings_found: int
+    rate_per_second: float | None
+    eta_seconds: float | None
+    created_at: datetime
+    updated_at: datetime
+    error: str | None = None
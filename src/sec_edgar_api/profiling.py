@@ -0,0 +1,104 @@
+"""Opt-in sampling profiler returning collapsed stacks for a single request."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack at a fixed interval from a background thread.
+
+    ``collapsed()`` renders the samples in the folded ``frame;frame;frame count`` format
+    read by flamegraph.pl and speedscope. The event loop thread is shared, so stacks from
+    concurrently served requests land in the same profile.
+    """
+
+    def __init__(self, thread_id: int, *, interval: float = 0.005) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        self._samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def __enter__(self) -> SamplingProfiler:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self._samples.most_common())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._samples[_fold(frame)] += 1
+
+
+def _fold(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{code.co_qualname}:{frame.f_lineno}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class ProfilingMiddleware:
+    """Replaces the response of ``?profile=1`` requests with the request's collapsed stacks.
+
+    Only installed when ``SEC_API_PROFILING_ENABLED`` is set: the profile exposes code
+    paths and slows the request being profiled.
+    """
+
+    def __init__(self, app: ASGIApp, *, interval: float = 0.005) -> None:
+        self.app = app
+        self._interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        started = time.perf_counter()
+        with SamplingProfiler(threading.get_ident(), interval=self._interval) as profiler:
+            await self.app(scope, receive, discard)
+        elapsed = time.perf_counter() - started
+        body = profiler.collapsed().encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", CONTENT_TYPE.encode()),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profiled-status", str(status).encode()),
+                    (b"x-profiled-duration", f"{elapsed:.6f}".encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _wants_profile(scope: Scope) -> bool:
+    values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("profile", [])
+    return any(value.lower() in {"1", "true", "yes"} for value in values)
@@ -0,0 +1,19 @@
+"""Response classes shared by the API routes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from . import json_codec
+from .timing import phase, record_serialization
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered through the package JSON codec (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        record_serialization()
+        with phase("render"):
+            return json_codec.dumps(content)
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+from typing import AsyncIterator, Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from ..services.filing_history import InvalidCursorError
+from ..services.jobs import JobNotFoundError, TenKScanJobManager
+from ..services.sync_service import FilingsSyncService
 from ..services.tenk_service import TenKService
-from ..models.filings import AggregatedFilings, Filing
-from ..dependencies import get_tenk_service
+from ..models.filings import AggregatedFilings, Filing, FilingsPage, SyncReport
+from ..models.jobs import ScanJobRequest, ScanJobStatus
+from ..dependencies import get_scan_job_manager, get_sync_service, get_tenk_service
 
 router = APIRouter(prefix="/filings", tags=["filings"])
 
 
-@router.get("/10-k", response_model=AggregatedFilings)
+@router.get(
+    "/10-k",
+    response_model=AggregatedFilings,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
 async def get_aggregated_tenk_filings(
     max_companies: int | None = Query(
         None,
@@ -27,9 +38,27 @@ async def get_aggregated_tenk_filings(
         le=10,
         description="Maximum number of recent 10-Ks returned per company.",
     ),
+    stream: Literal["ndjson"] | None = Query(
+        None,
+        description=(
+            "Set to `ndjson` to stream one filing per line as each company completes instead "
+            "of waiting for the full, date-sorted aggregate."
+        ),
+    ),
     tenk_service: TenKService = Depends(get_tenk_service),
-) -> AggregatedFilings:
+) -> AggregatedFilings | StreamingResponse:
     """Return aggregated 10-K filings across companies."""
+    if stream == "ndjson":
+
+        async def ndjson_lines() -> AsyncIterator[str]:
+            async for filing in tenk_service.stream_filings(
+                limit_per_company=limit_per_company,
+                max_companies=max_companies,
+            ):
+                yield filing.model_dump_json() + "\n"
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
     return await tenk_service.fetch_all_filings(
         limit_per_company=limit_per_company,
         max_companies=max_companies,
@@ -46,3 +75,82 @@ async def get_company_tenk_filings(
     if not filings:
         raise HTTPException(status_code=404, detail=f"No 10-K filings found for ticker '{ticker}'.")
     return filings
+
+
+@router.get("/10-k/{ticker}/history", response_model=FilingsPage)
+async def get_company_tenk_history(
+    ticker: str,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="Opaque `next_cursor` from the previous page; omit for the newest."
+    ),
+    tenk_service: TenKService = Depends(get_tenk_service),
+) -> FilingsPage:
+    """Page through every 10-K a company has filed, newest first."""
+    try:
+        page = await tenk_service.fetch_company_filings_page(ticker, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.") from None
+    if page is None:
+        raise HTTPException(status_code=404, detail=f"Unknown ticker '{ticker}'.")
+    return page
+
+
+@router.post("/10-k/jobs", response_model=ScanJobStatus, status_code=202)
+async def start_tenk_scan_job(
+    request: ScanJobRequest,
+    job_manager: TenKScanJobManager = Depends(get_scan_job_manager),
+) -> ScanJobStatus:
+    """Start a background 10-K aggregation scan."""
+    return job_manager.start(request)
+
+
+@router.get("/10-k/jobs/{job_id}", response_model=ScanJobStatus)
+async def get_tenk_scan_job(
+    job_id: str,
+    job_manager: TenKScanJobManager = Depends(get_scan_job_manager),
+) -> ScanJobStatus:
+    """Report progress, throughput and ETA for a background scan."""
+    try:
+        return job_manager.status(job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.") from None
+
+
+@router.get("/10-k/jobs/{job_id}/results", response_model=AggregatedFilings)
+async def get_tenk_scan_job_results(
+    job_id: str,
+    job_manager: TenKScanJobManager = Depends(get_scan_job_manager),
+) -> AggregatedFilings:
+    """Return the filings a background scan has collected so far."""
+    try:
+        return job_manager.results(job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.") from None
+
+
+@router.delete("/10-k/jobs/{job_id}", response_model=ScanJobStatus)
+async def cancel_tenk_scan_job(
+    job_id: str,
+    job_manager: TenKScanJobManager = Depends(get_scan_job_manager),
+) -> ScanJobStatus:
+    """Cancel a background scan, keeping its partial results."""
+    try:
+        return await job_manager.cancel(job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.") from None
+
+
+@router.post("/sync", response_model=SyncReport)
+async def sync_tenk_filings(
+    sync_service: FilingsSyncService | None = Depends(get_sync_service),
+) -> SyncReport:
+    """Refresh stored 10-Ks for companies listed in daily indexes newer than the watermark."""
+    if sync_service is None:
+        raise HTTPException(status_code=503, detail="No EDGAR daily index directory configured.")
+    if not sync_service.available:
+        raise HTTPException(
+            status_code=503,
+            detail="Sync requires 10-K filings loaded from a bulk submissions archive.",
+        )
+    return await sync_service.sync()
@@ -2,14 +2,98 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import AsyncIterator, Literal
 
-from ..dependencies import get_financials_service
-from ..models.financials import CompanyFinancialSnapshot, CompanyIncomeStatement
-from ..services.financials_service import FinancialsService
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from ..dependencies import get_financials_service, get_screening_service
+from ..models.financials import (
+    BatchFinancialsRequest,
+    BatchFinancialsResponse,
+    CompanyConceptSeries,
+    CompanyFinancialSnapshot,
+    CompanyIncomeStatement,
+    ScreenResponse,
+    SeriesPeriod,
+)
+from ..services.financials_service import FinancialsService, InvalidConceptError
+from ..services.screening_service import ScreeningService, UnknownMetricError
 
 router = APIRouter(prefix="/financials", tags=["financials"])
 
+MAX_SERIES_CONCEPTS = 25
+
+
+@router.get("/screen", response_model=ScreenResponse)
+async def screen_companies(
+    metric: str = Query(..., description="Metric alias from the snapshot, e.g. `revenues`."),
+    minimum: float | None = Query(None, alias="min", description="Inclusive lower bound."),
+    maximum: float | None = Query(None, alias="max", description="Inclusive upper bound."),
+    sort: Literal["asc", "desc"] = Query("desc"),
+    limit: int = Query(100, ge=1, le=1000),
+    screening_service: ScreeningService = Depends(get_screening_service),
+) -> ScreenResponse:
+    """Rank every locally loaded company by its latest value of ``metric``."""
+    if not screening_service.available:
+        raise HTTPException(
+            status_code=503,
+            detail="Screening requires company facts loaded from a bulk companyfacts archive.",
+        )
+    try:
+        return await screening_service.screen(
+            metric,
+            minimum=minimum,
+            maximum=maximum,
+            descending=sort == "desc",
+            limit=limit,
+        )
+    except UnknownMetricError:
+        supported = ", ".join(ScreeningService.METRICS)
+        raise HTTPException(
+            status_code=400, detail=f"Unknown metric '{metric}'. Supported: {supported}."
+        ) from None
+
+
+@router.post(
+    "/batch",
+    response_model=BatchFinancialsResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def get_batch_financials(
+    request: BatchFinancialsRequest,
+    stream: Literal["ndjson"] | None = Query(
+        None, description="Set to `ndjson` to stream one result per line as tickers complete."
+    ),
+    financials_service: FinancialsService = Depends(get_financials_service),
+) -> BatchFinancialsResponse | StreamingResponse:
+    """Return snapshots or income statements for many tickers, with per-ticker errors."""
+    supported = FinancialsService.statement_metrics(request.statement)
+    unknown = [name for name in request.metrics or () if name not in supported]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unknown {request.statement} metrics: {', '.join(unknown)}. "
+                f"Supported: {', '.join(supported)}."
+            ),
+        )
+    if stream == "ndjson":
+
+        async def ndjson_lines() -> AsyncIterator[str]:
+            async for item in financials_service.iter_batch(
+                request.tickers, statement=request.statement, metrics=request.metrics
+            ):
+                yield item.model_dump_json() + "\n"
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    results = await financials_service.fetch_batch(
+        request.tickers, statement=request.statement, metrics=request.metrics
+    )
+    return BatchFinancialsResponse(results=results)
+
 
 @router.get("/{ticker}", response_model=CompanyFinancialSnapshot)
 async def get_company_financials(
@@ -33,3 +117,43 @@ async def get_income_statement(
     if statement is None:
         raise HTTPException(status_code=404, detail=f"Ticker '{ticker}' not found.")
     return statement
+
+
+@router.get("/{ticker}/series", response_model=CompanyConceptSeries)
+async def get_concept_series(
+    ticker: str,
+    concepts: str = Query(
+        ...,
+        description=(
+            "Comma-separated XBRL concepts, optionally prefixed with a taxonomy, e.g. "
+            "`Revenues,dei:EntityCommonStockSharesOutstanding`."
+        ),
+    ),
+    period: SeriesPeriod | None = Query(
+        None, description="`FY` for annual or `Q` for quarterly values; all when omitted."
+    ),
+    start: date | None = Query(None, alias="from", description="Earliest period end date."),
+    end: date | None = Query(None, alias="to", description="Latest period end date."),
+    financials_service: FinancialsService = Depends(get_financials_service),
+) -> CompanyConceptSeries:
+    """Return deduplicated historical series for any us-gaap, ifrs-full or dei concept."""
+    names = list(dict.fromkeys(name.strip() for name in concepts.split(",") if name.strip()))
+    if not names or len(names) > MAX_SERIES_CONCEPTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Request between 1 and {MAX_SERIES_CONCEPTS} concepts.",
+        )
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'.")
+    try:
+        series = await financials_service.fetch_concept_series(
+            ticker, names, period=period, start=start, end=end
+        )
+    except InvalidConceptError as exc:
+        supported = ", ".join(FinancialsService.SERIES_TAXONOMIES)
+        raise HTTPException(
+            status_code=400, detail=f"Unknown taxonomy in '{exc}'. Supported: {supported}."
+        ) from None
+    if series is None:
+        raise HTTPException(status_code=404, detail=f"Ticker '{ticker}' not found.")
+    return series
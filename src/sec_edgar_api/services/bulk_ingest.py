@@ -0,0 +1,66 @@
+"""Ingestion of the SEC nightly bulk archives (submissions.zip / companyfacts.zip)."""
+
+from __future__ import annotations
+
+import logging
+import re
+import zipfile
+from collections.abc import Collection, Iterator
+from pathlib import Path
+from typing import Any
+
+from .. import json_codec
+from ..clients.facts_parser import filter_company_facts
+from ..clients.submissions import SubmissionsParser, is_10k_form
+from .local_store import LocalEdgarStore
+
+logger = logging.getLogger(__name__)
+
+# Primary documents only; submissions.zip also ships "CIK##########-submissions-001.json"
+# shards holding older filings.
+_PRIMARY_MEMBER = re.compile(r"(?:^|/)CIK(\d{10})\.json$")
+
+
+def iter_archive_documents(path: Path) -> Iterator[tuple[str, Any]]:
+    """Yield ``(cik, payload)`` for each per-company JSON member of a bulk archive.
+
+    Members are decompressed and decoded one at a time, so memory use is bounded by
+    the largest single company rather than by the archive.
+    """
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            match = _PRIMARY_MEMBER.search(info.filename)
+            if match is None:
+                continue
+            with archive.open(info) as handle:
+                try:
+                    payload = json_codec.loads(handle.read())
+                except ValueError:
+                    logger.warning("Skipping malformed member %s in %s", info.filename, path)
+                    continue
+            yield match.group(1), payload
+
+
+def ingest_submissions_archive(
+    path: Path, store: LocalEdgarStore, parser: SubmissionsParser
+) -> int:
+    """Load every company's 10-K filings from ``submissions.zip`` into ``store``."""
+    count = 0
+    for cik, payload in iter_archive_documents(path):
+        store.put_tenk_filings(cik, parser.parse_recent(payload, form_predicate=is_10k_form))
+        count += 1
+    store.mark_tenk_filings_loaded()
+    logger.info("Ingested submissions for %d companies from %s", count, path)
+    return count
+
+
+def ingest_companyfacts_archive(
+    path: Path, store: LocalEdgarStore, concepts: Collection[str]
+) -> int:
+    """Load ``companyfacts.zip`` into the columnar fact store, keeping the listed concepts."""
+    count = 0
+    for cik, payload in iter_archive_documents(path):
+        store.put_facts(cik, filter_company_facts(payload, concepts))
+        count += 1
+    logger.info("Ingested company facts for %d companies from %s", count, path)
+    return count
@@ -0,0 +1,292 @@
+"""Companyfacts payloads with lazily normalized fact entries."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, NamedTuple
+
+from ..models.financials import SeriesPeriod
+
+_MISSING_ORDINAL = 0
+# Rough CPython footprint of the memoized views, per fact entry: a NormalizedEntry with
+# its sort key and dates, one SeriesIndex slot (DatedEntry plus end ordinal), and one
+# list slot in a restatement-resolved unit list.
+_NORMALIZED_ENTRY_BYTES = 350
+_INDEXED_ENTRY_BYTES = 130
+_LIST_SLOT_BYTES = 8
+# Day spans (end - start) counted as a fiscal year or a fiscal quarter.
+_ANNUAL_DAYS = range(350, 381)
+_QUARTER_DAYS = range(80, 101)
+
+
+class NormalizedEntry(NamedTuple):
+    """One fact entry with its dates parsed and its sort key computed up front.
+
+    ``sort_key`` is ``(fiscal_year, filed, end)`` with dates as proleptic ordinals and
+    missing parts as 0, ordering entries exactly like the original dict comparisons.
+    """
+
+    sort_key: tuple[int, int, int]
+    form: str | None
+    start: date | None
+    end: date | None
+    filed: date | None
+    raw: Mapping[str, Any]
+
+
+class DatedEntry(NamedTuple):
+    """A fact entry known to have an end date, as served by ``SeriesIndex``."""
+
+    start: date | None
+    end: date
+    filed: date | None
+    raw: Mapping[str, Any]
+
+
+class CompanyFacts(Mapping[str, Any]):
+    """Read-only view of a decoded companyfacts payload.
+
+    Normalized entries are built on first use per concept and kept with the view, so a
+    cached payload pays the date parsing once rather than on every request.
+    ``decoded_concepts`` names the concepts a partial decode asked for; it is ``None``
+    for a full document. ``memo_bytes`` estimates what the memoized views hold, and
+    ``on_growth`` (set by a cache holding the view) is told each time it grows.
+    """
+
+    def __init__(
+        self, payload: Mapping[str, Any], *, decoded_concepts: frozenset[str] | None = None
+    ) -> None:
+        self._payload = payload
+        self.decoded_concepts = decoded_concepts
+        self.memo_bytes = 0
+        self.on_growth: Callable[[int], None] | None = None
+        self._normalized: dict[tuple[str, str], dict[str, list[NormalizedEntry]]] = {}
+        self._series: dict[tuple[str, str], SeriesIndex] = {}
+        self._distinct: dict[tuple[str, str, str | None], dict[str, list[NormalizedEntry]]] = {}
+
+    @classmethod
+    def wrap(cls, payload: Mapping[str, Any]) -> CompanyFacts:
+        return payload if isinstance(payload, cls) else cls(payload)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._payload[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._payload)
+
+    def __len__(self) -> int:
+        return len(self._payload)
+
+    def normalized_units(self, taxonomy: str, concept: str) -> dict[str, list[NormalizedEntry]]:
+        """Return ``concept``'s entries per unit, normalized and memoized."""
+        key = (taxonomy, concept)
+        units = self._normalized.get(key)
+        if units is None:
+            body = ((self._payload.get("facts") or {}).get(taxonomy) or {}).get(concept) or {}
+            units = {
+                unit: [normalize_entry(entry) for entry in entries]
+                for unit, entries in (body.get("units") or {}).items()
+            }
+            self._normalized[key] = units
+            self._charge(_entry_count(units) * _NORMALIZED_ENTRY_BYTES)
+        return units
+
+    def distinct_units(
+        self, taxonomy: str, concept: str, form_filter: str | None = None
+    ) -> dict[str, list[NormalizedEntry]]:
+        """Return ``concept``'s entries per unit with restatements resolved, memoized.
+
+        Each unit is narrowed to ``form_filter`` first (see ``filter_by_form``), then every
+        ``(start, end)`` period keeps only its latest filed entry, so comparatives repeated
+        in later filings collapse into one observation carrying the restated value.
+        """
+        key = (taxonomy, concept, form_filter)
+        units = self._distinct.get(key)
+        if units is None:
+            units = self._distinct[key] = {
+                unit: latest_per_period(filter_by_form(entries, form_filter))
+                for unit, entries in self.normalized_units(taxonomy, concept).items()
+            }
+            self._charge(_entry_count(units) * _LIST_SLOT_BYTES)
+        return units
+
+    def series_index(self, taxonomy: str, concept: str) -> SeriesIndex:
+        """Return the memoized range-query index over ``concept``'s entries."""
+        key = (taxonomy, concept)
+        index = self._series.get(key)
+        if index is None:
+            index = self._series[key] = SeriesIndex(self.normalized_units(taxonomy, concept))
+            self._charge(index.entry_count * _INDEXED_ENTRY_BYTES)
+        return index
+
+    def _charge(self, size: int) -> None:
+        self.memo_bytes += size
+        if self.on_growth is not None:
+            self.on_growth(size)
+
+
+class SeriesIndex:
+    """One concept's entries per unit, deduplicated and sorted by end date.
+
+    Each unit keeps a slice for all entries plus one per period kind, each with a
+    parallel list of end ordinals, so a date range is two binary searches. Within a
+    slice, entries sharing a ``(start, end)`` period collapse to the latest filed one.
+    """
+
+    def __init__(self, units: Mapping[str, list[NormalizedEntry]]) -> None:
+        self._slices: dict[tuple[str, SeriesPeriod | None], tuple[list[int], list[DatedEntry]]] = {}
+        for unit, entries in units.items():
+            dated = [entry for entry in entries if entry.end is not None]
+            by_kind: dict[SeriesPeriod, list[NormalizedEntry]] = {"FY": [], "Q": []}
+            for entry in dated:
+                kind = period_kind(entry)
+                if kind is not None:
+                    by_kind[kind].append(entry)
+            self._add_slice(unit, None, dated)
+            for kind, kind_entries in by_kind.items():
+                self._add_slice(unit, kind, kind_entries)
+
+    @property
+    def units(self) -> list[str]:
+        return list(dict.fromkeys(unit for unit, _ in self._slices))
+
+    @property
+    def entry_count(self) -> int:
+        """Entries held across every slice."""
+        return sum(len(entries) for _, entries in self._slices.values())
+
+    def query(
+        self,
+        unit: str,
+        *,
+        period: SeriesPeriod | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[DatedEntry]:
+        """Return ``unit`` entries of ``period`` whose end date is within ``[start, end]``."""
+        ends, entries = self._slices.get((unit, period), ([], []))
+        low = bisect_left(ends, start.toordinal()) if start else 0
+        high = bisect_right(ends, end.toordinal()) if end else len(ends)
+        return entries[low:high]
+
+    def _add_slice(
+        self, unit: str, period: SeriesPeriod | None, entries: Iterable[NormalizedEntry]
+    ) -> None:
+        ordered = sorted(
+            (
+                DatedEntry(entry.start, entry.end, entry.filed, entry.raw)
+                for entry in latest_per_period(entries)
+                if entry.end is not None
+            ),
+            key=_period_order,
+        )
+        self._slices[(unit, period)] = ([entry.end.toordinal() for entry in ordered], ordered)
+
+
+def filter_by_form(
+    entries: list[NormalizedEntry], form_filter: str | None
+) -> list[NormalizedEntry]:
+    """Keep entries whose form starts with ``form_filter``, or all of them if none does."""
+    if not form_filter:
+        return entries
+    prefix = form_filter.upper()
+    matching = [entry for entry in entries if entry.form and entry.form.startswith(prefix)]
+    return matching or entries
+
+
+def latest_per_period(entries: Iterable[NormalizedEntry]) -> list[NormalizedEntry]:
+    """Collapse entries sharing a ``(start, end)`` period into the latest filed one.
+
+    Ties on the filing date go to the later entry. Survivors keep their input order.
+    """
+    latest: dict[tuple[date | None, date | None], tuple[int, NormalizedEntry]] = {}
+    for position, entry in enumerate(entries):
+        key = (entry.start, entry.end)
+        current = latest.get(key)
+        if current is None or _filed_ordinal(entry) >= _filed_ordinal(current[1]):
+            latest[key] = (position, entry)
+    return [entry for _, entry in sorted(latest.values(), key=itemgetter(0))]
+
+
+def period_kind(entry: NormalizedEntry) -> SeriesPeriod | None:
+    """Classify an entry as annual or quarterly.
+
+    Durations are classified by their length. Instants (balance-sheet values) have no
+    span, so they take the fiscal period of the filing that reported them.
+    """
+    if entry.start is not None and entry.end is not None:
+        days = (entry.end - entry.start).days
+        if days in _ANNUAL_DAYS:
+            return "FY"
+        if days in _QUARTER_DAYS:
+            return "Q"
+        return None
+    fiscal_period = entry.raw.get("fp")
+    if fiscal_period == "FY":
+        return "FY"
+    if isinstance(fiscal_period, str) and fiscal_period.startswith("Q"):
+        return "Q"
+    return None
+
+
+def _entry_count(units: Mapping[str, list[Any]]) -> int:
+    return sum(len(entries) for entries in units.values())
+
+
+def _filed_ordinal(entry: NormalizedEntry) -> int:
+    return entry.filed.toordinal() if entry.filed else _MISSING_ORDINAL
+
+
+def _period_order(entry: DatedEntry) -> tuple[int, int]:
+    start = entry.start.toordinal() if entry.start else _MISSING_ORDINAL
+    return entry.end.toordinal(), start
+
+
+def normalize_entry(entry: Mapping[str, Any]) -> NormalizedEntry:
+    start = parse_date(entry.get("start"))
+    end = parse_date(entry.get("end"))
+    filed = parse_date(entry.get("filed"))
+    form = entry.get("form")
+    return NormalizedEntry(
+        sort_key=(
+            fiscal_year(entry.get("fy")),
+            filed.toordinal() if filed else _MISSING_ORDINAL,
+            end.toordinal() if end else _MISSING_ORDINAL,
+        ),
+        form=form.upper() if isinstance(form, str) else None,
+        start=start,
+        end=end,
+        filed=filed,
+        raw=entry,
+    )
+
+
+def parse_date(value: Any) -> date | None:
+    """Parse an ISO ``YYYY-MM-DD`` fact date; anything else is ``None``."""
+    if not isinstance(value, str) or not value:
+        return None
+    return _parse_date(value)
+
+
+@lru_cache(maxsize=65_536)
+def _parse_date(value: str) -> date | None:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def fiscal_year(value: Any) -> int:
+    """Return a fact's ``fy`` as an int, with 0 standing in for a missing year."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return 0
+    return 0
@@ -0,0 +1,429 @@
+"""Columnar storage of companyfacts for vectorized metric lookups."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from .company_facts import fiscal_year, parse_date
+
+# Composite sort key layout: fiscal year in the high bits, then filed and period end as
+# proleptic ordinals (< 2**20 for any date before year 2870). Ordering the packed int64
+# matches ordering the (fy, filed, end) tuples FinancialsService sorts entries by.
+_ORDINAL_BITS = 20
+_MISSING = 0
+
+
+class FactRow(NamedTuple):
+    """One decoded fact observation."""
+
+    fiscal_year: int | None
+    fiscal_period: str | None
+    form: str | None
+    start: date | None
+    end: date | None
+    filed: date | None
+    value: float | None
+    accession: str | None
+
+
+@dataclass(frozen=True)
+class CrossSection:
+    """One latest observation per company, aligned across parallel columns."""
+
+    ciks: list[str]
+    concepts: list[str]
+    units: list[str]
+    rows: np.ndarray
+    values: np.ndarray
+
+
+class _Categories:
+    """Dictionary encoding for low-cardinality string columns."""
+
+    def __init__(self) -> None:
+        self._codes: dict[str | None, int] = {None: 0}
+        self._values: list[str | None] = [None]
+
+    def encode(self, value: Any) -> int:
+        key = value if isinstance(value, str) else None
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self._values)
+            self._codes[key] = code
+            self._values.append(key)
+        return code
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def lookup(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+    def decode(self, code: int) -> str | None:
+        return self._values[code]
+
+    def codes_with_prefix(self, prefix: str) -> np.ndarray:
+        prefix = prefix.upper()
+        return np.array(
+            [
+                code
+                for code, value in enumerate(self._values)
+                if value is not None and value.upper().startswith(prefix)
+            ],
+            dtype=np.int16,
+        )
+
+
+class _Chunk(NamedTuple):
+    start: np.ndarray
+    end: np.ndarray
+    filed: np.ndarray
+    fiscal_year: np.ndarray
+    fiscal_period: np.ndarray
+    form: np.ndarray
+    value: np.ndarray
+    accession: np.ndarray
+
+
+class _Series(NamedTuple):
+    """One entry per (cik, concept, unit) series: its codes and row slice."""
+
+    cik: np.ndarray
+    concept: np.ndarray
+    unit: np.ndarray
+    first: np.ndarray
+    stop: np.ndarray
+
+
+class ColumnarFactStore:
+    """Universe-wide companyfacts for one taxonomy held as flat NumPy columns.
+
+    Every (cik, concept, unit) series is a contiguous slice of the shared columns: int32
+    ordinal dates, int32 fiscal years, dictionary-encoded form and fiscal period codes,
+    float64 values and fixed-width accession numbers. Rows are appended per company and
+    concatenated into the shared columns lazily, on the first query after a load.
+    """
+
+    def __init__(self, taxonomy: str = "us-gaap") -> None:
+        self._taxonomy = taxonomy
+        self._forms = _Categories()
+        self._periods = _Categories()
+        self._concepts = _Categories()
+        self._unit_names = _Categories()
+        self._series: tuple[int, _Series] | None = None
+        self._slices: dict[tuple[str, str, str], tuple[int, int]] = {}
+        self._units: dict[tuple[str, str], list[str]] = {}
+        self._labels: dict[tuple[str, str], str] = {}
+        self._entity_names: dict[str, str | None] = {}
+        self._pending: list[_Chunk] = []
+        self._pending_rows = 0
+        self._columns: _Chunk | None = None
+        self._row_count = 0
+        self._version = 0
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count + self._pending_rows
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every load, for invalidating derived caches."""
+        return self._version
+
+    def has_company(self, cik: str) -> bool:
+        return cik in self._entity_names
+
+    def ciks(self) -> list[str]:
+        return list(self._entity_names)
+
+    def entity_name(self, cik: str) -> str | None:
+        return self._entity_names.get(cik)
+
+    def has_concept(self, cik: str, concept: str) -> bool:
+        return (cik, concept) in self._labels
+
+    def label(self, cik: str, concept: str) -> str | None:
+        return self._labels.get((cik, concept))
+
+    def add_company(self, cik: str, payload: Mapping[str, Any]) -> None:
+        """Normalize one companyfacts payload into column chunks."""
+        self._entity_names[cik] = payload.get("entityName")
+        self._version += 1
+        offset = self.row_count
+        columns: tuple[list[Any], ...] = ([], [], [], [], [], [], [], [])
+        starts, ends, filed, years, periods, forms, values, accessions = columns
+        concepts = (payload.get("facts") or {}).get(self._taxonomy) or {}
+        for concept, body in concepts.items():
+            if not body:
+                continue
+            self._labels[(cik, concept)] = body.get("label") or concept
+            unit_names: list[str] = []
+            for unit, entries in (body.get("units") or {}).items():
+                if not entries:
+                    continue
+                first = offset + len(ends)
+                for entry in entries:
+                    starts.append(_ordinal(entry.get("start")))
+                    ends.append(_ordinal(entry.get("end")))
+                    filed.append(_ordinal(entry.get("filed")))
+                    years.append(fiscal_year(entry.get("fy")))
+                    periods.append(self._periods.encode(entry.get("fp")))
+                    forms.append(self._forms.encode(entry.get("form")))
+                    raw_value = entry.get("val")
+                    values.append(
+                        float(raw_value) if isinstance(raw_value, (int, float)) else np.nan
+                    )
+                    accessions.append(entry.get("accn") or "")
+                self._slices[(cik, concept, unit)] = (first, offset + len(ends))
+                unit_names.append(unit)
+            self._units[(cik, concept)] = unit_names
+        if not ends:
+            return
+        self._pending.append(
+            _Chunk(
+                start=np.array(starts, dtype=np.int32),
+                end=np.array(ends, dtype=np.int32),
+                filed=np.array(filed, dtype=np.int32),
+                fiscal_year=np.array(years, dtype=np.int32),
+                fiscal_period=np.array(periods, dtype=np.int16),
+                form=np.array(forms, dtype=np.int16),
+                value=np.array(values, dtype=np.float64),
+                accession=np.array(accessions, dtype="S20"),
+            )
+        )
+        self._pending_rows += len(ends)
+
+    def select(
+        self,
+        cik: str,
+        concept: str,
+        *,
+        form_filter: str | None = None,
+        limit: int = 1,
+        preferred_units: Sequence[str] = (),
+        distinct_periods: bool = False,
+    ) -> tuple[str | None, list[FactRow]]:
+        """Pick the freshest unit for ``concept`` and return its newest ``limit`` rows.
+
+        Mirrors ``FinancialsService._select_entries``: a form filter that matches nothing
+        within a unit falls back to all of that unit's rows, and the unit whose freshest
+        row sorts highest wins, with ``preferred_units`` breaking ties. With
+        ``distinct_periods`` each ``(start, end)`` period keeps only its latest filed row,
+        like ``CompanyFacts.distinct_units``.
+        """
+        columns = self._frozen()
+        form_codes = self._forms.codes_with_prefix(form_filter) if form_filter else None
+        selected = self._select_rows(
+            columns, cik, concept, form_codes, preferred_units, distinct_periods
+        )
+        if selected is None:
+            return None, []
+        unit, rows, keys = selected
+        # Stable descending order keeps the first of equal keys first, like max()/sorted().
+        order = np.argsort(-keys, kind="stable")[:limit]
+        return unit, [self._decode(columns, int(rows[index])) for index in order]
+
+    def cross_section(
+        self,
+        concepts: Sequence[str],
+        *,
+        form_filter: str | None = None,
+        preferred_units: Sequence[str] = (),
+    ) -> CrossSection:
+        """Return each company's latest observation of the first concept it reports.
+
+        ``concepts`` is a fallback list, resolved per company exactly like
+        ``FinancialsService`` resolves metric aliases. The whole store is reduced in one
+        pass: series are masked by concept, rows by form, and each company's winner is
+        the first row of its group after one ``lexsort``.
+        """
+        columns = self._frozen()
+        series = self._series_table()
+
+        # Rank every series by the position of its concept in the fallback list; each
+        # company keeps only the series of its best-ranked concept.
+        missing = len(concepts)
+        concept_rank = np.full(len(self._concepts), missing, dtype=np.int64)
+        for rank, name in reversed(list(enumerate(concepts))):
+            code = self._concepts.lookup(name)
+            if code is not None:
+                concept_rank[code] = rank
+        series_rank = concept_rank[series.concept]
+        candidate = series_rank < missing
+        best_rank = np.full(len(self._entity_names), missing, dtype=np.int64)
+        np.minimum.at(best_rank, series.cik[candidate], series_rank[candidate])
+        chosen = np.flatnonzero(candidate & (series_rank == best_rank[series.cik]))
+
+        # Expand the chosen series' slices into row indices, remembering each row's series.
+        first = series.first[chosen]
+        lengths = series.stop[chosen] - first
+        owner = np.repeat(np.arange(chosen.size), lengths)
+        rows = np.arange(int(lengths.sum())) + np.repeat(
+            first - (np.cumsum(lengths) - lengths), lengths
+        )
+
+        if form_filter:
+            # A form filter that matches nothing within a series keeps all of its rows.
+            matches = np.isin(columns.form[rows], self._forms.codes_with_prefix(form_filter))
+            has_match = np.bincount(owner, weights=matches, minlength=chosen.size) > 0
+            keep = matches | ~has_match[owner]
+            rows, owner = rows[keep], owner[keep]
+
+        unit_priority = np.zeros(len(self._unit_names), dtype=np.int64)
+        for position, unit in reversed(list(enumerate(preferred_units))):
+            code = self._unit_names.lookup(unit)
+            if code is not None:
+                unit_priority[code] = len(preferred_units) - position
+        row_series = chosen[owner]
+        row_cik = series.cik[row_series]
+        # Newest key first, then the preferred unit, then the earliest unit and row, which
+        # is the order select() breaks ties in.
+        order = np.lexsort(
+            (rows, -unit_priority[series.unit[row_series]], -_sort_keys(columns, rows), row_cik)
+        )
+        _, group_starts = np.unique(row_cik[order], return_index=True)
+        winners = order[group_starts]
+
+        entity_ciks = list(self._entity_names)
+        row_index = rows[winners].astype(np.int64)
+        winning_series = row_series[winners]
+        return CrossSection(
+            ciks=[entity_ciks[int(code)] for code in series.cik[winning_series]],
+            concepts=[
+                self._concepts.decode(int(code)) or "" for code in series.concept[winning_series]
+            ],
+            units=[
+                self._unit_names.decode(int(code)) or "" for code in series.unit[winning_series]
+            ],
+            rows=row_index,
+            values=columns.value[row_index],
+        )
+
+    def decode_row(self, row: int) -> FactRow:
+        return self._decode(self._frozen(), row)
+
+    def _select_rows(
+        self,
+        columns: _Chunk,
+        cik: str,
+        concept: str,
+        form_codes: np.ndarray | None,
+        preferred_units: Sequence[str],
+        distinct_periods: bool = False,
+    ) -> tuple[str, np.ndarray, np.ndarray] | None:
+        best: tuple[tuple[int, int], str, np.ndarray, np.ndarray] | None = None
+        for unit in self._units.get((cik, concept), ()):
+            first, stop = self._slices[(cik, concept, unit)]
+            rows = np.arange(first, stop)
+            if form_codes is not None:
+                matching = rows[np.isin(columns.form[first:stop], form_codes)]
+                if matching.size:
+                    rows = matching
+            if distinct_periods:
+                rows = _latest_per_period(columns, rows)
+            keys = _sort_keys(columns, rows)
+            priority = (
+                len(preferred_units) - list(preferred_units).index(unit)
+                if unit in preferred_units
+                else 0
+            )
+            rank = (int(keys.max()), priority)
+            if best is None or rank > best[0]:
+                best = (rank, unit, rows, keys)
+        if best is None:
+            return None
+        _, unit, rows, keys = best
+        return unit, rows, keys
+
+    def _series_table(self) -> _Series:
+        """Return per-series metadata for the current load, rebuilt after each load."""
+        cached = self._series
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        cik_index = {cik: position for position, cik in enumerate(self._entity_names)}
+        fields: tuple[list[int], ...] = ([], [], [], [], [])
+        ciks, concepts, units, firsts, stops = fields
+        for (cik, concept, unit), (first, stop) in self._slices.items():
+            ciks.append(cik_index[cik])
+            concepts.append(self._concepts.encode(concept))
+            units.append(self._unit_names.encode(unit))
+            firsts.append(first)
+            stops.append(stop)
+        table = _Series(
+            cik=np.array(ciks, dtype=np.int64),
+            concept=np.array(concepts, dtype=np.int64),
+            unit=np.array(units, dtype=np.int64),
+            first=np.array(firsts, dtype=np.int64),
+            stop=np.array(stops, dtype=np.int64),
+        )
+        self._series = (self._version, table)
+        return table
+
+    def _frozen(self) -> _Chunk:
+        if self._pending:
+            chunks = ([self._columns] if self._columns is not None else []) + self._pending
+            self._columns = _Chunk(
+                *(np.concatenate([chunk[field] for chunk in chunks]) for field in range(8))
+            )
+            self._row_count += self._pending_rows
+            self._pending = []
+            self._pending_rows = 0
+        if self._columns is None:
+            empty_int = np.empty(0, dtype=np.int32)
+            self._columns = _Chunk(
+                empty_int,
+                empty_int,
+                empty_int,
+                empty_int,
+                np.empty(0, dtype=np.int16),
+                np.empty(0, dtype=np.int16),
+                np.empty(0, dtype=np.float64),
+                np.empty(0, dtype="S20"),
+            )
+        return self._columns
+
+    def _decode(self, columns: _Chunk, row: int) -> FactRow:
+        value = float(columns.value[row])
+        fiscal_year = int(columns.fiscal_year[row])
+        return FactRow(
+            fiscal_year=fiscal_year or None,
+            fiscal_period=self._periods.decode(int(columns.fiscal_period[row])),
+            form=self._forms.decode(int(columns.form[row])),
+            start=_from_ordinal(int(columns.start[row])),
+            end=_from_ordinal(int(columns.end[row])),
+            filed=_from_ordinal(int(columns.filed[row])),
+            value=None if np.isnan(value) else value,
+            accession=columns.accession[row].decode() or None,
+        )
+
+
+def _sort_keys(columns: _Chunk, rows: np.ndarray) -> np.ndarray:
+    years = columns.fiscal_year[rows].astype(np.int64)
+    filed = columns.filed[rows].astype(np.int64)
+    end = columns.end[rows].astype(np.int64)
+    return (years << (2 * _ORDINAL_BITS)) | (filed << _ORDINAL_BITS) | end
+
+
+def _latest_per_period(columns: _Chunk, rows: np.ndarray) -> np.ndarray:
+    # Group by (start, end) with the latest filed, then latest row, last in each group.
+    order = np.lexsort((rows, columns.filed[rows], columns.end[rows], columns.start[rows]))
+    ordered = rows[order]
+    start = columns.start[ordered]
+    end = columns.end[ordered]
+    last = np.ones(ordered.size, dtype=bool)
+    last[:-1] = (start[1:] != start[:-1]) | (end[1:] != end[:-1])
+    return np.sort(ordered[last])
+
+
+def _ordinal(value: Any) -> int:
+    day = parse_date(value)
+    return day.toordinal() if day else _MISSING
+
+
+def _from_ordinal(value: int) -> date | None:
+    return date.fromordinal(value) if value != _MISSING else None
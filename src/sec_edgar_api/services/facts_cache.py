@@ -0,0 +1,135 @@
+"""In-memory cache of parsed companyfacts payloads."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from ..metrics import CACHE_LOOKUPS
+from .company_facts import CompanyFacts
+
+# Rough CPython footprint of one decoded fact entry: the dict itself plus its date,
+# form, accession and numeric values. Walking every object with sys.getsizeof would
+# cost as much as the decode, so sizes are estimated from entry counts instead.
+_ENTRY_BYTES = 700
+_CONCEPT_BYTES = 1_000
+
+
+def estimate_facts_size(payload: Mapping[str, Any]) -> int:
+    """Estimate the resident size in bytes of a decoded companyfacts payload.
+
+    A ``CompanyFacts`` view also counts the normalized views memoized so far.
+    """
+    size = _CONCEPT_BYTES + (payload.memo_bytes if isinstance(payload, CompanyFacts) else 0)
+    for taxonomy in (payload.get("facts") or {}).values():
+        for concept in taxonomy.values():
+            size += _CONCEPT_BYTES
+            for entries in (concept.get("units") or {}).values():
+                size += len(entries) * _ENTRY_BYTES
+    return size
+
+
+@dataclass
+class FactsCacheStats:
+    """Hit/miss counters for the facts cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class CompanyFactsCache:
+    """Byte-bounded LRU of parsed companyfacts keyed by CIK, with single-flight loading.
+
+    Concurrent misses for the same CIK share one loader task, so N simultaneous
+    requests trigger a single download. The shared task is shielded: a cancelled
+    caller does not abort the fetch the others are waiting on. ``CompanyFacts`` entries
+    are re-charged as their memoized views grow, so those count against the budget too.
+    """
+
+    def __init__(self, *, max_bytes: int = 512 * 1024**2, ttl: float = 900.0) -> None:
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, int, Mapping[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Mapping[str, Any]]] = {}
+        self._total_bytes = 0
+        self.stats = FactsCacheStats()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    async def get_or_load(
+        self, cik: str, loader: Callable[[], Awaitable[Mapping[str, Any]]]
+    ) -> Mapping[str, Any]:
+        """Return the cached payload for ``cik``, loading it at most once concurrently."""
+        cached = self._entries.get(cik)
+        if cached is not None:
+            stored_at, _, payload = cached
+            if time.monotonic() - stored_at < self._ttl:
+                self._entries.move_to_end(cik)
+                self.stats.hits += 1
+                CACHE_LOOKUPS.inc(cache="facts", result="hit")
+                return payload
+            self._remove(cik)
+
+        task = self._inflight.get(cik)
+        if task is not None:
+            self.stats.coalesced += 1
+            CACHE_LOOKUPS.inc(cache="facts", result="coalesced")
+        else:
+            self.stats.misses += 1
+            CACHE_LOOKUPS.inc(cache="facts", result="miss")
+            task = asyncio.ensure_future(self._load(cik, loader))
+            self._inflight[cik] = task
+        return await asyncio.shield(task)
+
+    def invalidate(self, cik: str) -> None:
+        self._remove(cik)
+
+    async def _load(
+        self, cik: str, loader: Callable[[], Awaitable[Mapping[str, Any]]]
+    ) -> Mapping[str, Any]:
+        try:
+            payload = await loader()
+        finally:
+            self._inflight.pop(cik, None)
+        self._store(cik, payload)
+        return payload
+
+    def _store(self, cik: str, payload: Mapping[str, Any]) -> None:
+        size = estimate_facts_size(payload)
+        if size > self._max_bytes:
+            return
+        self._remove(cik)
+        self._entries[cik] = (time.monotonic(), size, payload)
+        self._total_bytes += size
+        if isinstance(payload, CompanyFacts):
+            payload.on_growth = partial(self._grow, cik, payload)
+        self._evict()
+
+    def _grow(self, cik: str, payload: Mapping[str, Any], added: int) -> None:
+        entry = self._entries.get(cik)
+        if entry is None or entry[2] is not payload:
+            return
+        stored_at, size, _ = entry
+        self._entries[cik] = (stored_at, size + added, payload)
+        self._total_bytes += added
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self._max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, cik: str) -> None:
+        entry = self._entries.pop(cik, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
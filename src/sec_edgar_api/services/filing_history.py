@@ -0,0 +1,135 @@
+"""Cursor-paginated access to a company's full filing history."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Mapping
+from typing import Any, NamedTuple
+
+from ..clients.sec_client import SECEdgarClient
+from ..clients.submissions import FilingRecord, SubmissionsParser, SubmissionsShard
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class HistoryPosition(NamedTuple):
+    """The last filing a page returned; the next page resumes right after it.
+
+    Keyed on the filing itself rather than a row offset, so filings the SEC prepends to
+    ``recent`` between requests do not shift the position.
+    """
+
+    filing_date: str
+    accession_number: str
+
+    @classmethod
+    def at(cls, record: FilingRecord) -> HistoryPosition:
+        return cls(record.filing_date or "", record.accession_number)
+
+    def encode(self) -> str:
+        raw = f"{self.filing_date}|{self.accession_number}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str | None) -> HistoryPosition | None:
+        if not cursor:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursorError(cursor) from None
+        filing_date, separator, accession_number = raw.partition("|")
+        if not separator or not accession_number:
+            raise InvalidCursorError(cursor)
+        return cls(filing_date, accession_number)
+
+
+class FilingHistory:
+    """Pages through the ``recent`` block and the older submissions shards behind it.
+
+    Shards are fetched only when a page reaches them and are kept in a small LRU: their
+    contents never change once published, so deep pages are served without refetching.
+    """
+
+    def __init__(
+        self,
+        client: SECEdgarClient,
+        parser: SubmissionsParser,
+        *,
+        max_cached_shards: int = 128,
+    ) -> None:
+        self._client = client
+        self._parser = parser
+        self._max_cached_shards = max_cached_shards
+        self._shards: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+
+    async def page(
+        self,
+        cik: str,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        form_predicate: Callable[[str], bool] | None = None,
+    ) -> tuple[list[FilingRecord], str | None]:
+        """Return up to ``limit`` matching filings from ``cursor`` on, and the next cursor."""
+        position = HistoryPosition.decode(cursor)
+        records: list[FilingRecord] = []
+        async for record in self._iter_after(cik, position, form_predicate):
+            records.append(record)
+            if len(records) >= limit:
+                return records, HistoryPosition.at(record).encode()
+        return records, None
+
+    async def _iter_after(
+        self,
+        cik: str,
+        position: HistoryPosition | None,
+        form_predicate: Callable[[str], bool] | None,
+    ) -> AsyncIterator[FilingRecord]:
+        """Yield matching filings newest first, starting right after ``position``.
+
+        Filings dated after the position were already served, as were those on its date
+        up to and including its accession number. If that filing is gone, the first
+        older filing resumes the walk.
+        """
+        payload = await self._client.fetch_submissions(cik)
+        identity = self._parser.identity(payload)
+        blocks: list[SubmissionsShard | None] = [None, *self._parser.shards(payload)]
+        for block in blocks:
+            if block is None:
+                columns = payload.get("filings", {}).get("recent", {})
+            elif (
+                position is not None
+                and block.filing_from is not None
+                and block.filing_from > position.filing_date
+            ):
+                # The whole shard is newer than the position; skip fetching it.
+                continue
+            else:
+                columns = await self._load_shard(block.name)
+            for record in self._parser.iter_rows(columns, identity, form_predicate=form_predicate):
+                if position is not None:
+                    filing_date = record.filing_date or ""
+                    if filing_date > position.filing_date:
+                        continue
+                    if filing_date == position.filing_date:
+                        if record.accession_number == position.accession_number:
+                            position = None
+                        continue
+                    position = None
+                yield record
+
+    async def _load_shard(self, name: str) -> Mapping[str, Any]:
+        columns = self._shards.get(name)
+        if columns is not None:
+            self._shards.move_to_end(name)
+            return columns
+        columns = await self._client.fetch_submissions_shard(name)
+        self._shards[name] = columns
+        while len(self._shards) > self._max_cached_shards:
+            self._shards.popitem(last=False)
+        return columns
@@ -2,17 +2,40 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any, Iterable, Mapping, Sequence
+import asyncio
+from datetime import date
+from functools import partial
+from operator import attrgetter
+from typing import Any, AsyncIterator, Collection, Iterable, Mapping, Sequence
 
 from ..clients.sec_client import SECEdgarClient
+from ..metrics import FINANCIALS_EXTRACT_SECONDS
 from ..models.financials import (
+    BatchFinancialsItem,
+    BatchStatement,
+    CompanyConceptSeries,
     CompanyFinancialSnapshot,
     CompanyIncomeStatement,
+    ConceptSeries,
     FinancialMetric,
     FinancialMetricSeries,
+    SeriesObservation,
+    SeriesPeriod,
 )
 from ..models.filings import CompanySummary
+from ..timing import phase
+from .company_facts import CompanyFacts, DatedEntry, NormalizedEntry, filter_by_form
+from .fact_store import ColumnarFactStore, FactRow
+from .facts_cache import CompanyFactsCache
+from .local_store import LocalEdgarStore
+from .ticker_registry import TickerRegistry
+
+# Monetary units, most preferred first, used to break ties between a concept's units.
+PREFERRED_UNITS: tuple[str, ...] = ("USD", "USDm", "USDmm", "USDMillions")
+
+
+class InvalidConceptError(ValueError):
+    """Raised when a requested series concept names an unsupported taxonomy."""
 
 
 class FinancialsService:
@@ -58,24 +81,158 @@ class FinancialsService:
         "eps_basic": "EarningsPerShareBasic",
         "eps_diluted": "EarningsPerShareDiluted",
     }
-    _PREFERRED_UNITS = ("USD", "USDm", "USDmm", "USDMillions")
+    # Taxonomies searched, in order, for concepts requested without a prefix.
+    SERIES_TAXONOMIES = ("us-gaap", "ifrs-full", "dei")
 
-    def __init__(self, client: SECEdgarClient) -> None:
+    def __init__(
+        self,
+        client: SECEdgarClient,
+        ticker_registry: TickerRegistry | None = None,
+        facts_cache: CompanyFactsCache | None = None,
+        local_store: LocalEdgarStore | None = None,
+        max_concurrent_requests: int = 5,
+    ) -> None:
         self._client = client
+        self._tickers = ticker_registry or TickerRegistry(client)
+        self._facts_cache = facts_cache or CompanyFactsCache()
+        self._local_store = local_store
+        self._batch_semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    @classmethod
+    def tracked_concepts(cls) -> set[str]:
+        """Return every us-gaap concept name the service may read."""
+        names: set[str] = set()
+        for concepts in (cls.FINANCIAL_CONCEPTS, cls.INCOME_STATEMENT_CONCEPTS):
+            for concept in concepts.values():
+                names.update((concept,) if isinstance(concept, str) else concept)
+        return names
+
+    @classmethod
+    def statement_metrics(cls, statement: BatchStatement) -> Mapping[str, Sequence[str] | str]:
+        """Return the metric aliases, and their concepts, that make up ``statement``."""
+        if statement == "income_statement":
+            return cls.INCOME_STATEMENT_CONCEPTS
+        return cls.FINANCIAL_CONCEPTS
 
     async def fetch_financial_snapshot(self, ticker: str) -> CompanyFinancialSnapshot | None:
         """Return the latest financial metrics for the requested ticker."""
         summary = await self._resolve_company(ticker)
         if summary is None:
             return None
-        facts_payload = await self._client.fetch_company_facts(summary.cik)
-        metrics = self._extract_metrics(
-            facts_payload,
-            concepts=self.FINANCIAL_CONCEPTS,
+        return await self._build_snapshot(summary)
+
+    async def fetch_income_statement(self, ticker: str) -> CompanyIncomeStatement | None:
+        """Return the latest income statement metrics constrained to 10-K filings."""
+        summary = await self._resolve_company(ticker)
+        if summary is None:
+            return None
+        return await self._build_income_statement(summary)
+
+    async def fetch_concept_series(
+        self,
+        ticker: str,
+        concepts: Sequence[str],
+        *,
+        period: SeriesPeriod | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> CompanyConceptSeries | None:
+        """Return deduplicated time series for arbitrary concepts, optionally filtered.
+
+        Concepts may be qualified (``dei:EntityCommonStockSharesOutstanding``); bare
+        names resolve against ``SERIES_TAXONOMIES`` in order. ``start``/``end`` bound
+        the period end date, inclusive.
+        """
+        requested = [self._parse_series_concept(concept) for concept in concepts]
+        summary = await self._resolve_company(ticker)
+        if summary is None:
+            return None
+        with phase("facts"):
+            facts = await self._load_series_facts(summary.cik, {name for _, name in requested})
+        with phase("extract"):
+            series = [
+                self._build_concept_series(
+                    facts, taxonomy, name, period=period, start=start, end=end
+                )
+                for taxonomy, name in requested
+            ]
+        return CompanyConceptSeries(
+            cik=summary.cik,
+            ticker=summary.ticker,
+            company_name=facts.get("entityName") or summary.title,
+            period=period,
+            series=series,
+        )
+
+    async def fetch_batch(
+        self,
+        tickers: Sequence[str],
+        *,
+        statement: BatchStatement = "snapshot",
+        metrics: Collection[str] | None = None,
+    ) -> list[BatchFinancialsItem]:
+        """Return one result per requested ticker, in request order."""
+        items = {
+            item.ticker: item
+            async for item in self.iter_batch(tickers, statement=statement, metrics=metrics)
+        }
+        return [items[ticker.strip().upper()] for ticker in tickers]
+
+    async def iter_batch(
+        self,
+        tickers: Sequence[str],
+        *,
+        statement: BatchStatement = "snapshot",
+        metrics: Collection[str] | None = None,
+    ) -> AsyncIterator[BatchFinancialsItem]:
+        """Yield per-ticker results as they complete.
+
+        Tickers resolve against the shared registry in one pass; facts downloads run
+        concurrently through the client's rate limiter and the facts cache, and failures
+        are reported on the item instead of aborting the batch. ``metrics`` narrows each
+        result to those aliases of ``statement``; unknown aliases are ignored.
+        """
+        unique_tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers))
+        tasks = [
+            asyncio.create_task(self._batch_item(ticker, statement, metrics))
+            for ticker in unique_tickers
+        ]
+        try:
+            for next_item in asyncio.as_completed(tasks):
+                yield await next_item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _batch_item(
+        self, ticker: str, statement: BatchStatement, metrics: Collection[str] | None
+    ) -> BatchFinancialsItem:
+        try:
+            summary = await self._resolve_company(ticker)
+            if summary is None:
+                return BatchFinancialsItem(ticker=ticker, error=f"Ticker '{ticker}' not found.")
+            async with self._batch_semaphore:
+                if statement == "income_statement":
+                    result: (
+                        CompanyFinancialSnapshot | CompanyIncomeStatement
+                    ) = await self._build_income_statement(summary, metrics)
+                else:
+                    result = await self._build_snapshot(summary, metrics)
+        except Exception as exc:
+            # Any per-ticker failure is reported on its item; the batch keeps going.
+            return BatchFinancialsItem(ticker=ticker, error=str(exc) or type(exc).__name__)
+        return BatchFinancialsItem(ticker=ticker, result=result)
+
+    async def _build_snapshot(
+        self, summary: CompanySummary, only: Collection[str] | None = None
+    ) -> CompanyFinancialSnapshot:
+        metrics, entity_name = await self._collect_metrics(
+            summary.cik,
+            concepts=_restrict(self.FINANCIAL_CONCEPTS, only),
             history_lengths={"revenues": 3},
             series_form_filters={"revenues": "10-K"},
         )
-        company_name = facts_payload.get("entityName") or summary.title
+        company_name = entity_name or summary.title
 
         return CompanyFinancialSnapshot(
             cik=summary.cik,
@@ -84,19 +241,16 @@ class FinancialsService:
             metrics=metrics,
         )
 
-    async def fetch_income_statement(self, ticker: str) -> CompanyIncomeStatement | None:
-        """Return the latest income statement metrics constrained to 10-K filings."""
-        summary = await self._resolve_company(ticker)
-        if summary is None:
-            return None
-        facts_payload = await self._client.fetch_company_facts(summary.cik)
-        metrics = self._extract_metrics(
-            facts_payload,
-            concepts=self.INCOME_STATEMENT_CONCEPTS,
+    async def _build_income_statement(
+        self, summary: CompanySummary, only: Collection[str] | None = None
+    ) -> CompanyIncomeStatement:
+        metrics, entity_name = await self._collect_metrics(
+            summary.cik,
+            concepts=_restrict(self.INCOME_STATEMENT_CONCEPTS, only),
             form_filter="10-K",
             history_lengths={"revenues": 3},
         )
-        company_name = facts_payload.get("entityName") or summary.title
+        company_name = entity_name or summary.title
         return CompanyIncomeStatement(
             cik=summary.cik,
             ticker=summary.ticker,
@@ -106,9 +260,135 @@ class FinancialsService:
         )
 
     async def _resolve_company(self, ticker: str) -> CompanySummary | None:
-        summaries = await self._client.fetch_company_tickers()
-        ticker_upper = ticker.upper()
-        return next((summary for summary in summaries if summary.ticker == ticker_upper), None)
+        with phase("lookup"):
+            return await self._tickers.get_by_ticker(ticker)
+
+    async def _collect_metrics(
+        self,
+        cik: str,
+        *,
+        concepts: Mapping[str, Sequence[str] | str],
+        form_filter: str | None = None,
+        history_lengths: Mapping[str, int] | None = None,
+        series_form_filters: Mapping[str, str | None] | None = None,
+    ) -> tuple[dict[str, FinancialMetric | FinancialMetricSeries], str | None]:
+        """Extract metrics for ``cik`` and return them with the company's entity name.
+
+        Companies loaded into the local columnar fact store are answered from it;
+        everyone else goes through the (cached) companyfacts download.
+        """
+        if self._local_store is not None and self._local_store.facts.has_company(cik):
+            store = self._local_store.facts
+            with phase("extract"), FINANCIALS_EXTRACT_SECONDS.time(source="columnar"):
+                metrics = self._extract_metrics_columnar(
+                    store,
+                    cik,
+                    concepts=concepts,
+                    form_filter=form_filter,
+                    history_lengths=history_lengths,
+                    series_form_filters=series_form_filters,
+                )
+            return metrics, store.entity_name(cik)
+        with phase("facts"):
+            facts_payload = await self._load_facts(cik)
+        with phase("extract"), FINANCIALS_EXTRACT_SECONDS.time(source="companyfacts"):
+            metrics = self._extract_metrics(
+                facts_payload,
+                concepts=concepts,
+                form_filter=form_filter,
+                history_lengths=history_lengths,
+                series_form_filters=series_form_filters,
+            )
+        return metrics, facts_payload.get("entityName")
+
+    async def _load_facts(self, cik: str) -> Mapping[str, Any]:
+        return await self._facts_cache.get_or_load(
+            cik,
+            lambda: self._fetch_company_facts(cik),
+        )
+
+    async def _fetch_company_facts(self, cik: str) -> CompanyFacts:
+        # Cached as a CompanyFacts view so normalized entries live as long as the payload.
+        payload = await self._client.fetch_company_facts(cik, concepts=self.tracked_concepts())
+        return CompanyFacts.wrap(payload)
+
+    async def _load_series_facts(self, cik: str, names: set[str]) -> CompanyFacts:
+        if names <= self.tracked_concepts():
+            return CompanyFacts.wrap(await self._load_facts(cik))
+        # Other concepts share one cache entry per company. A request for concepts it
+        # lacks re-decodes the union, so the entry only ever widens.
+        # The loop re-checks after every load: a concurrent request may have joined an
+        # in-flight decode of a narrower set.
+        key = f"{cik}:series"
+        wanted = frozenset(names)
+        while True:
+            facts = CompanyFacts.wrap(
+                await self._facts_cache.get_or_load(
+                    key, partial(self._fetch_series_facts, cik, wanted)
+                )
+            )
+            if facts.decoded_concepts is None or names <= facts.decoded_concepts:
+                return facts
+            wanted = facts.decoded_concepts | names
+            self._facts_cache.invalidate(key)
+
+    async def _fetch_series_facts(self, cik: str, names: Iterable[str]) -> CompanyFacts:
+        concepts = frozenset(names)
+        payload = await self._client.fetch_company_facts(cik, concepts=concepts)
+        return CompanyFacts(payload, decoded_concepts=concepts)
+
+    def _parse_series_concept(self, concept: str) -> tuple[str | None, str]:
+        taxonomy, separator, name = concept.strip().rpartition(":")
+        if not separator:
+            return None, name
+        if taxonomy not in self.SERIES_TAXONOMIES or not name:
+            raise InvalidConceptError(concept)
+        return taxonomy, name
+
+    def _build_concept_series(
+        self,
+        facts: CompanyFacts,
+        taxonomy: str | None,
+        name: str,
+        *,
+        period: SeriesPeriod | None,
+        start: date | None,
+        end: date | None,
+    ) -> ConceptSeries:
+        all_facts = facts.get("facts") or {}
+        candidates = (taxonomy,) if taxonomy else self.SERIES_TAXONOMIES
+        found = next((tax for tax in candidates if name in (all_facts.get(tax) or {})), None)
+        if found is None:
+            return ConceptSeries(taxonomy=taxonomy, concept=name, label=None, units={})
+        index = facts.series_index(found, name)
+        units = {
+            unit: [
+                self._build_observation(entry)
+                for entry in index.query(unit, period=period, start=start, end=end)
+            ]
+            for unit in index.units
+        }
+        return ConceptSeries(
+            taxonomy=found,
+            concept=name,
+            label=all_facts[found][name].get("label"),
+            units={unit: observations for unit, observations in units.items() if observations},
+        )
+
+    @staticmethod
+    def _build_observation(entry: DatedEntry) -> SeriesObservation:
+        raw = entry.raw
+        numeric_value = raw.get("val")
+        return SeriesObservation(
+            start_date=entry.start,
+            end_date=entry.end,
+            value=float(numeric_value) if isinstance(numeric_value, (int, float)) else None,
+            fiscal_year=raw.get("fy"),
+            fiscal_period=raw.get("fp"),
+            form=raw.get("form"),
+            filing_date=entry.filed,
+            accession_number=raw.get("accn"),
+        )
 
     def _extract_metrics(
         self,
@@ -121,15 +401,25 @@ class FinancialsService:
     ) -> dict[str, FinancialMetric | FinancialMetricSeries]:
         results: dict[str, FinancialMetric | FinancialMetricSeries] = {}
         series_form_filters = series_form_filters or {}
-        us_gaap = payload.get("facts", {}).get("us-gaap", {})
+        facts = CompanyFacts.wrap(payload)
+        us_gaap = facts.get("facts", {}).get("us-gaap", {})
         for alias, concept in concepts.items():
             selected_concept, fact_payload = self._resolve_concept_payload(us_gaap, concept)
+            units = facts.normalized_units("us-gaap", selected_concept) if selected_concept else {}
             history_length = (history_lengths or {}).get(alias)
             if history_length and history_length > 1:
                 alias_form_filter = series_form_filters.get(alias, form_filter)
+                # History lists distinct periods: restated comparatives resolve to the
+                # latest filing instead of repeating a period once per 10-K.
+                distinct = (
+                    facts.distinct_units("us-gaap", selected_concept, alias_form_filter)
+                    if selected_concept
+                    else {}
+                )
                 results[alias] = self._build_metric_series(
                     concept=selected_concept or self._first_concept_name(concept),
                     payload=fact_payload,
+                    units=distinct,
                     form_filter=alias_form_filter,
                     history_length=history_length,
                 )
@@ -138,10 +428,84 @@ class FinancialsService:
                 results[alias] = self._build_metric(
                     concept=selected_concept or self._first_concept_name(concept),
                     payload=fact_payload,
+                    units=units,
                     form_filter=alias_form_filter,
                 )
         return results
 
+    def _extract_metrics_columnar(
+        self,
+        store: ColumnarFactStore,
+        cik: str,
+        *,
+        concepts: Mapping[str, Sequence[str] | str],
+        form_filter: str | None = None,
+        history_lengths: Mapping[str, int] | None = None,
+        series_form_filters: Mapping[str, str | None] | None = None,
+    ) -> dict[str, FinancialMetric | FinancialMetricSeries]:
+        """Columnar counterpart of ``_extract_metrics`` with identical selection rules."""
+        results: dict[str, FinancialMetric | FinancialMetricSeries] = {}
+        series_form_filters = series_form_filters or {}
+        for alias, concept in concepts.items():
+            concept_names = (concept,) if isinstance(concept, str) else concept
+            selected_concept = next(
+                (name for name in concept_names if store.has_concept(cik, name)), None
+            )
+            concept_name = selected_concept or self._first_concept_name(concept)
+            label = (selected_concept and store.label(cik, selected_concept)) or concept_name
+            history_length = (history_lengths or {}).get(alias)
+            is_series = bool(history_length and history_length > 1)
+            unit: str | None = None
+            rows: list[FactRow] = []
+            if selected_concept is not None:
+                unit, rows = store.select(
+                    cik,
+                    selected_concept,
+                    form_filter=series_form_filters.get(alias, form_filter),
+                    limit=history_length if is_series and history_length else 1,
+                    distinct_periods=is_series,
+                    preferred_units=PREFERRED_UNITS,
+                )
+            observations = [
+                self._build_metric_from_row(concept=concept_name, label=label, row=row, unit=unit)
+                for row in rows
+            ]
+            if is_series:
+                results[alias] = FinancialMetricSeries(
+                    concept=concept_name, label=label, entries=observations
+                )
+            elif observations:
+                results[alias] = observations[0]
+            else:
+                results[alias] = FinancialMetric(
+                    concept=concept_name,
+                    label=label,
+                    value=None,
+                    unit=None,
+                    fiscal_year=None,
+                    fiscal_period=None,
+                    end_date=None,
+                    filing_date=None,
+                    accession_number=None,
+                )
+        return results
+
+    @staticmethod
+    def _build_metric_from_row(
+        *, concept: str, label: str, row: FactRow, unit: str | None
+    ) -> FinancialMetric:
+        return FinancialMetric(
+            concept=concept,
+            label=label,
+            value=row.value,
+            unit=unit,
+            fiscal_year=row.fiscal_year,
+            fiscal_period=row.fiscal_period,
+            end_date=row.end,
+            filing_date=row.filed,
+            accession_number=row.accession,
+        )
+
     def _resolve_concept_payload(
         self,
         us_gaap: Mapping[str, Any],
@@ -170,6 +534,7 @@ class FinancialsService:
         *,
         concept: str,
         payload: Mapping[str, Any] | None,
+        units: Mapping[str, list[NormalizedEntry]],
         form_filter: str | None = None,
     ) -> FinancialMetric:
         if not payload:
@@ -186,7 +551,6 @@ class FinancialsService:
             )
 
         label = payload.get("label") or concept
-        units: Mapping[str, list[Mapping[str, Any]]] = payload.get("units") or {}
         selected_unit, entries = self._select_entries(units, form_filter=form_filter)
         if not entries:
             return FinancialMetric(
@@ -201,7 +565,7 @@ class FinancialsService:
                 accession_number=None,
             )
 
-        entry = max(entries, key=self._entry_sort_key)
+        entry = max(entries, key=_SORT_KEY)
         return self._build_metric_from_entry(
             concept=concept,
             label=label,
@@ -214,6 +578,7 @@ class FinancialsService:
         *,
         concept: str,
         payload: Mapping[str, Any] | None,
+        units: Mapping[str, list[NormalizedEntry]],
         form_filter: str | None,
         history_length: int,
     ) -> FinancialMetricSeries:
@@ -221,12 +586,11 @@ class FinancialsService:
             return FinancialMetricSeries(concept=concept, label=concept, entries=[])
 
         label = payload.get("label") or concept
-        units: Mapping[str, list[Mapping[str, Any]]] = payload.get("units") or {}
         selected_unit, entries = self._select_entries(units, form_filter=form_filter)
         if not entries:
             return FinancialMetricSeries(concept=concept, label=label, entries=[])
 
-        sorted_entries = sorted(entries, key=self._entry_sort_key, reverse=True)
+        sorted_entries = sorted(entries, key=_SORT_KEY, reverse=True)
         limited = sorted_entries[:history_length]
         observations = [
             self._build_metric_from_entry(
@@ -244,92 +608,65 @@ class FinancialsService:
         *,
         concept: str,
         label: str,
-        entry: Mapping[str, Any],
+        entry: NormalizedEntry,
         unit: str | None,
     ) -> FinancialMetric:
-        numeric_value = entry.get("val")
+        raw = entry.raw
+        numeric_value = raw.get("val")
         value = float(numeric_value) if isinstance(numeric_value, (int, float)) else None
         return FinancialMetric(
             concept=concept,
             label=label,
             value=value,
             unit=unit,
-            fiscal_year=entry.get("fy"),
-            fiscal_period=entry.get("fp"),
-            end_date=self._parse_date(entry.get("end")),
-            filing_date=self._parse_date(entry.get("filed")),
-            accession_number=entry.get("accn"),
+            fiscal_year=raw.get("fy"),
+            fiscal_period=raw.get("fp"),
+            end_date=entry.end,
+            filing_date=entry.filed,
+            accession_number=raw.get("accn"),
         )
 
     def _select_entries(
         self,
-        units: Mapping[str, list[Mapping[str, Any]]],
+        units: Mapping[str, list[NormalizedEntry]],
         *,
         form_filter: str | None = None,
-    ) -> tuple[str | None, list[Mapping[str, Any]]]:
+    ) -> tuple[str | None, list[NormalizedEntry]]:
         if not units:
             return None, []
 
-        candidates: list[tuple[str, list[Mapping[str, Any]], Mapping[str, Any]]] = []
+        candidates: list[tuple[str, list[NormalizedEntry], NormalizedEntry]] = []
         for unit, raw_entries in units.items():
             if not raw_entries:
                 continue
-            filtered_entries = self._filter_by_form(raw_entries, form_filter=form_filter)
+            filtered_entries = filter_by_form(raw_entries, form_filter)
             if not filtered_entries:
                 continue
-            freshest_entry = max(filtered_entries, key=self._entry_sort_key)
+            freshest_entry = max(filtered_entries, key=_SORT_KEY)
             candidates.append((unit, filtered_entries, freshest_entry))
 
         if not candidates:
             return None, []
 
         def unit_priority(unit: str) -> int:
-            if unit in self._PREFERRED_UNITS:
+            if unit in PREFERRED_UNITS:
                 # Higher priority for earlier entries in the preference list.
-                return len(self._PREFERRED_UNITS) - self._PREFERRED_UNITS.index(unit)
+                return len(PREFERRED_UNITS) - PREFERRED_UNITS.index(unit)
             return 0
 
         selected_unit, selected_entries, _ = max(
             candidates,
-            key=lambda item: (self._entry_sort_key(item[2]), unit_priority(item[0])),
+            key=lambda item: (item[2].sort_key, unit_priority(item[0])),
         )
         return selected_unit, selected_entries
 
-    def _filter_by_form(
-        self,
-        entries: list[Mapping[str, Any]],
-        *,
-        form_filter: str | None,
-    ) -> list[Mapping[str, Any]]:
-        if not form_filter:
-            return entries
-        matching = [
-            entry
-            for entry in entries
-            if isinstance(entry.get("form"), str) and entry["form"].upper().startswith(form_filter.upper())
-        ]
-        return matching or entries
-
-    def _entry_sort_key(self, entry: Mapping[str, Any]) -> tuple[int, date, date]:
-        fiscal_year_raw = entry.get("fy")
-        if isinstance(fiscal_year_raw, str):
-            try:
-                fiscal_year = int(fiscal_year_raw)
-            except ValueError:
-                fiscal_year = 0
-        elif isinstance(fiscal_year_raw, int):
-            fiscal_year = fiscal_year_raw
-        else:
-            fiscal_year = 0
-        filed = self._parse_date(entry.get("filed")) or date.min
-        period_end = self._parse_date(entry.get("end")) or date.min
-        return fiscal_year, filed, period_end
 
-    @staticmethod
-    def _parse_date(value: str | None) -> date | None:
-        if not value:
-            return None
-        try:
-            return datetime.strptime(value, "%Y-%m-%d").date()
-        except ValueError:
-            return None
+_SORT_KEY = attrgetter("sort_key")
+
+
+def _restrict(
+    concepts: Mapping[str, Sequence[str] | str], only: Collection[str] | None
+) -> Mapping[str, Sequence[str] | str]:
+    if only is None:
+        return concepts
+    return {name: concept for name, concept in concepts.items() if name in only}
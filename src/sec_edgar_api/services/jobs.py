@@ -0,0 +1,311 @@
+"""Background jobs for full-universe 10-K aggregation."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..clients.submissions import FilingRecord, filing_date_key, to_filings
+from ..models.filings import AggregatedFilings
+from ..models.jobs import JobState, ScanJobRequest, ScanJobStatus
+from .tenk_service import TenKService
+
+logger = logging.getLogger(__name__)
+
+
+class JobNotFoundError(LookupError):
+    """Raised when a job id is unknown to the manager."""
+
+
+@dataclass
+class _ScanJob:
+    job_id: str
+    request: ScanJobRequest
+    state: JobState = "running"
+    companies_total: int | None = None
+    completed_ciks: set[str] = field(default_factory=set)
+    failed_ciks: set[str] = field(default_factory=set)
+    # Per company, so a company scanned again replaces its filings instead of repeating them.
+    filings: dict[str, list[FilingRecord]] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    error: str | None = None
+    task: asyncio.Task[None] | None = None
+    session_started: float = field(default_factory=time.monotonic)
+    session_done: int = 0
+    session_progress_at: float = field(default_factory=time.monotonic)
+    unsaved_progress: list[str] = field(default_factory=list)
+    checkpoint_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def companies_done(self) -> int:
+        return len(self.completed_ciks) + len(self.failed_ciks)
+
+    def status(self) -> ScanJobStatus:
+        elapsed = self.session_progress_at - self.session_started
+        rate = self.session_done / elapsed if self.session_done and elapsed > 0 else None
+        eta: float | None = None
+        if self.state == "running" and rate and self.companies_total is not None:
+            eta = max(0, self.companies_total - self.companies_done) / rate
+        return ScanJobStatus(
+            job_id=self.job_id,
+            state=self.state,
+            limit_per_company=self.request.limit_per_company,
+            max_companies=self.request.max_companies,
+            companies_total=self.companies_total,
+            companies_done=self.companies_done,
+            companies_failed=len(self.failed_ciks),
+            filings_found=sum(len(records) for records in self.filings.values()),
+            rate_per_second=rate,
+            eta_seconds=eta,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            error=self.error,
+        )
+
+    def record(self, cik: str, filings: list[FilingRecord] | None, *, persist: bool) -> None:
+        """Apply one company's outcome and, with ``persist``, queue it for the next checkpoint."""
+        self._apply(cik, filings)
+        if not persist:
+            return
+        dumped = None if filings is None else [asdict(record) for record in filings]
+        self.unsaved_progress.append(json.dumps({"cik": cik, "filings": dumped}))
+
+    def _apply(self, cik: str, filings: list[FilingRecord] | None) -> None:
+        if filings is None:
+            if cik not in self.completed_ciks:
+                self.failed_ciks.add(cik)
+            return
+        self.failed_ciks.discard(cik)
+        self.completed_ciks.add(cik)
+        self.filings[cik] = filings
+
+    def to_checkpoint(self) -> dict[str, Any]:
+        """Job metadata; per-company results live in the append-only progress log."""
+        return {
+            "job_id": self.job_id,
+            "request": self.request.model_dump(),
+            "state": self.state,
+            "companies_total": self.companies_total,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_checkpoint(cls, data: dict[str, Any], progress: list[str]) -> _ScanJob:
+        job = cls(
+            job_id=data["job_id"],
+            request=ScanJobRequest.model_validate(data["request"]),
+            state=data["state"],
+            companies_total=data.get("companies_total"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            error=data.get("error"),
+        )
+        for line in progress:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Torn by a crash mid-append; that company is simply scanned again.
+                continue
+            raw_filings = entry.get("filings")
+            if raw_filings is None:
+                job._apply(entry["cik"], None)
+            else:
+                job._apply(entry["cik"], [FilingRecord(**item) for item in raw_filings])
+        return job
+
+
+class TenKScanJobManager:
+    """Runs 10-K aggregation scans in the background and checkpoints their progress.
+
+    With a ``checkpoint_dir`` every job is persisted as ``<job_id>.json`` (its metadata)
+    plus ``<job_id>.progress.ndjson``, to which each checkpoint appends the companies
+    finished since the last one. Jobs that were still running when the process stopped
+    are picked up by ``resume_pending``: they skip every company already completed and
+    retry the ones that failed. Only the newest ``max_finished_jobs`` finished jobs are
+    kept, in memory and on disk.
+    """
+
+    def __init__(
+        self,
+        tenk_service: TenKService,
+        *,
+        checkpoint_dir: Path | None = None,
+        checkpoint_interval: float = 5.0,
+        max_finished_jobs: int = 100,
+    ) -> None:
+        self._tenk_service = tenk_service
+        self._checkpoint_dir = checkpoint_dir
+        self._checkpoint_interval = checkpoint_interval
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs: dict[str, _ScanJob] = {}
+        if checkpoint_dir is not None:
+            checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+    def start(self, request: ScanJobRequest) -> ScanJobStatus:
+        """Launch a new scan and return its initial status."""
+        job = _ScanJob(job_id=uuid.uuid4().hex, request=request)
+        self._jobs[job.job_id] = job
+        self._launch(job)
+        return job.status()
+
+    def status(self, job_id: str) -> ScanJobStatus:
+        return self._get(job_id).status()
+
+    def results(self, job_id: str) -> AggregatedFilings:
+        """Return the filings collected so far, newest first."""
+        job = self._get(job_id)
+        records = [record for filings in job.filings.values() for record in filings]
+        records.sort(key=filing_date_key, reverse=True)
+        return AggregatedFilings(
+            companies_examined=job.companies_done,
+            companies_failed=len(job.failed_ciks),
+            total_filings=len(records),
+            form_type="10-K",
+            filings=to_filings(records),
+        )
+
+    async def cancel(self, job_id: str) -> ScanJobStatus:
+        """Stop a running job; its partial results remain available."""
+        job = self._get(job_id)
+        if job.state == "running":
+            job.state = "cancelled"
+            await self._stop(job)
+        return job.status()
+
+    async def resume_pending(self) -> list[str]:
+        """Load persisted jobs and restart those that were interrupted mid-scan."""
+        if self._checkpoint_dir is None:
+            return []
+        resumed: list[str] = []
+        for path in sorted(self._checkpoint_dir.glob("*.json")):
+            try:
+                data, progress = await asyncio.to_thread(_read_checkpoint, path)
+                job = _ScanJob.from_checkpoint(data, progress)
+            except (OSError, ValueError, KeyError):
+                logger.warning("Ignoring unreadable job checkpoint %s", path, exc_info=True)
+                continue
+            if job.job_id in self._jobs:
+                continue
+            self._jobs[job.job_id] = job
+            if job.state == "running":
+                self._launch(job)
+                resumed.append(job.job_id)
+        await self._prune()
+        return resumed
+
+    async def aclose(self) -> None:
+        """Stop all running jobs, leaving their checkpoints resumable."""
+        for job in self._jobs.values():
+            await self._stop(job)
+
+    def _get(self, job_id: str) -> _ScanJob:
+        try:
+            return self._jobs[job_id]
+        except KeyError:
+            raise JobNotFoundError(job_id) from None
+
+    def _launch(self, job: _ScanJob) -> None:
+        job.session_started = time.monotonic()
+        job.session_done = 0
+        job.task = asyncio.create_task(self._run(job))
+
+    async def _stop(self, job: _ScanJob) -> None:
+        if job.task is None or job.task.done():
+            return
+        job.task.cancel()
+        try:
+            await job.task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, job: _ScanJob) -> None:
+        try:
+            companies = await self._tenk_service.list_companies(job.request.max_companies)
+            job.companies_total = len(companies)
+            # Failed companies are retried: an outage should not drop them for good.
+            pending = [summary for summary in companies if summary.cik not in job.completed_ciks]
+            last_checkpoint = time.monotonic()
+            async for summary, filings in self._tenk_service.iter_company_filings(
+                pending, job.request.limit_per_company
+            ):
+                job.record(summary.cik, filings, persist=self._checkpoint_dir is not None)
+                job.session_done += 1
+                job.session_progress_at = time.monotonic()
+                job.updated_at = datetime.now(timezone.utc)
+                if time.monotonic() - last_checkpoint >= self._checkpoint_interval:
+                    # Shielded so a cancelled job never leaves a half-finished write behind.
+                    await asyncio.shield(self._checkpoint(job))
+                    last_checkpoint = time.monotonic()
+            job.state = "completed"
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.exception("10-K scan job %s failed", job.job_id)
+            job.state = "failed"
+            job.error = str(exc)
+        finally:
+            job.updated_at = datetime.now(timezone.utc)
+            await asyncio.shield(self._checkpoint(job))
+            if job.state != "running":
+                await asyncio.shield(self._prune())
+
+    async def _checkpoint(self, job: _ScanJob) -> None:
+        if self._checkpoint_dir is None:
+            return
+        path = self._checkpoint_dir / f"{job.job_id}.json"
+        # One write at a time per job, so appends land in order and the final checkpoint
+        # waits for one still in flight when the job was cancelled.
+        async with job.checkpoint_lock:
+            progress, job.unsaved_progress = job.unsaved_progress, []
+            payload = json.dumps(job.to_checkpoint())
+            await asyncio.to_thread(_write_checkpoint, path, payload, progress)
+
+    async def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if job.state != "running"]
+        excess = len(finished) - self._max_finished_jobs
+        if excess <= 0:
+            return
+        finished.sort(key=lambda job: job.updated_at)
+        for job in finished[:excess]:
+            del self._jobs[job.job_id]
+            if self._checkpoint_dir is not None:
+                path = self._checkpoint_dir / f"{job.job_id}.json"
+                await asyncio.to_thread(_remove_checkpoint, path)
+
+
+def _progress_path(path: Path) -> Path:
+    return path.with_suffix(".progress.ndjson")
+
+
+def _read_checkpoint(path: Path) -> tuple[dict[str, Any], list[str]]:
+    data = json.loads(path.read_text())
+    try:
+        progress = _progress_path(path).read_text().splitlines()
+    except FileNotFoundError:
+        progress = []
+    return data, progress
+
+
+def _write_checkpoint(path: Path, payload: str, progress: list[str]) -> None:
+    if progress:
+        with _progress_path(path).open("a") as log:
+            log.write("".join(f"{line}\n" for line in progress))
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(payload)
+    os.replace(tmp_path, path)
+
+
+def _remove_checkpoint(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    _progress_path(path).unlink(missing_ok=True)
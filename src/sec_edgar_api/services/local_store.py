@@ -0,0 +1,45 @@
+"""In-process store for SEC data loaded from local bulk archives."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from ..clients.submissions import FilingRecord
+from .fact_store import ColumnarFactStore
+
+
+class LocalEdgarStore:
+    """Holds per-company 10-K filings and company facts ingested ahead of time.
+
+    Services consult the store before issuing per-company SEC requests, so once the
+    nightly bulk archives are loaded universe-wide queries need no network round trips.
+    """
+
+    def __init__(self) -> None:
+        self._tenk_filings: dict[str, list[FilingRecord]] = {}
+        self._tenk_filings_loaded = False
+        self.facts = ColumnarFactStore()
+
+    @property
+    def company_count(self) -> int:
+        return len(self._tenk_filings.keys() | set(self.facts.ciks()))
+
+    @property
+    def has_tenk_filings(self) -> bool:
+        """Whether a bulk submissions archive has seeded the store's 10-K filings."""
+        return self._tenk_filings_loaded
+
+    def mark_tenk_filings_loaded(self) -> None:
+        self._tenk_filings_loaded = True
+
+    def put_tenk_filings(self, cik: str, filings: list[FilingRecord]) -> None:
+        self._tenk_filings[cik] = filings
+
+    def tenk_filings_for(self, cik: str) -> list[FilingRecord] | None:
+        """Return the stored 10-K filings for ``cik``, newest first, or ``None`` if unknown."""
+        return self._tenk_filings.get(cik)
+
+    def put_facts(self, cik: str, payload: Mapping[str, Any]) -> None:
+        """Normalize a companyfacts payload into the columnar fact store."""
+        self.facts.add_company(cik, payload)
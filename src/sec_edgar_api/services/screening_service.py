@@ -0,0 +1,130 @@
+"""Cross-sectional screening of financial metrics across the local fact store."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from ..models.financials import FinancialMetric, ScreenResponse, ScreenResult
+from .fact_store import CrossSection
+from .financials_service import PREFERRED_UNITS, FinancialsService
+from .local_store import LocalEdgarStore
+from .ticker_registry import TickerRegistry
+
+
+class UnknownMetricError(ValueError):
+    """Raised when a screen names a metric outside ``FINANCIAL_CONCEPTS``."""
+
+
+class ScreeningService:
+    """Ranks every company in the local fact store by one ``FINANCIAL_CONCEPTS`` metric.
+
+    Each metric's cross-section (one latest value per company) is built once per load
+    of the fact store and cached; a screen is then a vectorized range filter plus an
+    ``argpartition`` top-k over that column.
+    """
+
+    METRICS = FinancialsService.FINANCIAL_CONCEPTS
+    # Same form constraint the snapshot applies to its revenue series.
+    _FORM_FILTERS: dict[str, str] = {"revenues": "10-K"}
+
+    def __init__(
+        self, local_store: LocalEdgarStore, ticker_registry: TickerRegistry | None = None
+    ) -> None:
+        self._local_store = local_store
+        self._tickers = ticker_registry
+        self._sections: dict[str, tuple[int, CrossSection]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether any company facts have been loaded to screen over."""
+        return bool(self._local_store.facts.ciks())
+
+    async def screen(
+        self,
+        metric: str,
+        *,
+        minimum: float | None = None,
+        maximum: float | None = None,
+        descending: bool = True,
+        limit: int = 100,
+    ) -> ScreenResponse:
+        """Return up to ``limit`` companies whose latest ``metric`` lies in range."""
+        section = await self._cross_section(metric)
+        values = section.values
+        mask = ~np.isnan(values)
+        if minimum is not None:
+            mask &= values >= minimum
+        if maximum is not None:
+            mask &= values <= maximum
+        candidates = np.flatnonzero(mask)
+        ranked = self._top_k(values[candidates], limit, descending)
+
+        results: list[ScreenResult] = []
+        store = self._local_store.facts
+        for position in ranked:
+            index = int(candidates[position])
+            cik = section.ciks[index]
+            row = store.decode_row(int(section.rows[index]))
+            concept = section.concepts[index]
+            summary = await self._tickers.get_by_cik(cik) if self._tickers else None
+            results.append(
+                ScreenResult(
+                    cik=cik,
+                    ticker=summary.ticker if summary else None,
+                    company_name=store.entity_name(cik) or (summary.title if summary else None),
+                    metric=FinancialMetric(
+                        concept=concept,
+                        label=store.label(cik, concept) or concept,
+                        value=row.value,
+                        unit=section.units[index],
+                        fiscal_year=row.fiscal_year,
+                        fiscal_period=row.fiscal_period,
+                        end_date=row.end,
+                        filing_date=row.filed,
+                        accession_number=row.accession,
+                    ),
+                )
+            )
+        return ScreenResponse(
+            metric=metric,
+            companies_screened=len(section.ciks),
+            total_matches=int(candidates.size),
+            results=results,
+        )
+
+    async def _cross_section(self, metric: str) -> CrossSection:
+        concept = self.METRICS.get(metric)
+        if concept is None:
+            raise UnknownMetricError(metric)
+        store = self._local_store.facts
+        cached = self._sections.get(metric)
+        if cached is not None and cached[0] == store.version:
+            return cached[1]
+        async with self._lock:
+            cached = self._sections.get(metric)
+            if cached is not None and cached[0] == store.version:
+                return cached[1]
+            version = store.version
+            section = await asyncio.to_thread(
+                store.cross_section,
+                (concept,) if isinstance(concept, str) else tuple(concept),
+                form_filter=self._FORM_FILTERS.get(metric),
+                preferred_units=PREFERRED_UNITS,
+            )
+            self._sections[metric] = (version, section)
+            return section
+
+    @staticmethod
+    def _top_k(values: np.ndarray, limit: int, descending: bool) -> np.ndarray:
+        """Return positions of the ``limit`` best values, best first."""
+        if not values.size or limit <= 0:
+            return np.empty(0, dtype=np.int64)
+        scores = -values if descending else values
+        if limit < values.size:
+            partition = np.argpartition(scores, limit - 1)[:limit]
+        else:
+            partition = np.arange(values.size)
+        return partition[np.argsort(scores[partition], kind="stable")]
@@ -0,0 +1,174 @@
+"""Incremental 10-K sync driven by the EDGAR daily master index."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from pathlib import Path
+from typing import NamedTuple
+
+import httpx
+
+from ..clients.retry import CircuitOpenError
+from ..clients.sec_client import SECEdgarClient
+from ..clients.submissions import is_10k_form
+from ..models.filings import SyncReport
+from .local_store import LocalEdgarStore
+
+logger = logging.getLogger(__name__)
+
+_INDEX_NAME = re.compile(r"^master\.(\d{8})\.idx(?:\.gz)?$")
+
+
+class IndexEntry(NamedTuple):
+    """One row of an EDGAR master index."""
+
+    cik: str
+    company_name: str
+    form_type: str
+    date_filed: date | None
+    file_name: str
+
+
+def parse_master_index(lines: Iterable[str]) -> Iterator[IndexEntry]:
+    """Parse the pipe-delimited rows of an EDGAR ``master`` index, skipping its preamble."""
+    in_body = False
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not in_body:
+            in_body = line.startswith("---")
+            continue
+        parts = line.split("|")
+        if len(parts) != 5 or not parts[0].isdigit():
+            continue
+        cik, company_name, form_type, date_filed, file_name = parts
+        yield IndexEntry(
+            cik=cik.zfill(10),
+            company_name=company_name,
+            form_type=form_type,
+            date_filed=_parse_index_date(date_filed),
+            file_name=file_name,
+        )
+
+
+class FilingsSyncService:
+    """Refreshes the local store for companies that filed a 10-K since the last sync.
+
+    Daily ``master.YYYYMMDD.idx`` files (plain or gzipped, in any layout under
+    ``index_dir``) are processed oldest first. Only CIKs with a 10-K-family filing on
+    a given day are refetched, and the watermark in ``state_path`` advances one fully
+    synced day at a time, so a failed run resumes from the first incomplete day.
+
+    Refreshes only update a store seeded from a bulk submissions archive: written into
+    an empty store, a handful of freshly synced companies would be served as if they
+    were the whole universe.
+    """
+
+    def __init__(
+        self,
+        client: SECEdgarClient,
+        local_store: LocalEdgarStore,
+        *,
+        index_dir: Path,
+        state_path: Path,
+        max_concurrent_requests: int = 5,
+    ) -> None:
+        self._client = client
+        self._local_store = local_store
+        self._index_dir = index_dir
+        self._state_path = state_path
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether the local store holds bulk-loaded 10-K filings to keep up to date."""
+        return self._local_store.has_tenk_filings
+
+    def watermark(self) -> date | None:
+        """Return the last fully synced index date, if any."""
+        try:
+            state = json.loads(self._state_path.read_text())
+        except (OSError, ValueError):
+            return None
+        value = state.get("watermark")
+        return date.fromisoformat(value) if value else None
+
+    async def sync(self) -> SyncReport:
+        """Process every daily index newer than the watermark."""
+        async with self._lock:
+            watermark = await asyncio.to_thread(self.watermark)
+            if not self.available:
+                return SyncReport(watermark=watermark)
+            pending = [
+                (day, path)
+                for day, path in await asyncio.to_thread(self._index_files)
+                if watermark is None or day > watermark
+            ]
+            report = SyncReport(watermark=watermark)
+            for day, path in pending:
+                entries = await asyncio.to_thread(_read_index, path)
+                ciks = sorted({entry.cik for entry in entries if is_10k_form(entry.form_type)})
+                failed = await self._refresh(ciks)
+                if failed:
+                    report.failed_ciks = failed
+                    logger.warning("Sync stopped at %s; %d companies failed", day, len(failed))
+                    break
+                report.days_processed += 1
+                report.companies_refreshed += len(ciks)
+                report.watermark = day
+                await asyncio.to_thread(self._save_watermark, day)
+            return report
+
+    async def _refresh(self, ciks: list[str]) -> list[str]:
+        async def refresh(cik: str) -> str | None:
+            try:
+                async with self._semaphore:
+                    filings = await self._client.fetch_recent_filings(
+                        cik, form_predicate=is_10k_form, revalidate=True
+                    )
+            except (httpx.HTTPError, CircuitOpenError) as exc:
+                logger.warning("Could not refresh CIK %s: %s", cik, exc)
+                return cik
+            self._local_store.put_tenk_filings(cik, filings)
+            return None
+
+        results = await asyncio.gather(*(refresh(cik) for cik in ciks))
+        return [cik for cik in results if cik is not None]
+
+    def _index_files(self) -> list[tuple[date, Path]]:
+        found: list[tuple[date, Path]] = []
+        for path in self._index_dir.rglob("master.*.idx*"):
+            match = _INDEX_NAME.match(path.name)
+            if match is None:
+                continue
+            found.append((datetime.strptime(match.group(1), "%Y%m%d").date(), path))
+        return sorted(found)
+
+    def _save_watermark(self, day: date) -> None:
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._state_path.with_name(f"{self._state_path.name}.tmp")
+        tmp_path.write_text(json.dumps({"watermark": day.isoformat()}))
+        os.replace(tmp_path, self._state_path)
+
+
+def _read_index(path: Path) -> list[IndexEntry]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="latin-1") as handle:
+        return list(parse_master_index(handle))
+
+
+def _parse_index_date(value: str) -> date | None:
+    # Daily indexes use YYYYMMDD; the quarterly full index uses YYYY-MM-DD.
+    for fmt in ("%Y%m%d", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
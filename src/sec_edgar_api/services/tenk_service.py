@@ -3,58 +3,171 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import date
-from typing import Iterable
+import logging
+from typing import AsyncIterator, Iterable
 
+import httpx
+
+from ..clients.retry import CircuitOpenError
 from ..clients.sec_client import SECEdgarClient
+from ..clients.submissions import (
+    FilingRecord,
+    SubmissionsParser,
+    filing_date_key,
+    is_10k_form,
+    to_filings,
+)
 from ..config import Settings
-from ..models.filings import AggregatedFilings, CompanySummary, Filing
+from ..models.filings import AggregatedFilings, CompanySummary, Filing, FilingsPage
+from ..timing import phase
+from .filing_history import FilingHistory
+from .local_store import LocalEdgarStore
+from .ticker_registry import TickerRegistry
+
+logger = logging.getLogger(__name__)
 
 
 class TenKService:
     """Coordinates fetching 10-K filings across all publicly traded companies."""
 
-    def __init__(self, client: SECEdgarClient, settings: Settings) -> None:
+    def __init__(
+        self,
+        client: SECEdgarClient,
+        settings: Settings,
+        ticker_registry: TickerRegistry | None = None,
+        local_store: LocalEdgarStore | None = None,
+    ) -> None:
         self._client = client
         self._settings = settings
+        self._tickers = ticker_registry or TickerRegistry(client, ttl=settings.ticker_registry_ttl)
+        self._local_store = local_store
         self._semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        self._history = FilingHistory(
+            client,
+            SubmissionsParser(str(settings.archives_base_url)),
+            max_cached_shards=settings.history_shard_cache_size,
+        )
 
     async def fetch_company_filings(self, ticker: str, limit: int = 5) -> list[Filing]:
         """Fetch the latest 10-K filings for a single ticker."""
-        summaries = await self._client.fetch_company_tickers()
-        summary = next((item for item in summaries if item.ticker == ticker.upper()), None)
+        with phase("lookup"):
+            summary = await self._tickers.get_by_ticker(ticker)
         if not summary:
             return []
-        filings = await self._client.fetch_recent_filings(summary.cik)
-        filtered = [filing for filing in filings if filing.form_type.startswith("10-K")]
-        return filtered[:limit]
+        local_filings = self._local_tenk_filings(summary.cik)
+        if local_filings is not None:
+            return to_filings(local_filings[:limit])
+        with phase("filings"):
+            filings = await self._client.fetch_recent_filings(
+                summary.cik, form_predicate=is_10k_form, limit=limit
+            )
+        return to_filings(filings)
+
+    async def fetch_company_filings_page(
+        self, ticker: str, *, limit: int = 20, cursor: str | None = None
+    ) -> FilingsPage | None:
+        """Page through a ticker's full 10-K history, including older submissions shards."""
+        with phase("lookup"):
+            summary = await self._tickers.get_by_ticker(ticker)
+        if not summary:
+            return None
+        with phase("filings"):
+            records, next_cursor = await self._history.page(
+                summary.cik, limit=limit, cursor=cursor, form_predicate=is_10k_form
+            )
+        return FilingsPage(filings=to_filings(records), next_cursor=next_cursor)
+
+    async def list_companies(self, max_companies: int | None = None) -> list[CompanySummary]:
+        """Return the companies scanned by universe-wide queries, in SEC order."""
+        with phase("lookup"):
+            companies = await self._tickers.companies()
+        if max_companies is not None:
+            companies = companies[:max_companies]
+        return companies
 
     async def fetch_all_filings(
         self, *, limit_per_company: int = 1, max_companies: int | None = None
     ) -> AggregatedFilings:
         """Fetch 10-K filings for the desired span of companies."""
-        companies = await self._client.fetch_company_tickers()
-        if max_companies is not None:
-            companies = companies[:max_companies]
+        companies = await self.list_companies(max_companies)
 
         filings = await self._gather_filings(companies, limit_per_company)
-        flattened = [filing for company_filings in filings for filing in company_filings]
-        flattened.sort(key=lambda filing: filing.filing_date or date.min, reverse=True)
+        flattened = [
+            record for company_filings in filings if company_filings for record in company_filings
+        ]
+        # Sort the lightweight records (ISO dates sort chronologically) and build the
+        # response models only once, at the end.
+        flattened.sort(key=filing_date_key, reverse=True)
         return AggregatedFilings(
             companies_examined=len(companies),
+            companies_failed=sum(1 for company_filings in filings if company_filings is None),
             total_filings=len(flattened),
             form_type="10-K",
-            filings=flattened,
+            filings=to_filings(flattened),
         )
 
+    async def stream_filings(
+        self, *, limit_per_company: int = 1, max_companies: int | None = None
+    ) -> AsyncIterator[Filing]:
+        """Yield 10-K filings company by company as each fetch completes."""
+        companies = await self.list_companies(max_companies)
+        async for _, company_filings in self.iter_company_filings(companies, limit_per_company):
+            for filing in to_filings(company_filings or ()):
+                yield filing
+
     async def _gather_filings(
         self, companies: Iterable[CompanySummary], limit_per_company: int
-    ) -> list[list[Filing]]:
-        async def fetch_company(summary: CompanySummary) -> list[Filing]:
+    ) -> list[list[FilingRecord] | None]:
+        """Fetch each company's filings; companies that still fail after retries map to None."""
+        return [
+            company_filings
+            async for _, company_filings in self.iter_company_filings(companies, limit_per_company)
+        ]
+
+    async def iter_company_filings(
+        self, companies: Iterable[CompanySummary], limit_per_company: int
+    ) -> AsyncIterator[tuple[CompanySummary, list[FilingRecord] | None]]:
+        """Yield ``(company, filings)`` pairs in completion order.
+
+        Only a bounded window of fetch tasks exists at any time, so memory stays flat
+        across the full SEC universe; remaining tasks are cancelled if the consumer stops.
+        """
+        window = self._settings.max_concurrent_requests * 2
+        pending: dict[asyncio.Task[list[FilingRecord] | None], CompanySummary] = {}
+        remaining = iter(companies)
+        try:
+            while True:
+                for summary in remaining:
+                    task = asyncio.create_task(self._fetch_company(summary, limit_per_company))
+                    pending[task] = summary
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_company(
+        self, summary: CompanySummary, limit_per_company: int
+    ) -> list[FilingRecord] | None:
+        local_filings = self._local_tenk_filings(summary.cik)
+        if local_filings is not None:
+            return local_filings[:limit_per_company]
+        try:
             async with self._semaphore:
-                filings = await self._client.fetch_recent_filings(summary.cik)
-            tenk_filings = [filing for filing in filings if filing.form_type.startswith("10-K")]
-            return tenk_filings[:limit_per_company]
+                filings = await self._client.fetch_recent_filings(
+                    summary.cik, form_predicate=is_10k_form, limit=limit_per_company
+                )
+        except (httpx.HTTPError, CircuitOpenError) as exc:
+            logger.warning("Skipping %s (CIK %s): %s", summary.ticker, summary.cik, exc)
+            return None
+        return filings
 
-        tasks = [asyncio.create_task(fetch_company(summary)) for summary in companies]
-        return await asyncio.gather(*tasks)
+    def _local_tenk_filings(self, cik: str) -> list[FilingRecord] | None:
+        if self._local_store is None:
+            return None
+        return self._local_store.tenk_filings_for(cik)
@@ -0,0 +1,107 @@
+"""Process-wide registry of the SEC master ticker list."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import httpx
+
+from ..clients.retry import CircuitOpenError
+from ..clients.sec_client import SECEdgarClient, TickerListing
+from ..clients.validators import ResponseValidators
+from ..models.filings import CompanySummary
+
+logger = logging.getLogger(__name__)
+
+
+class TickerRegistry:
+    """Indexes the SEC ticker list for O(1) lookups and refreshes it in the background.
+
+    The first lookup blocks on the initial download. Once the TTL elapses, lookups keep
+    serving the current index while a background task revalidates the list with the
+    ETag/Last-Modified validators from the previous download. A failed background
+    refresh keeps the current index and is retried after ``REFRESH_RETRY_DELAY``.
+    """
+
+    REFRESH_RETRY_DELAY = 60.0
+
+    def __init__(self, client: SECEdgarClient, *, ttl: float = 3600.0) -> None:
+        self._client = client
+        self._ttl = ttl
+        self._companies: list[CompanySummary] = []
+        self._by_ticker: dict[str, CompanySummary] = {}
+        self._by_cik: dict[str, CompanySummary] = {}
+        self._validators = ResponseValidators()
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def companies(self) -> list[CompanySummary]:
+        """Return every listed company, ordered as published by the SEC."""
+        await self._ensure_loaded()
+        return self._companies
+
+    async def get_by_ticker(self, ticker: str) -> CompanySummary | None:
+        """Return the company listed under ``ticker``, if any."""
+        await self._ensure_loaded()
+        return self._by_ticker.get(ticker.upper())
+
+    async def get_by_cik(self, cik: str | int) -> CompanySummary | None:
+        """Return the company registered under ``cik``, if any."""
+        await self._ensure_loaded()
+        return self._by_cik.get(str(cik).zfill(10))
+
+    async def refresh(self) -> None:
+        """Revalidate the ticker list against the SEC immediately."""
+        async with self._lock:
+            await self._load()
+
+    async def aclose(self) -> None:
+        """Cancel any in-flight background refresh."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded_at is None:
+            async with self._lock:
+                if self._loaded_at is None:
+                    await self._load()
+            return
+        if time.monotonic() - self._loaded_at < self._ttl:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, CircuitOpenError):
+            logger.warning("Background refresh of the SEC ticker list failed", exc_info=True)
+            # Back off instead of starting another refresh on every lookup.
+            retry_delay = min(self.REFRESH_RETRY_DELAY, self._ttl)
+            self._loaded_at = time.monotonic() - self._ttl + retry_delay
+
+    async def _load(self) -> None:
+        listing = await self._client.fetch_ticker_listing(self._validators or None)
+        self._loaded_at = time.monotonic()
+        if listing is not None:
+            self._index(listing)
+
+    def _index(self, listing: TickerListing) -> None:
+        by_ticker: dict[str, CompanySummary] = {}
+        by_cik: dict[str, CompanySummary] = {}
+        for summary in listing.companies:
+            # Keep the first listing for a ticker, matching the old linear scan.
+            by_ticker.setdefault(summary.ticker.upper(), summary)
+            by_cik.setdefault(summary.cik, summary)
+        self._companies = listing.companies
+        self._by_ticker = by_ticker
+        self._by_cik = by_cik
+        self._validators = listing.validators
@@ -0,0 +1,104 @@
+"""Per-request phase timings reported through the ``Server-Timing`` header."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestTimings:
+    """Accumulated wall time per phase for one API request, in first-seen order.
+
+    Phases that run concurrently (a batch fanning out to many downloads) are summed, so
+    their totals can exceed the request's own duration.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.last_phase_end = self.started
+        self.phases: dict[str, list[float]] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.last_phase_end = time.perf_counter()
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def header_value(self) -> str:
+        """Format the phases, plus the elapsed total, as a ``Server-Timing`` value."""
+        parts = [
+            f'{name};dur={seconds * 1000:.2f};desc="{int(count)}x"'
+            for name, (seconds, count) in self.phases.items()
+        ]
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the enclosed block under ``name`` when the current request is being timed.
+
+    Tasks and threads spawned by the request inherit the context, so work they do on its
+    behalf is attributed to it. Outside a timed request this is a no-op.
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+def record_serialization() -> None:
+    """Record the gap since the last phase as ``serialize``; call as rendering starts.
+
+    Endpoints return once their last service phase ends, so the gap is FastAPI's
+    response-model validation and serialization.
+    """
+    timings = _current.get()
+    if timings is not None:
+        timings.add("serialize", time.perf_counter() - timings.last_phase_end)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware that times each request and adds a ``Server-Timing`` header."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = RequestTimings()
+        token = _current.set(timings)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Phases finished by now cover everything up to the first response byte.
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.header_value().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from sec_edgar_api.clients import facts_parser
+from sec_edgar_api.clients.facts_parser import filter_company_facts, select_company_facts
+
+PAYLOAD = {
+    "cik": 320193,
+    "entityName": "Apple Inc.",
+    "facts": {
+        "dei": {
+            "EntityCommonStockSharesOutstanding": {
+                "label": "Shares",
+                "units": {"shares": [{"end": "2024-01-01", "val": 15_000_000_000}]},
+            }
+        },
+        "us-gaap": {
+            "Assets": {
+                "label": "Assets",
+                "description": None,
+                "units": {
+                    "USD": [
+                        {"end": "2023-09-30", "val": 352583000000, "fy": 2023, "form": "10-K"},
+                        {"end": "2022-09-24", "val": 352755000000.5, "fy": 2022, "form": "10-K"},
+                    ]
+                },
+            },
+            "Goodwill": {"label": "Goodwill", "units": {"USD": [{"val": 1, "nested": [[]]}]}},
+            "Revenues": {"label": "Revenues", "units": {"USD": []}},
+        },
+    },
+}
+
+
+@pytest.mark.parametrize("concepts", [{"Assets"}, {"Assets", "Revenues"}, set()])
+def test_streaming_selection_matches_full_decode(concepts):
+    body = json.dumps(PAYLOAD).encode()
+
+    selected = select_company_facts(body, concepts)
+
+    assert selected == filter_company_facts(PAYLOAD, concepts)
+    assert set(selected["facts"]["us-gaap"]) == concepts
+
+
+def test_falls_back_to_full_decode_without_ijson(monkeypatch):
+    monkeypatch.setattr(facts_parser, "ijson", None)
+    body = json.dumps(PAYLOAD).encode()
+
+    selected = select_company_facts(body, {"Goodwill"})
+
+    assert selected["entityName"] == "Apple Inc."
+    assert list(selected["facts"]["us-gaap"]) == ["Goodwill"]
@@ -0,0 +1,76 @@
+import httpx
+import pytest
+
+from sec_edgar_api.clients.http_cache import DiskResponseCache
+from sec_edgar_api.clients.sec_client import SECEdgarClient
+from sec_edgar_api.clients.validators import ResponseValidators
+from sec_edgar_api.config import Settings
+
+
+def test_entries_survive_reopen_and_evict_least_recently_used(tmp_path):
+    cache = DiskResponseCache(tmp_path, max_bytes=10_000)
+    cache.put("https://example/a", b'{"a": 1}', ResponseValidators(etag='"a"'))
+    cache.put("https://example/b", b'{"b": 2}', ResponseValidators())
+
+    reopened = DiskResponseCache(tmp_path, max_bytes=10_000)
+    restored = reopened.get("https://example/a")
+    assert restored is not None
+    assert restored.body == b'{"a": 1}'
+    assert restored.validators.etag == '"a"'
+
+    entry_size = reopened.total_bytes // 2
+    reopened._max_bytes = entry_size * 2 + 1
+    reopened.put("https://example/c", b'{"c": 3}', ResponseValidators())
+    assert reopened.get("https://example/b") is None
+    assert reopened.get("https://example/a") is not None
+    assert reopened.get("https://example/c") is not None
+
+
+def test_entries_with_incomplete_metadata_are_misses(tmp_path):
+    cache = DiskResponseCache(tmp_path, max_bytes=10_000)
+    cache.put("https://example/a", b'{"a": 1}', ResponseValidators(etag='"a"'))
+    _, meta_path = cache._paths(cache._key("https://example/a"))
+    meta_path.write_text('{"etag": "\\"a\\""}')
+
+    assert cache.get("https://example/a") is None
+    assert cache.total_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_revalidated_with_conditional_get(tmp_path):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"entityName": "AAA"}, headers={"ETag": '"v1"'})
+
+    cache = DiskResponseCache(tmp_path, max_bytes=10_000)
+    client = SECEdgarClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        settings=Settings(http_cache_ttl=0),
+        response_cache=cache,
+    )
+    assert await client.fetch_company_facts("0000000001") == {"entityName": "AAA"}
+    assert await client.fetch_company_facts("0000000001") == {"entityName": "AAA"}
+    assert [request.headers.get("If-None-Match") for request in requests] == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_fresh_entries_skip_the_network(tmp_path):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"entityName": "AAA"})
+
+    client = SECEdgarClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        settings=Settings(),
+        response_cache=DiskResponseCache(tmp_path, max_bytes=10_000),
+    )
+    await client.fetch_company_facts("0000000001")
+    await client.fetch_company_facts("0000000001")
+    assert calls == 1
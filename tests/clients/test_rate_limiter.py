@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from sec_edgar_api.clients.rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_burst_is_admitted_without_waiting():
+    limiter = TokenBucketRateLimiter(rate=10, burst=3)
+    waits = [await limiter.acquire() for _ in range(3)]
+    assert max(waits) < 0.01
+    assert limiter.stats.acquisitions == 3
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_in_arrival_order_at_the_configured_rate():
+    limiter = TokenBucketRateLimiter(rate=50, burst=1)
+    order: list[int] = []
+
+    async def worker(index: int) -> None:
+        await limiter.acquire()
+        order.append(index)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(worker(index) for index in range(6)))
+    elapsed = loop.time() - started
+
+    assert order == list(range(6))
+    # One token is available immediately; the remaining five accrue at 50/s.
+    assert elapsed >= 0.09
+    assert limiter.stats.max_wait > 0
+    assert limiter.queue_depth == 0
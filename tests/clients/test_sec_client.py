@@ -0,0 +1,82 @@
+import httpx
+import pytest
+
+from sec_edgar_api.clients.retry import CircuitBreaker, CircuitOpenError
+from sec_edgar_api.clients.sec_client import SECEdgarClient
+from sec_edgar_api.config import Settings
+
+TICKERS = {"0": {"cik_str": 1, "ticker": "AAA", "title": "AAA Corp"}}
+
+
+def build_client(handler, **settings_overrides) -> SECEdgarClient:
+    settings = Settings(retry_backoff_base=0.001, **settings_overrides)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SECEdgarClient(http_client=http_client, settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried_honouring_retry_after():
+    statuses = iter([503, 429, 200])
+    seen_statuses: list[int | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        seen_statuses.append(status)
+        if status == 200:
+            return httpx.Response(200, json=TICKERS)
+        return httpx.Response(status, headers={"Retry-After": "0"})
+
+    client = build_client(handler)
+    summaries = await client.fetch_company_tickers()
+    assert [summary.ticker for summary in summaries] == ["AAA"]
+    assert seen_statuses == [503, 429, 200]
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_max_attempts():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    client = build_client(handler, retry_max_attempts=2, circuit_failure_threshold=10)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.fetch_company_tickers()
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_when_wait_exceeds_budget():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("boom", request=request)
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=120)
+    settings = Settings(retry_backoff_base=0.001, retry_max_attempts=2, retry_budget=1)
+    client = SECEdgarClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        settings=settings,
+        circuit_breaker=breaker,
+    )
+    with pytest.raises(httpx.ConnectError):
+        await client.fetch_company_tickers()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        await client.fetch_company_tickers()
+
+
+@pytest.mark.asyncio
+async def test_outbound_requests_are_recorded_by_endpoint():
+    from sec_edgar_api.metrics import SEC_REQUEST_SECONDS, SEC_RESPONSE_BYTES
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=TICKERS)
+
+    before = SEC_REQUEST_SECONDS.count(endpoint="tickers", status="200")
+    bytes_before = SEC_RESPONSE_BYTES.value(endpoint="tickers")
+
+    await build_client(handler).fetch_company_tickers()
+
+    assert SEC_REQUEST_SECONDS.count(endpoint="tickers", status="200") == before + 1
+    assert SEC_RESPONSE_BYTES.value(endpoint="tickers") > bytes_before
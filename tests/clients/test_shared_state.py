@@ -0,0 +1,63 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from sec_edgar_api.clients.shared_limiter import FileLockRateLimiter
+from sec_edgar_api.clients.sqlite_cache import SQLiteResponseCache
+from sec_edgar_api.clients.validators import ResponseValidators
+
+
+def test_sqlite_cache_is_shared_between_instances_and_evicts_lru(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    writer = SQLiteResponseCache(path, max_bytes=10_000)
+    reader = SQLiteResponseCache(path, max_bytes=10_000)
+    writer.put("https://example/a", b'{"a": 1}', ResponseValidators(etag='"a"'))
+    time.sleep(0.01)
+    writer.put("https://example/b", b'{"b": 2}', ResponseValidators())
+
+    restored = reader.get("https://example/a")
+    assert restored is not None
+    assert restored.body == b'{"a": 1}'
+    assert restored.validators.etag == '"a"'
+
+    time.sleep(0.01)
+    entry_size = reader.total_bytes // 2
+    small = SQLiteResponseCache(path, max_bytes=entry_size * 2 + 1)
+    small.put("https://example/c", b'{"c": 3}', ResponseValidators())
+    assert reader.get("https://example/b") is None
+    assert reader.get("https://example/a") is not None
+    assert reader.get("https://example/c") is not None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_close_shuts_every_thread_connection(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "responses.sqlite3", max_bytes=10_000)
+    await asyncio.to_thread(cache.put, "https://example/a", b"{}", ResponseValidators())
+    opened = list(cache._connections)
+    assert len(opened) == 2
+
+    cache.close()
+
+    for connection in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+    assert cache.get("https://example/a") is not None
+
+
+@pytest.mark.asyncio
+async def test_file_lock_limiters_split_one_budget(tmp_path):
+    path = tmp_path / "rate.state"
+    workers = [FileLockRateLimiter(path, rate=50, burst=2) for _ in range(2)]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(workers[index % 2].acquire() for index in range(8)))
+    elapsed = loop.time() - started
+
+    # Two tokens are available at once; the other six accrue at 50/s across both workers.
+    assert elapsed >= 0.11
+    assert sum(worker.stats.acquisitions for worker in workers) == 8
+    for worker in workers:
+        worker.close()
@@ -0,0 +1,79 @@
+from datetime import date
+
+from sec_edgar_api.clients.submissions import (
+    FilingRecord,
+    SubmissionsParser,
+    is_10k_form,
+    to_filings,
+)
+
+PAYLOAD = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "tickers": ["AAPL"],
+    "filings": {
+        "recent": {
+            "form": ["10-K", "8-K", "10-K/A", "10-K"],
+            "accessionNumber": [
+                "0000320193-23-000106",
+                "0000320193-23-000101",
+                "0000320193-23-000077",
+                "0000320193-22-000108",
+            ],
+            "filingDate": ["2023-11-03", "2023-08-03", "2023-02-01", "2022-10-28"],
+            "reportDate": ["2023-09-30", "", "2022-09-24", "2022-09-24"],
+            "primaryDocument": ["aapl-20230930.htm"],
+        }
+    },
+}
+
+
+def test_parse_recent_returns_unvalidated_records():
+    parser = SubmissionsParser("https://www.sec.gov/Archives/edgar/data")
+
+    records = parser.parse_recent(PAYLOAD)
+
+    assert all(isinstance(record, FilingRecord) for record in records)
+    assert records[0].filing_date == "2023-11-03"
+    assert records[1].report_period is None
+    assert records[1].primary_document_url is None
+
+
+def test_to_filings_builds_models_at_the_boundary():
+    parser = SubmissionsParser("https://www.sec.gov/Archives/edgar/data")
+    record = parser.parse_recent(PAYLOAD)[0]
+
+    (filing,) = to_filings([record])
+
+    assert filing.cik == "0000320193"
+    assert filing.filing_date == date(2023, 11, 3)
+    assert filing.report_period == date(2023, 9, 30)
+    assert str(filing.primary_document_url).endswith("/320193/000032019323000106/aapl-20230930.htm")
+    assert to_filings([filing]) == [filing]
+
+
+def test_missing_company_name_defaults_to_empty():
+    parser = SubmissionsParser("https://www.sec.gov/Archives/edgar/data")
+    payload = {key: value for key, value in PAYLOAD.items() if key != "name"}
+
+    (filing,) = to_filings(parser.parse_recent(payload, limit=1))
+
+    assert filing.company_name == ""
+
+
+def test_parse_recent_builds_only_matching_rows_up_to_limit():
+    parser = SubmissionsParser("https://www.sec.gov/Archives/edgar/data")
+    seen: list[str] = []
+
+    def predicate(form_type: str) -> bool:
+        seen.append(form_type)
+        return is_10k_form(form_type)
+
+    records = parser.parse_recent(PAYLOAD, form_predicate=predicate, limit=2)
+
+    assert [record.accession_number for record in records] == [
+        "0000320193-23-000106",
+        "0000320193-23-000077",
+    ]
+    assert seen == ["10-K", "8-K", "10-K/A"]
+    assert parser.parse_recent(PAYLOAD, form_predicate=is_10k_form, limit=0) == []
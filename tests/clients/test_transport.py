@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+
+from sec_edgar_api.clients.transport import PerHostLimitTransport, build_transport
+from sec_edgar_api.config import Settings
+
+
+@pytest.mark.asyncio
+async def test_per_host_cap_bounds_each_host_independently():
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, json={"host": host})
+
+    transport = PerHostLimitTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        urls = ["https://www.sec.gov/a", "https://data.sec.gov/b"] * 6
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+    assert {response.json()["host"] for response in responses} == {"www.sec.gov", "data.sec.gov"}
+    assert peak == {"www.sec.gov": 2, "data.sec.gov": 2}
+
+
+def test_build_transport_applies_per_host_setting():
+    assert isinstance(build_transport(Settings()), PerHostLimitTransport)
+    unlimited = build_transport(Settings(http_max_connections_per_host=None))
+    assert isinstance(unlimited, httpx.AsyncHTTPTransport)
+
+
+@pytest.mark.asyncio
+async def test_per_host_slot_is_held_while_streaming_and_released_on_close():
+    finish = asyncio.Event()
+
+    async def body():
+        yield b"first"
+        await finish.wait()
+        yield b"rest"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    transport = PerHostLimitTransport(httpx.MockTransport(handler), max_per_host=1)
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://data.sec.gov/a") as response:
+            chunks = response.aiter_bytes()
+            assert await chunks.__anext__() == b"first"
+            second = asyncio.create_task(client.get("https://data.sec.gov/b"))
+            await asyncio.sleep(0.01)
+            assert not second.done()
+            finish.set()
+            assert [chunk async for chunk in chunks] == [b"rest"]
+        finish.set()
+        assert (await asyncio.wait_for(second, 1)).content == b"firstrest"
@@ -0,0 +1,114 @@
+import json
+import zipfile
+
+import pytest
+
+from sec_edgar_api.clients.sec_client import TickerListing
+from sec_edgar_api.clients.submissions import SubmissionsParser
+from sec_edgar_api.clients.validators import ResponseValidators
+from sec_edgar_api.config import Settings
+from sec_edgar_api.models.filings import CompanySummary
+from sec_edgar_api.services.bulk_ingest import (
+    ingest_companyfacts_archive,
+    ingest_submissions_archive,
+)
+from sec_edgar_api.services.financials_service import FinancialsService
+from sec_edgar_api.services.local_store import LocalEdgarStore
+from sec_edgar_api.services.tenk_service import TenKService
+
+SUBMISSIONS = {
+    "cik": "1",
+    "name": "AAA Corp",
+    "tickers": ["AAA"],
+    "filings": {
+        "recent": {
+            "form": ["8-K", "10-K", "10-K/A"],
+            "accessionNumber": [
+                "0000000001-24-000003",
+                "0000000001-24-000002",
+                "0000000001-23-000001",
+            ],
+            "filingDate": ["2024-03-01", "2024-02-01", "2023-06-01"],
+            "reportDate": ["", "2023-12-31", "2022-12-31"],
+            "primaryDocument": ["a.htm", "b.htm", "c.htm"],
+        },
+        "files": [],
+    },
+}
+FACTS = {
+    "cik": 1,
+    "entityName": "AAA Corporation",
+    "facts": {
+        "us-gaap": {
+            "Assets": {
+                "label": "Assets",
+                "units": {
+                    "USD": [
+                        {
+                            "fy": 2023,
+                            "fp": "FY",
+                            "form": "10-K",
+                            "filed": "2024-02-01",
+                            "end": "2023-12-31",
+                            "val": 500,
+                            "accn": "0000000001-24-000002",
+                        }
+                    ]
+                },
+            },
+            "SomethingUnused": {"label": "Unused", "units": {"USD": []}},
+        }
+    },
+}
+
+
+class OfflineClient:
+    async def fetch_ticker_listing(self, validators=None):
+        return TickerListing(
+            companies=[CompanySummary(cik="0000000001", ticker="AAA", title="AAA Corp")],
+            validators=ResponseValidators(),
+        )
+
+    async def fetch_recent_filings(self, cik):
+        raise AssertionError("network access is not expected")
+
+    async def fetch_company_facts(self, cik, concepts=None):
+        raise AssertionError("network access is not expected")
+
+
+@pytest.fixture
+def loaded_store(tmp_path):
+    submissions_zip = tmp_path / "submissions.zip"
+    with zipfile.ZipFile(submissions_zip, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("CIK0000000001.json", json.dumps(SUBMISSIONS))
+        archive.writestr("CIK0000000001-submissions-001.json", json.dumps({"form": []}))
+    facts_zip = tmp_path / "companyfacts.zip"
+    with zipfile.ZipFile(facts_zip, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("CIK0000000001.json", json.dumps(FACTS))
+
+    store = LocalEdgarStore()
+    parser = SubmissionsParser(str(Settings().archives_base_url))
+    assert ingest_submissions_archive(submissions_zip, store, parser) == 1
+    assert ingest_companyfacts_archive(facts_zip, store, FinancialsService.tracked_concepts()) == 1
+    return store
+
+
+def test_ingest_keeps_tenk_filings_and_tracked_concepts(loaded_store):
+    assert loaded_store.has_tenk_filings
+    filings = loaded_store.tenk_filings_for("0000000001")
+    assert [filing.form_type for filing in filings] == ["10-K", "10-K/A"]
+    assert loaded_store.facts.has_concept("0000000001", "Assets")
+    assert not loaded_store.facts.has_concept("0000000001", "SomethingUnused")
+
+
+@pytest.mark.asyncio
+async def test_services_answer_from_the_store_without_network(loaded_store):
+    client = OfflineClient()
+    tenk_service = TenKService(client=client, settings=Settings(), local_store=loaded_store)
+    aggregated = await tenk_service.fetch_all_filings(limit_per_company=1)
+    assert aggregated.filings[0].accession_number == "0000000001-24-000002"
+
+    financials_service = FinancialsService(client=client, local_store=loaded_store)
+    snapshot = await financials_service.fetch_financial_snapshot("AAA")
+    assert snapshot.company_name == "AAA Corporation"
+    assert snapshot.metrics["assets"].value == 500.0
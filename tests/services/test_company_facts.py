@@ -0,0 +1,106 @@
+from datetime import date
+
+from sec_edgar_api.services.company_facts import CompanyFacts, normalize_entry
+
+PAYLOAD = {
+    "entityName": "AAA Corp",
+    "facts": {
+        "us-gaap": {
+            "Revenues": {
+                "label": "Revenues",
+                "units": {
+                    "USD": [
+                        {"fy": "2023", "form": "10-k", "end": "2023-12-31", "filed": "2024-02-01"},
+                        {"fy": 2023, "form": "10-K", "end": "2023-12-31", "filed": "2024-03-01"},
+                        {"fy": None, "end": "not-a-date"},
+                    ]
+                },
+            }
+        }
+    },
+}
+
+
+def test_normalized_entries_carry_parsed_dates_and_sort_keys():
+    first, second, broken = CompanyFacts(PAYLOAD).normalized_units("us-gaap", "Revenues")["USD"]
+
+    assert first.form == "10-K"
+    assert first.end == date(2023, 12, 31)
+    assert first.sort_key < second.sort_key
+    assert broken.sort_key == (0, 0, 0)
+    assert broken.end is None and broken.form is None
+
+
+def test_normalization_is_memoized_per_view_and_wrap_is_idempotent():
+    facts = CompanyFacts(PAYLOAD)
+
+    units = facts.normalized_units("us-gaap", "Revenues")
+
+    assert facts.normalized_units("us-gaap", "Revenues") is units
+    assert CompanyFacts.wrap(facts) is facts
+    assert facts["entityName"] == "AAA Corp"
+    assert facts.normalized_units("us-gaap", "Missing") == {}
+    assert normalize_entry({}).sort_key == (0, 0, 0)
+
+
+def test_series_index_dedupes_periods_and_answers_ranges_by_period_kind():
+    def fact(start, end, filed, val, fp="FY"):
+        return {"start": start, "end": end, "filed": filed, "val": val, "fp": fp}
+
+    payload = {
+        "facts": {
+            "us-gaap": {
+                "Revenues": {
+                    "units": {
+                        "USD": [
+                            fact("2022-01-01", "2022-12-31", "2023-02-01", 900),
+                            fact("2023-01-01", "2023-12-31", "2024-02-01", 1000),
+                            fact("2022-01-01", "2022-12-31", "2024-02-01", 905),
+                            fact("2023-10-01", "2023-12-31", "2024-02-01", 260, fp="Q4"),
+                            fact("2023-01-01", "2023-06-30", "2023-08-01", 480, fp="Q2"),
+                            fact(None, "2023-06-30", "2023-08-01", 7, fp="Q2"),
+                        ]
+                    }
+                }
+            }
+        }
+    }
+    facts = CompanyFacts(payload)
+    index = facts.series_index("us-gaap", "Revenues")
+
+    annual = index.query("USD", period="FY")
+    assert [entry.raw["val"] for entry in annual] == [905, 1000]
+    assert [entry.raw["val"] for entry in index.query("USD", period="Q")] == [7, 260]
+    ranged = index.query("USD", start=date(2023, 6, 30), end=date(2023, 6, 30))
+    assert [entry.raw["val"] for entry in ranged] == [7, 480]
+    assert index.query("USD", period="FY", start=date(2024, 1, 1)) == []
+    assert facts.series_index("us-gaap", "Revenues") is index
+
+
+def test_distinct_units_resolve_restatements_after_form_filter_and_are_memoized():
+    def fact(end, filed, val, form="10-K"):
+        return {"start": "2023-01-01", "end": end, "filed": filed, "val": val, "form": form}
+
+    payload = {
+        "facts": {
+            "us-gaap": {
+                "Revenues": {
+                    "units": {
+                        "USD": [
+                            fact("2023-12-31", "2024-02-01", 1000),
+                            fact("2023-06-30", "2023-08-01", 480, form="10-Q"),
+                            fact("2023-12-31", "2025-02-01", 1010),
+                            fact("2023-12-31", "2025-05-01", 1020, form="10-Q"),
+                        ]
+                    }
+                }
+            }
+        }
+    }
+    facts = CompanyFacts(payload)
+
+    annual = facts.distinct_units("us-gaap", "Revenues", "10-K")
+    assert [entry.raw["val"] for entry in annual["USD"]] == [1010]
+    every_form = facts.distinct_units("us-gaap", "Revenues")
+    assert [entry.raw["val"] for entry in every_form["USD"]] == [480, 1020]
+    assert facts.distinct_units("us-gaap", "Revenues", "10-K") is annual
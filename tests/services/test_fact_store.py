@@ -0,0 +1,98 @@
+import pytest
+from test_financials_service import FallbackRevenueStub, RestatedRevenueStub, StubClient
+
+from sec_edgar_api.services.fact_store import ColumnarFactStore
+from sec_edgar_api.services.financials_service import FinancialsService
+from sec_edgar_api.services.local_store import LocalEdgarStore
+
+
+def columnar_service(stub) -> FinancialsService:
+    store = LocalEdgarStore()
+    for cik, payload in stub._facts_payload.items():
+        store.put_facts(cik, payload)
+    return FinancialsService(client=stub, local_store=store)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stub_factory, ticker",
+    [(StubClient, "AAA"), (FallbackRevenueStub, "REV"), (RestatedRevenueStub, "REV")],
+)
+async def test_columnar_store_matches_payload_extraction(stub_factory, ticker):
+    expected_service = FinancialsService(client=stub_factory())
+    service = columnar_service(stub_factory())
+
+    assert await service.fetch_financial_snapshot(ticker) == (
+        await expected_service.fetch_financial_snapshot(ticker)
+    )
+    assert await service.fetch_income_statement(ticker) == (
+        await expected_service.fetch_income_statement(ticker)
+    )
+
+
+def test_select_falls_back_to_all_rows_when_form_filter_matches_nothing():
+    store = ColumnarFactStore()
+    store.add_company(
+        "1",
+        {
+            "entityName": "AAA",
+            "facts": {
+                "us-gaap": {
+                    "Assets": {
+                        "label": "Assets",
+                        "units": {
+                            "USD": [
+                                {"fy": 2023, "form": "10-Q", "end": "2023-06-30", "val": 1},
+                                {"fy": 2024, "form": "10-Q", "end": "2024-06-30", "val": 2},
+                            ]
+                        },
+                    }
+                }
+            },
+        },
+    )
+    unit, rows = store.select("1", "Assets", form_filter="10-K", limit=5)
+    assert unit == "USD"
+    assert [row.value for row in rows] == [2.0, 1.0]
+    assert rows[0].filed is None
+
+
+def test_cross_section_matches_per_company_select():
+    def entry(fy: int, form: str, val: float, filed: str = "2025-01-01") -> dict:
+        return {"fy": fy, "form": form, "end": f"{fy}-12-31", "filed": filed, "val": val}
+
+    store = ColumnarFactStore()
+    companies = {
+        # Falls back to the second concept; ties between units go to the preferred one.
+        "1": {
+            "Revenues": {
+                "units": {"EUR": [entry(2024, "10-K", 5)], "USD": [entry(2024, "10-K", 6)]}
+            }
+        },
+        # Only 10-Q rows for the first concept: the form filter falls back to all of them.
+        "2": {
+            "SalesRevenueNet": {"units": {"USD": [entry(2022, "10-Q", 1), entry(2023, "10-Q", 2)]}},
+            "Revenues": {"units": {"USD": [entry(2024, "10-K", 9)]}},
+        },
+        # The 10-K row wins over a fresher 10-Q row.
+        "3": {
+            "SalesRevenueNet": {"units": {"USD": [entry(2023, "10-K", 3), entry(2024, "10-Q", 4)]}}
+        },
+        "4": {"Assets": {"units": {"USD": [entry(2024, "10-K", 7)]}}},
+    }
+    for cik, concepts in companies.items():
+        store.add_company(cik, {"entityName": cik, "facts": {"us-gaap": concepts}})
+
+    section = store.cross_section(
+        ("SalesRevenueNet", "Revenues"), form_filter="10-K", preferred_units=("USD",)
+    )
+
+    assert section.ciks == ["1", "2", "3"]
+    assert section.concepts == ["Revenues", "SalesRevenueNet", "SalesRevenueNet"]
+    for index, cik in enumerate(section.ciks):
+        unit, rows = store.select(
+            cik, section.concepts[index], form_filter="10-K", preferred_units=("USD",)
+        )
+        assert section.units[index] == unit
+        assert store.decode_row(int(section.rows[index])) == rows[0]
+    assert section.values.tolist() == [6.0, 2.0, 3.0]
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from sec_edgar_api.services.company_facts import CompanyFacts
+from sec_edgar_api.services.facts_cache import CompanyFactsCache, estimate_facts_size
+
+
+def make_payload(entry_count: int) -> dict:
+    entries = [{"fy": 2024, "val": index} for index in range(entry_count)]
+    return {"facts": {"us-gaap": {"Revenues": {"units": {"USD": entries}}}}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = CompanyFactsCache()
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return make_payload(1)
+
+    results = await asyncio.gather(*(cache.get_or_load("1", loader) for _ in range(5)))
+    assert loads == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats.misses == 1
+    assert cache.stats.coalesced == 4
+
+    await cache.get_or_load("1", loader)
+    assert loads == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_eviction_is_bounded_by_estimated_size():
+    size = estimate_facts_size(make_payload(10))
+    cache = CompanyFactsCache(max_bytes=size * 2)
+
+    async def loader():
+        return make_payload(10)
+
+    for cik in ("1", "2", "3"):
+        await cache.get_or_load(cik, loader)
+    assert cache.total_bytes == size * 2
+    assert cache.stats.evictions == 1
+
+    await cache.get_or_load("1", loader)
+    assert cache.stats.misses == 4
+
+
+@pytest.mark.asyncio
+async def test_memoized_views_are_charged_against_the_budget():
+    base = estimate_facts_size(make_payload(10))
+    cache = CompanyFactsCache(max_bytes=base * 2 + 1_000)
+
+    async def loader():
+        return CompanyFacts(make_payload(10))
+
+    first = await cache.get_or_load("1", loader)
+    second = await cache.get_or_load("2", loader)
+    assert cache.total_bytes == base * 2
+
+    second.normalized_units("us-gaap", "Revenues")
+    assert second.memo_bytes > 1_000
+    assert estimate_facts_size(second) == base + second.memo_bytes
+    assert cache.stats.evictions == 1
+    assert cache.total_bytes == base + second.memo_bytes
+
+    first.normalized_units("us-gaap", "Revenues")
+    assert cache.total_bytes == base + second.memo_bytes
+
+
+@pytest.mark.asyncio
+async def test_failed_loads_are_not_cached():
+    cache = CompanyFactsCache()
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("1", failing)
+
+    async def loader():
+        return make_payload(1)
+
+    assert await cache.get_or_load("1", loader) == make_payload(1)
@@ -0,0 +1,117 @@
+import pytest
+
+from sec_edgar_api.clients.submissions import SubmissionsParser, is_10k_form
+from sec_edgar_api.services.filing_history import (
+    FilingHistory,
+    HistoryPosition,
+    InvalidCursorError,
+)
+
+
+def columns(prefix: str, forms: list[str], filing_date: str = "2020-01-01") -> dict:
+    return {
+        "form": forms,
+        "accessionNumber": [f"{prefix}-{index}" for index in range(len(forms))],
+        "filingDate": [filing_date] * len(forms),
+        "reportDate": [""] * len(forms),
+        "primaryDocument": ["doc.htm"] * len(forms),
+    }
+
+
+class ShardedStubClient:
+    def __init__(self):
+        self.shard_fetches: list[str] = []
+        self.recent = columns("r", ["10-K", "8-K", "10-Q"], "2022-01-01")
+        self.shards = {
+            "CIK0000000001-submissions-001.json": columns(
+                "s1", ["10-K", "8-K", "10-K"], "2021-01-01"
+            ),
+            "CIK0000000001-submissions-002.json": columns("s2", ["10-K405", "4"], "2020-01-01"),
+        }
+
+    async def fetch_submissions(self, cik):
+        return {
+            "cik": "1",
+            "name": "AAA Corp",
+            "tickers": ["AAA"],
+            "filings": {
+                "recent": self.recent,
+                "files": [
+                    {"name": name, "filingFrom": shard["filingDate"][-1]}
+                    for name, shard in self.shards.items()
+                ],
+            },
+        }
+
+    async def fetch_submissions_shard(self, name):
+        self.shard_fetches.append(name)
+        return self.shards[name]
+
+
+@pytest.mark.asyncio
+async def test_pages_walk_into_older_shards_lazily_and_cache_them():
+    client = ShardedStubClient()
+    history = FilingHistory(client, SubmissionsParser("https://example.test"))
+
+    first, cursor = await history.page("0000000001", limit=1, form_predicate=is_10k_form)
+    assert [record.accession_number for record in first] == ["r-0"]
+    assert client.shard_fetches == []
+
+    second, cursor = await history.page(
+        "0000000001", limit=2, cursor=cursor, form_predicate=is_10k_form
+    )
+    assert [record.accession_number for record in second] == ["s1-0", "s1-2"]
+    assert client.shard_fetches == ["CIK0000000001-submissions-001.json"]
+
+    third, cursor = await history.page(
+        "0000000001", limit=2, cursor=cursor, form_predicate=is_10k_form
+    )
+    assert [record.accession_number for record in third] == ["s2-0"]
+    assert cursor is None
+    assert client.shard_fetches == [
+        "CIK0000000001-submissions-001.json",
+        "CIK0000000001-submissions-002.json",
+    ]
+
+    again, _ = await history.page("0000000001", limit=10, form_predicate=is_10k_form)
+    assert len(again) == 4
+    assert len(client.shard_fetches) == 2
+
+
+@pytest.mark.asyncio
+async def test_cursor_survives_filings_prepended_between_pages():
+    client = ShardedStubClient()
+    history = FilingHistory(client, SubmissionsParser("https://example.test"))
+
+    first, cursor = await history.page("0000000001", limit=2)
+    assert [record.accession_number for record in first] == ["r-0", "r-1"]
+
+    client.recent = {
+        key: [new, *values]
+        for (key, values), new in zip(
+            client.recent.items(), ["10-K", "n-0", "2023-01-01", "", "doc.htm"], strict=True
+        )
+    }
+    second, _ = await history.page("0000000001", limit=2, cursor=cursor)
+    assert [record.accession_number for record in second] == ["r-2", "s1-0"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_skips_shards_newer_than_its_position():
+    client = ShardedStubClient()
+    history = FilingHistory(client, SubmissionsParser("https://example.test"))
+
+    page, _ = await history.page(
+        "0000000001", limit=5, cursor=HistoryPosition("2020-01-01", "s2-0").encode()
+    )
+    assert [record.accession_number for record in page] == ["s2-1"]
+    assert client.shard_fetches == ["CIK0000000001-submissions-002.json"]
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    position = HistoryPosition("2024-02-01", "0000320193-24-000012")
+
+    assert HistoryPosition.decode(position.encode()) == position
+    assert HistoryPosition.decode(None) is None
+    with pytest.raises(InvalidCursorError):
+        HistoryPosition.decode("not a cursor!")
@@ -1,7 +1,13 @@
+import asyncio
+from datetime import date
+
+import httpx
 import pytest
 
+from sec_edgar_api.clients.sec_client import TickerListing
+from sec_edgar_api.clients.validators import ResponseValidators
 from sec_edgar_api.models.filings import CompanySummary
-from sec_edgar_api.services.financials_service import FinancialsService
+from sec_edgar_api.services.financials_service import FinancialsService, InvalidConceptError
 
 
 class StubClient:
@@ -493,7 +499,10 @@ class StubClient:
     async def fetch_company_tickers(self):
         return self._summaries
 
-    async def fetch_company_facts(self, cik: str):
+    async def fetch_ticker_listing(self, validators=None):
+        return TickerListing(companies=self._summaries, validators=ResponseValidators())
+
+    async def fetch_company_facts(self, cik: str, concepts=None):
         return self._facts_payload[cik]
 
 
@@ -540,10 +549,43 @@ class FallbackRevenueStub:
     async def fetch_company_tickers(self):
         return self._summaries
 
-    async def fetch_company_facts(self, cik: str):
+    async def fetch_ticker_listing(self, validators=None):
+        return TickerListing(companies=self._summaries, validators=ResponseValidators())
+
+    async def fetch_company_facts(self, cik: str, concepts=None):
         return self._facts_payload[cik]
 
 
+class RestatedRevenueStub(FallbackRevenueStub):
+    """Each 10-K repeats the prior year as a comparative; the 2024 figure was restated."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        def fact(fy, filed, year, val):
+            return {
+                "fy": fy,
+                "fp": "FY",
+                "form": "10-K",
+                "filed": filed,
+                "start": f"{year}-01-01",
+                "end": f"{year}-12-31",
+                "val": val,
+                "accn": f"0000000002-{fy % 100}-000001",
+            }
+
+        self._facts_payload["0000000002"]["facts"]["us-gaap"]["SalesRevenueNet"]["units"] = {
+            "USD": [
+                fact(2023, "2024-02-01", 2022, 90),
+                fact(2023, "2024-02-01", 2023, 100),
+                fact(2024, "2025-02-01", 2023, 100),
+                fact(2024, "2025-02-01", 2024, 110),
+                fact(2025, "2026-02-01", 2024, 115),
+                fact(2025, "2026-02-01", 2025, 120),
+            ]
+        }
+
+
 @pytest.mark.asyncio
 async def test_fetch_financial_snapshot_returns_metrics():
     service = FinancialsService(client=StubClient())
@@ -601,3 +643,184 @@ async def test_revenue_concept_falls_back_to_sales_revenue():
     revenues = snapshot.metrics["revenues"]
     assert [entry.value for entry in revenues.entries] == [222.0, 111.0]
     assert all(entry.concept == "SalesRevenueNet" for entry in revenues.entries)
+
+
+@pytest.mark.asyncio
+async def test_revenue_history_lists_distinct_periods_with_restated_values():
+    service = FinancialsService(client=RestatedRevenueStub())
+
+    statement = await service.fetch_income_statement("REV")
+
+    revenues = statement.metrics["revenues"]
+    assert [entry.end_date.year for entry in revenues.entries] == [2025, 2024, 2023]
+    assert [entry.value for entry in revenues.entries] == [120.0, 115.0, 100.0]
+    assert revenues.entries[2].filing_date == date(2025, 2, 1)
+
+
+class FlakyStub(StubClient):
+    async def fetch_company_facts(self, cik: str, concepts=None):
+        if cik == "0000000002":
+            raise httpx.ConnectError("unreachable")
+        return await super().fetch_company_facts(cik, concepts)
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_reports_per_ticker_results_and_errors():
+    stub = FlakyStub()
+    stub._summaries = stub._summaries + [
+        CompanySummary(cik="0000000002", ticker="BBB", title="BBB Corp"),
+    ]
+    service = FinancialsService(client=stub)
+    items = await service.fetch_batch(["aaa", "BBB", "ZZZ"], statement="income_statement")
+
+    assert [item.ticker for item in items] == ["AAA", "BBB", "ZZZ"]
+    assert items[0].result.filing_form == "10-K"
+    assert items[0].error is None
+    assert items[1].result is None and "unreachable" in items[1].error
+    assert items[2].error == "Ticker 'ZZZ' not found."
+
+
+class MalformedFactsStub(StubClient):
+    async def fetch_company_facts(self, cik: str, concepts=None):
+        if cik == "0000000002":
+            raise ValueError("malformed companyfacts payload")
+        return await super().fetch_company_facts(cik, concepts)
+
+
+class UnreachableRegistryStub(StubClient):
+    async def fetch_ticker_listing(self, validators=None):
+        raise httpx.ConnectError("registry unreachable")
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_reports_unexpected_errors_per_item_and_strips_tickers():
+    stub = MalformedFactsStub()
+    stub._summaries = stub._summaries + [
+        CompanySummary(cik="0000000002", ticker="BBB", title="BBB Corp"),
+    ]
+    service = FinancialsService(client=stub)
+    items = await service.fetch_batch([" aaa", "AAA", "bbb "])
+
+    assert [item.ticker for item in items] == ["AAA", "AAA", "BBB"]
+    assert items[0].result is not None
+    assert items[2].result is None and "malformed" in items[2].error
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_reports_registry_failures_per_item():
+    service = FinancialsService(client=UnreachableRegistryStub())
+    items = await service.fetch_batch(["AAA", "BBB"])
+
+    assert [item.ticker for item in items] == ["AAA", "BBB"]
+    assert all(item.result is None and "unreachable" in item.error for item in items)
+
+
+class SeriesStub(StubClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.requested_concepts = []
+        facts = self._facts_payload["0000000001"]["facts"]
+        facts["dei"] = {
+            "EntityCommonStockSharesOutstanding": {
+                "label": "Shares Outstanding",
+                "units": {
+                    "shares": [
+                        {"end": "2024-01-20", "fp": "FY", "filed": "2024-02-01", "val": 10},
+                        {"end": "2024-04-20", "fp": "Q1", "filed": "2024-05-01", "val": 11},
+                    ]
+                },
+            }
+        }
+
+    async def fetch_company_facts(self, cik: str, concepts=None):
+        self.requested_concepts.append(concepts)
+        return await super().fetch_company_facts(cik, concepts)
+
+
+@pytest.mark.asyncio
+async def test_fetch_concept_series_resolves_taxonomies_and_filters_ranges():
+    stub = SeriesStub()
+    service = FinancialsService(client=stub)
+
+    result = await service.fetch_concept_series(
+        "AAA",
+        ["CostOfRevenue", "dei:EntityCommonStockSharesOutstanding", "NoSuchConcept"],
+        period="FY",
+        start=date(2024, 1, 1),
+    )
+
+    assert result is not None and result.period == "FY"
+    cost, shares, missing = result.series
+    assert cost.taxonomy == "us-gaap"
+    assert [point.value for point in cost.units["USD"]] == [480.0, 520.0]
+    assert shares.taxonomy == "dei"
+    assert [point.value for point in shares.units["shares"]] == [10.0]
+    assert missing.taxonomy is None and missing.units == {}
+    assert stub.requested_concepts == [
+        {"CostOfRevenue", "EntityCommonStockSharesOutstanding", "NoSuchConcept"}
+    ]
+
+    with pytest.raises(InvalidConceptError):
+        await service.fetch_concept_series("AAA", ["sec:Revenues"])
+    assert await service.fetch_concept_series("ZZZ", ["Revenues"]) is None
+
+
+@pytest.mark.asyncio
+async def test_concept_series_share_one_widening_cache_entry_per_company():
+    stub = SeriesStub()
+    service = FinancialsService(client=stub)
+
+    await service.fetch_concept_series("AAA", ["NoSuchConcept"])
+    await service.fetch_concept_series("AAA", ["dei:EntityCommonStockSharesOutstanding"])
+    result = await service.fetch_concept_series(
+        "AAA", ["EntityCommonStockSharesOutstanding", "NoSuchConcept"]
+    )
+
+    assert result.series[0].units["shares"][0].value == 10.0
+    assert stub.requested_concepts == [
+        {"NoSuchConcept"},
+        {"NoSuchConcept", "EntityCommonStockSharesOutstanding"},
+    ]
+
+
+class GatedSeriesStub(SeriesStub):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.waiting = 0
+
+    async def fetch_company_facts(self, cik: str, concepts=None):
+        self.waiting += 1
+        await self.gate.wait()
+        self.waiting -= 1
+        return await super().fetch_company_facts(cik, concepts)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_widening_series_requests_each_get_their_concepts():
+    stub = GatedSeriesStub()
+    service = FinancialsService(client=stub)
+    stub.gate.clear()
+    first = asyncio.create_task(service.fetch_concept_series("AAA", ["NoSuchConcept"]))
+    while not stub.waiting:
+        await asyncio.sleep(0)
+    # Both join the first decode, then widen it at the same time.
+    widening = [
+        asyncio.create_task(service.fetch_concept_series("AAA", [concept]))
+        for concept in ["OtherConcept", "dei:EntityCommonStockSharesOutstanding"]
+    ]
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert stub.waiting == 1
+    stub.gate.set()
+    await first
+    other, shares = await asyncio.gather(*widening)
+
+    assert other.series[0].concept == "OtherConcept"
+    assert shares.series[0].units["shares"][0].value == 10.0
+    assert stub.requested_concepts[-1] == {
+        "NoSuchConcept",
+        "OtherConcept",
+        "EntityCommonStockSharesOutstanding",
+    }
@@ -0,0 +1,188 @@
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from sec_edgar_api.clients.sec_client import TickerListing
+from sec_edgar_api.clients.validators import ResponseValidators
+from sec_edgar_api.config import Settings, get_settings
+from sec_edgar_api.dependencies import (
+    close_http_client,
+    get_scan_job_manager,
+    get_tenk_service,
+    resume_scan_jobs,
+)
+from sec_edgar_api.models.filings import CompanySummary, Filing
+from sec_edgar_api.models.jobs import ScanJobRequest
+from sec_edgar_api.services.jobs import JobNotFoundError, TenKScanJobManager
+from sec_edgar_api.services.tenk_service import TenKService
+
+
+class StubClient:
+    def __init__(self, company_count: int) -> None:
+        self.summaries = [
+            CompanySummary(cik=str(index).zfill(10), ticker=f"T{index}", title=f"Co {index}")
+            for index in range(1, company_count + 1)
+        ]
+        self.fetched: list[str] = []
+        self.failing: set[str] = set()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def fetch_ticker_listing(self, validators=None):
+        return TickerListing(companies=self.summaries, validators=ResponseValidators())
+
+    async def fetch_recent_filings(self, cik: str, **options) -> list[Filing]:
+        await self.release.wait()
+        self.fetched.append(cik)
+        if cik in self.failing:
+            raise httpx.ConnectError("unreachable")
+        return [
+            Filing(
+                cik=cik,
+                ticker="T",
+                company_name="Co",
+                form_type="10-K",
+                filing_date=date(2024, 1, int(cik[-1]) or 1),
+                report_period=None,
+                accession_number=f"{cik}-24-000001",
+                primary_document_url=None,
+            )
+        ]
+
+
+def build_manager(client: StubClient, tmp_path, **options) -> TenKScanJobManager:
+    service = TenKService(client=client, settings=Settings(max_concurrent_requests=1))
+    return TenKScanJobManager(service, checkpoint_dir=tmp_path, checkpoint_interval=0, **options)
+
+
+@pytest.mark.asyncio
+async def test_job_runs_to_completion_and_exposes_results(tmp_path):
+    manager = build_manager(StubClient(3), tmp_path)
+    status = manager.start(ScanJobRequest())
+    await manager._jobs[status.job_id].task
+
+    status = manager.status(status.job_id)
+    assert status.state == "completed"
+    assert status.companies_done == 3
+    results = manager.results(status.job_id)
+    assert results.total_filings == 3
+    assert results.filings[0].cik == "0000000003"
+
+
+@pytest.mark.asyncio
+async def test_interrupted_job_resumes_from_checkpoint(tmp_path):
+    client = StubClient(4)
+    manager = build_manager(client, tmp_path)
+    job_id = manager.start(ScanJobRequest()).job_id
+    while manager.status(job_id).companies_done < 2:
+        await asyncio.sleep(0)
+    client.release.clear()
+    checkpointed = set(manager._jobs[job_id].completed_ciks)
+    await manager.aclose()
+
+    resumed_client = StubClient(4)
+    resumed = build_manager(resumed_client, tmp_path)
+    assert await resumed.resume_pending() == [job_id]
+    await resumed._jobs[job_id].task
+
+    assert resumed.status(job_id).state == "completed"
+    assert resumed.status(job_id).companies_done == 4
+    assert set(resumed_client.fetched).isdisjoint(checkpointed)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_is_not_resumed(tmp_path):
+    client = StubClient(2)
+    client.release.clear()
+    manager = build_manager(client, tmp_path)
+    job_id = manager.start(ScanJobRequest()).job_id
+    await asyncio.sleep(0)
+    assert (await manager.cancel(job_id)).state == "cancelled"
+
+    assert await build_manager(StubClient(2), tmp_path).resume_pending() == []
+    with pytest.raises(JobNotFoundError):
+        manager.status("missing")
+
+
+@pytest.mark.asyncio
+async def test_resumed_job_retries_failed_companies_from_appended_progress(tmp_path):
+    client = StubClient(3)
+    client.failing = {"0000000002"}
+    manager = build_manager(client, tmp_path)
+    job_id = manager.start(ScanJobRequest()).job_id
+    await manager._jobs[job_id].task
+    assert manager.status(job_id).companies_failed == 1
+
+    progress = (tmp_path / f"{job_id}.progress.ndjson").read_text().splitlines()
+    assert len(progress) == 3
+    checkpoint = (tmp_path / f"{job_id}.json").read_text()
+    assert "filings" not in checkpoint
+    # Simulate a crash mid-scan, with the last progress line torn.
+    (tmp_path / f"{job_id}.json").write_text(checkpoint.replace('"completed"', '"running"'))
+    with (tmp_path / f"{job_id}.progress.ndjson").open("a") as log:
+        log.write('{"cik": "00000')
+
+    resumed_client = StubClient(3)
+    resumed = build_manager(resumed_client, tmp_path)
+    assert await resumed.resume_pending() == [job_id]
+    await resumed._jobs[job_id].task
+
+    status = resumed.status(job_id)
+    assert resumed_client.fetched == ["0000000002"]
+    assert (status.state, status.companies_done, status.companies_failed) == ("completed", 3, 0)
+    assert resumed.results(job_id).total_filings == 3
+
+
+@pytest.mark.asyncio
+async def test_only_the_newest_finished_jobs_are_retained(tmp_path):
+    manager = build_manager(StubClient(1), tmp_path, max_finished_jobs=2)
+    job_ids = []
+    for _ in range(3):
+        job_id = manager.start(ScanJobRequest()).job_id
+        await manager._jobs[job_id].task
+        job_ids.append(job_id)
+
+    with pytest.raises(JobNotFoundError):
+        manager.status(job_ids[0])
+    assert not (tmp_path / f"{job_ids[0]}.json").exists()
+    assert not (tmp_path / f"{job_ids[0]}.progress.ndjson").exists()
+    assert [manager.status(job_id).state for job_id in job_ids[1:]] == ["completed"] * 2
+
+
+@pytest.mark.asyncio
+async def test_progress_is_not_serialized_without_a_checkpoint_dir():
+    service = TenKService(client=StubClient(2), settings=Settings(max_concurrent_requests=1))
+    manager = TenKScanJobManager(service)
+    job_id = manager.start(ScanJobRequest()).job_id
+    await manager._jobs[job_id].task
+
+    assert manager.status(job_id).companies_done == 2
+    assert manager._jobs[job_id].unsaved_progress == []
+
+
+@pytest.mark.asyncio
+async def test_startup_resume_honours_dependency_overrides(tmp_path):
+    client = StubClient(2)
+    manager = build_manager(client, tmp_path)
+    job_id = manager.start(ScanJobRequest()).job_id
+    await manager._jobs[job_id].task
+    checkpoint = tmp_path / f"{job_id}.json"
+    checkpoint.write_text(checkpoint.read_text().replace('"completed"', '"running"'))
+
+    resumed_client = StubClient(2)
+    settings = Settings(job_checkpoint_dir=tmp_path, max_concurrent_requests=1)
+    app = FastAPI()
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[get_tenk_service] = lambda: TenKService(
+        client=resumed_client, settings=settings
+    )
+    try:
+        await resume_scan_jobs(app)
+        resumed = await get_scan_job_manager()
+        await resumed._jobs[job_id].task
+        assert resumed.status(job_id).state == "completed"
+    finally:
+        await close_http_client()
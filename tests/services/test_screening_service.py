@@ -0,0 +1,63 @@
+import pytest
+
+from sec_edgar_api.services.local_store import LocalEdgarStore
+from sec_edgar_api.services.screening_service import ScreeningService, UnknownMetricError
+
+
+def facts(name: str, assets: list[tuple[int, float]]) -> dict:
+    return {
+        "entityName": name,
+        "facts": {
+            "us-gaap": {
+                "Assets": {
+                    "label": "Assets",
+                    "units": {
+                        "USD": [
+                            {
+                                "fy": fy,
+                                "fp": "FY",
+                                "form": "10-K",
+                                "filed": f"{fy + 1}-02-01",
+                                "end": f"{fy}-12-31",
+                                "val": value,
+                                "accn": f"0000000000-{fy % 100:02d}-000001",
+                            }
+                            for fy, value in assets
+                        ]
+                    },
+                }
+            }
+        },
+    }
+
+
+@pytest.fixture
+def service() -> ScreeningService:
+    store = LocalEdgarStore()
+    store.put_facts("0000000001", facts("Small", [(2023, 50.0), (2024, 10.0)]))
+    store.put_facts("0000000002", facts("Large", [(2024, 900.0)]))
+    store.put_facts("0000000003", facts("Medium", [(2022, 999.0), (2024, 300.0)]))
+    store.put_facts("0000000004", {"entityName": "No facts", "facts": {}})
+    return ScreeningService(store)
+
+
+@pytest.mark.asyncio
+async def test_screen_ranks_latest_values_within_range(service):
+    response = await service.screen("assets", minimum=100, limit=10)
+    assert response.companies_screened == 3
+    assert response.total_matches == 2
+    assert [result.company_name for result in response.results] == ["Large", "Medium"]
+    assert response.results[1].metric.value == 300.0
+    assert response.results[1].metric.fiscal_year == 2024
+
+
+@pytest.mark.asyncio
+async def test_screen_supports_ascending_top_k(service):
+    response = await service.screen("assets", descending=False, limit=2)
+    assert [result.metric.value for result in response.results] == [10.0, 300.0]
+
+
+@pytest.mark.asyncio
+async def test_unknown_metric_is_rejected(service):
+    with pytest.raises(UnknownMetricError):
+        await service.screen("market_cap")
@@ -0,0 +1,147 @@
+import gzip
+from datetime import date
+
+import httpx
+import pytest
+
+from sec_edgar_api.models.filings import Filing
+from sec_edgar_api.services.local_store import LocalEdgarStore
+from sec_edgar_api.services.sync_service import FilingsSyncService, parse_master_index
+
+HEADER = """Description:           Daily Index of EDGAR Dissemination Feed by Company Name
+Last Data Received:    {day}
+Comments:              webmaster@sec.gov
+Anonymous FTP:         ftp://ftp.sec.gov/edgar/
+
+CIK|Company Name|Form Type|Date Filed|File Name
+--------------------------------------------------------------------------------
+"""
+
+
+def write_index(directory, day, rows, *, compress=False):
+    text = HEADER.format(day=day) + "".join(f"{row}\n" for row in rows)
+    name = f"master.{day}.idx"
+    if compress:
+        path = directory / f"{name}.gz"
+        path.write_bytes(gzip.compress(text.encode("latin-1")))
+    else:
+        path = directory / name
+        path.write_text(text, encoding="latin-1")
+    return path
+
+
+def make_filing(cik: str, form_type: str, accession: str) -> Filing:
+    return Filing(
+        cik=cik,
+        ticker="",
+        company_name="Company",
+        form_type=form_type,
+        filing_date=date(2024, 1, 2),
+        report_period=None,
+        accession_number=accession,
+        primary_document_url=None,
+    )
+
+
+def seeded_store() -> LocalEdgarStore:
+    store = LocalEdgarStore()
+    store.mark_tenk_filings_loaded()
+    return store
+
+
+class RecordingStubClient:
+    def __init__(self, failing: set[str] | None = None):
+        self.calls: list[tuple[str, bool]] = []
+        self.failing = failing or set()
+
+    async def fetch_recent_filings(self, cik: str, *, form_predicate=None, revalidate=False):
+        self.calls.append((cik, revalidate))
+        if cik in self.failing:
+            raise httpx.ConnectError("boom")
+        filings = [make_filing(cik, "8-K", f"{cik}-8k"), make_filing(cik, "10-K", f"{cik}-10k")]
+        return [f for f in filings if form_predicate is None or form_predicate(f.form_type)]
+
+
+def test_parse_master_index_skips_preamble_and_normalizes_rows():
+    row = "320193|APPLE INC|10-K|20240102|edgar/data/320193/0000320193-24-000001.txt"
+    lines = (HEADER.format(day="20240102") + row + "\n").splitlines()
+
+    entries = list(parse_master_index(lines))
+
+    assert len(entries) == 1
+    assert entries[0].cik == "0000320193"
+    assert entries[0].form_type == "10-K"
+    assert entries[0].date_filed == date(2024, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_sync_refreshes_only_new_tenk_filers_and_persists_watermark(tmp_path):
+    index_dir = tmp_path / "daily-index" / "2024" / "QTR1"
+    index_dir.mkdir(parents=True)
+    write_index(index_dir, "20240102", ["1|ONE|10-K|20240102|x", "2|TWO|8-K|20240102|x"])
+    write_index(index_dir, "20240103", ["3|THREE|10-K/A|20240103|x"], compress=True)
+    state_path = tmp_path / "state.json"
+    client = RecordingStubClient()
+    store = seeded_store()
+    service = FilingsSyncService(
+        client, store, index_dir=tmp_path / "daily-index", state_path=state_path
+    )
+
+    report = await service.sync()
+
+    assert report.days_processed == 2
+    assert report.companies_refreshed == 2
+    assert report.watermark == date(2024, 1, 3)
+    assert client.calls == [("0000000001", True), ("0000000003", True)]
+    assert [f.form_type for f in store.tenk_filings_for("0000000001")] == ["10-K"]
+    assert store.tenk_filings_for("0000000002") is None
+
+    write_index(index_dir, "20240104", ["4|FOUR|10-K|20240104|x"])
+    client.calls.clear()
+    resumed = FilingsSyncService(
+        client, store, index_dir=tmp_path / "daily-index", state_path=state_path
+    )
+
+    report = await resumed.sync()
+
+    assert report.days_processed == 1
+    assert client.calls == [("0000000004", True)]
+    assert resumed.watermark() == date(2024, 1, 4)
+
+
+@pytest.mark.asyncio
+async def test_sync_stops_before_a_day_with_failures(tmp_path):
+    write_index(tmp_path, "20240102", ["1|ONE|10-K|20240102|x"])
+    write_index(tmp_path, "20240103", ["2|TWO|10-K|20240103|x"])
+    write_index(tmp_path, "20240104", ["3|THREE|10-K|20240104|x"])
+    state_path = tmp_path / "state.json"
+    service = FilingsSyncService(
+        RecordingStubClient(failing={"0000000002"}),
+        seeded_store(),
+        index_dir=tmp_path,
+        state_path=state_path,
+    )
+
+    report = await service.sync()
+
+    assert report.days_processed == 1
+    assert report.failed_ciks == ["0000000002"]
+    assert service.watermark() == date(2024, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_sync_leaves_a_store_without_bulk_filings_untouched(tmp_path):
+    write_index(tmp_path, "20240102", ["1|ONE|10-K|20240102|x"])
+    client = RecordingStubClient()
+    store = LocalEdgarStore()
+    service = FilingsSyncService(
+        client, store, index_dir=tmp_path, state_path=tmp_path / "state.json"
+    )
+
+    report = await service.sync()
+
+    assert not service.available
+    assert report.days_processed == 0
+    assert client.calls == []
+    assert store.tenk_filings_for("0000000001") is None
+    assert service.watermark() is None
@@ -0,0 +1,87 @@
+import pytest
+
+from sec_edgar_api.clients.retry import CircuitOpenError
+from sec_edgar_api.clients.sec_client import TickerListing
+from sec_edgar_api.clients.validators import ResponseValidators
+from sec_edgar_api.models.filings import CompanySummary
+from sec_edgar_api.services.ticker_registry import TickerRegistry
+
+
+class CountingStub:
+    def __init__(self) -> None:
+        self.calls: list[ResponseValidators | None] = []
+        self.modified = True
+
+    async def fetch_ticker_listing(self, validators=None):
+        self.calls.append(validators)
+        if validators and not self.modified:
+            return None
+        return TickerListing(
+            companies=[
+                CompanySummary(cik="0000000001", ticker="AAA", title="AAA Corp"),
+                CompanySummary(cik="0000000002", ticker="BBB", title="BBB Corp"),
+            ],
+            validators=ResponseValidators(etag='"v1"'),
+        )
+
+
+@pytest.mark.asyncio
+async def test_lookups_share_a_single_download():
+    stub = CountingStub()
+    registry = TickerRegistry(stub)
+    assert (await registry.get_by_ticker("aaa")).cik == "0000000001"
+    assert (await registry.get_by_cik(2)).ticker == "BBB"
+    assert await registry.get_by_ticker("ZZZ") is None
+    assert len(await registry.companies()) == 2
+    assert stub.calls == [None]
+
+
+@pytest.mark.asyncio
+async def test_refresh_revalidates_with_previous_validators():
+    stub = CountingStub()
+    registry = TickerRegistry(stub)
+    await registry.companies()
+    stub.modified = False
+    await registry.refresh()
+    assert stub.calls[-1] == ResponseValidators(etag='"v1"')
+    assert (await registry.get_by_ticker("AAA")).title == "AAA Corp"
+
+
+@pytest.mark.asyncio
+async def test_stale_registry_refreshes_in_background():
+    stub = CountingStub()
+    registry = TickerRegistry(stub, ttl=0.0001)
+    await registry.companies()
+    registry._loaded_at -= 1
+    assert await registry.get_by_ticker("AAA") is not None
+    await registry._refresh_task
+    assert len(stub.calls) == 2
+    await registry.aclose()
+
+
+class OpenCircuitStub(CountingStub):
+    def __init__(self) -> None:
+        super().__init__()
+        self.failing = False
+
+    async def fetch_ticker_listing(self, validators=None):
+        if self.failing:
+            self.calls.append(validators)
+            raise CircuitOpenError(30.0)
+        return await super().fetch_ticker_listing(validators)
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_backs_off():
+    stub = OpenCircuitStub()
+    registry = TickerRegistry(stub, ttl=3600)
+    await registry.companies()
+    registry._loaded_at -= 3601
+    stub.failing = True
+
+    assert await registry.get_by_ticker("AAA") is not None
+    await registry._refresh_task
+    assert await registry.get_by_ticker("BBB") is not None
+    assert registry._refresh_task.done()
+    assert len(stub.calls) == 2
+    await registry.aclose()
@@ -0,0 +1,28 @@
+import pytest
+
+from sec_edgar_api import json_codec
+from sec_edgar_api.responses import FastJSONResponse
+
+
+@pytest.mark.parametrize("name", json_codec.available_codecs())
+def test_codecs_round_trip_companyfacts_shapes(name):
+    codec = json_codec.get_codec(name)
+    payload = {"entityName": "Café Corp", "facts": {"us-gaap": {"Revenues": [{"val": 1.5}]}}}
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.decode()) == payload
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        json_codec.get_codec("simplejson")
+
+
+def test_fast_json_response_renders_compact_utf8():
+    response = FastJSONResponse({"name": "Café", "values": [1, 2]})
+
+    assert response.body == '{"name":"Café","values":[1,2]}'.encode()
+    assert response.media_type == "application/json"
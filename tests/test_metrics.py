@@ -0,0 +1,45 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from sec_edgar_api.app import create_app
+from sec_edgar_api.metrics import Counter, Histogram, Registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency.", ("endpoint",), buckets=(0.1, 1.0))
+    )
+    histogram.observe(0.05, endpoint="tickers")
+    histogram.observe(0.5, endpoint="tickers")
+    histogram.observe(3.0, endpoint="tickers")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{endpoint="tickers",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{endpoint="tickers",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{endpoint="tickers",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{endpoint="tickers"} 3.55' in lines
+    assert 'latency_seconds_count{endpoint="tickers"} 3' in lines
+
+
+def test_metrics_reject_unknown_labels():
+    counter = Counter("lookups_total", "Lookups.", ("cache",))
+    with pytest.raises(ValueError):
+        counter.inc(cache="facts", result="hit")
+
+
+def test_metrics_endpoint_reports_route_templates():
+    client = TestClient(create_app())
+    assert client.get("/health").status_code == 200
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+        in response.text
+    )
+    assert "sec_rate_limiter_queue_depth 0" in response.text
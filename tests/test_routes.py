@@ -0,0 +1,229 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sec_edgar_api.app import create_app
+from sec_edgar_api.clients.sec_client import TickerListing
+from sec_edgar_api.clients.submissions import FilingRecord
+from sec_edgar_api.clients.validators import ResponseValidators
+from sec_edgar_api.config import Settings
+from sec_edgar_api.dependencies import (
+    get_financials_service,
+    get_scan_job_manager,
+    get_screening_service,
+    get_sync_service,
+    get_tenk_service,
+)
+from sec_edgar_api.models.filings import CompanySummary
+from sec_edgar_api.services.financials_service import FinancialsService
+from sec_edgar_api.services.jobs import TenKScanJobManager
+from sec_edgar_api.services.local_store import LocalEdgarStore
+from sec_edgar_api.services.screening_service import ScreeningService
+from sec_edgar_api.services.sync_service import FilingsSyncService
+from sec_edgar_api.services.tenk_service import TenKService
+
+SETTINGS = Settings(max_concurrent_requests=2)
+
+
+def facts(name: str, assets: float) -> dict:
+    entry = {
+        "fy": 2024,
+        "fp": "FY",
+        "form": "10-K",
+        "filed": "2025-02-01",
+        "end": "2024-12-31",
+        "val": assets,
+        "accn": "0000000000-25-000001",
+    }
+    return {
+        "entityName": name,
+        "facts": {
+            "us-gaap": {
+                "Assets": {"label": "Assets", "units": {"USD": [entry]}},
+                "Revenues": {"label": "Revenues", "units": {"USD": [entry]}},
+            }
+        },
+    }
+
+
+class StubClient:
+    def __init__(self) -> None:
+        self.summaries = [
+            CompanySummary(cik="0000000001", ticker="AAA", title="AAA Corp"),
+            CompanySummary(cik="0000000002", ticker="BBB", title="BBB Corp"),
+        ]
+        self.facts = {"0000000001": facts("AAA Corp", 100.0), "0000000002": facts("BBB", 5.0)}
+
+    async def fetch_ticker_listing(self, validators=None):
+        return TickerListing(companies=self.summaries, validators=ResponseValidators())
+
+    async def fetch_company_facts(self, cik: str, *, concepts=None):
+        return self.facts[cik]
+
+    async def fetch_recent_filings(self, cik: str, *, form_predicate=None, limit=None, **options):
+        return [
+            FilingRecord(
+                cik=cik,
+                ticker="",
+                company_name="Co",
+                form_type="10-K",
+                filing_date="2024-03-01",
+                report_period="2023-12-31",
+                accession_number=f"{cik}-24-000001",
+                primary_document_url=None,
+            )
+        ][:limit]
+
+    async def fetch_submissions(self, cik: str):
+        return {
+            "cik": cik,
+            "name": "AAA Corp",
+            "tickers": ["AAA"],
+            "filings": {
+                "recent": {
+                    "form": ["10-K", "8-K", "10-K"],
+                    "accessionNumber": ["a-0", "a-1", "a-2"],
+                    "filingDate": ["2024-03-01", "2023-06-01", "2023-03-01"],
+                    "reportDate": ["", "", ""],
+                    "primaryDocument": ["doc.htm"] * 3,
+                },
+                "files": [],
+            },
+        }
+
+
+@pytest.fixture
+def stub() -> StubClient:
+    return StubClient()
+
+
+@pytest.fixture
+def app(stub) -> FastAPI:
+    application = create_app(SETTINGS)
+    tenk_service = TenKService(client=stub, settings=SETTINGS)
+    financials_service = FinancialsService(client=stub)
+    job_manager = TenKScanJobManager(tenk_service)
+    application.dependency_overrides.update(
+        {
+            get_tenk_service: lambda: tenk_service,
+            get_financials_service: lambda: financials_service,
+            get_scan_job_manager: lambda: job_manager,
+            get_screening_service: lambda: ScreeningService(LocalEdgarStore()),
+            get_sync_service: lambda: None,
+        }
+    )
+    return application
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    return TestClient(app)
+
+
+def test_batch_returns_results_in_request_order_with_item_errors(client):
+    response = client.post(
+        "/financials/batch", json={"tickers": ["bbb", "ZZZ", "AAA"], "metrics": ["assets"]}
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["ticker"] for item in results] == ["BBB", "ZZZ", "AAA"]
+    assert results[1]["error"] == "Ticker 'ZZZ' not found."
+    assert list(results[2]["result"]["metrics"]) == ["assets"]
+    assert results[2]["result"]["metrics"]["assets"]["value"] == 100.0
+
+
+def test_batch_streams_ndjson(client):
+    response = client.post(
+        "/financials/batch?stream=ndjson",
+        json={"tickers": ["AAA", "BBB"], "statement": "income_statement"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item["ticker"] for item in items) == ["AAA", "BBB"]
+    assert all(item["result"]["filing_form"] == "10-K" for item in items)
+
+
+def test_batch_rejects_bad_requests(client):
+    unknown = client.post("/financials/batch", json={"tickers": ["AAA"], "metrics": ["eps"]})
+    assert unknown.status_code == 400
+    assert "eps" in unknown.json()["detail"]
+    assert client.post("/financials/batch", json={"tickers": []}).status_code == 422
+
+
+def test_screen_needs_loaded_facts_and_a_known_metric(app, client):
+    assert client.get("/financials/screen?metric=assets").status_code == 503
+
+    store = LocalEdgarStore()
+    store.put_facts("0000000001", facts("AAA Corp", 100.0))
+    store.put_facts("0000000002", facts("BBB", 5.0))
+    app.dependency_overrides[get_screening_service] = lambda: ScreeningService(store)
+
+    assert client.get("/financials/screen?metric=ebitda").status_code == 400
+    response = client.get("/financials/screen?metric=assets&min=10")
+    assert response.status_code == 200
+    assert [item["cik"] for item in response.json()["results"]] == ["0000000001"]
+
+
+def test_series_validates_concepts_and_range(client):
+    response = client.get("/financials/AAA/series?concepts=Assets,Revenues&period=FY")
+    assert response.status_code == 200
+    assert [series["concept"] for series in response.json()["series"]] == ["Assets", "Revenues"]
+
+    assert client.get("/financials/AAA/series?concepts=,").status_code == 400
+    assert (
+        client.get(
+            "/financials/AAA/series?concepts=Assets&from=2024-01-01&to=2023-01-01"
+        ).status_code
+        == 400
+    )
+    assert client.get("/financials/AAA/series?concepts=bogus:Assets").status_code == 400
+    assert client.get("/financials/ZZZ/series?concepts=Assets").status_code == 404
+
+
+def test_history_pages_and_rejects_bad_cursors(client):
+    first = client.get("/filings/10-k/AAA/history?limit=1")
+    assert first.status_code == 200
+    page = first.json()
+    assert [filing["accession_number"] for filing in page["filings"]] == ["a-0"]
+
+    second = client.get(f"/filings/10-k/AAA/history?limit=1&cursor={page['next_cursor']}")
+    assert [filing["accession_number"] for filing in second.json()["filings"]] == ["a-2"]
+
+    assert client.get("/filings/10-k/AAA/history?cursor=not-a-cursor").status_code == 400
+    assert client.get("/filings/10-k/ZZZ/history").status_code == 404
+
+
+def test_jobs_start_report_and_404_for_unknown_ids(client):
+    started = client.post("/filings/10-k/jobs", json={"max_companies": 1})
+    assert started.status_code == 202
+    job_id = started.json()["job_id"]
+
+    assert client.get(f"/filings/10-k/jobs/{job_id}").status_code == 200
+    assert client.get(f"/filings/10-k/jobs/{job_id}/results").status_code == 200
+    assert client.delete(f"/filings/10-k/jobs/{job_id}").status_code == 200
+    for response in (
+        client.get("/filings/10-k/jobs/missing"),
+        client.get("/filings/10-k/jobs/missing/results"),
+        client.delete("/filings/10-k/jobs/missing"),
+    ):
+        assert response.status_code == 404
+
+
+def test_sync_needs_an_index_dir_and_bulk_filings(app, client, stub, tmp_path):
+    assert client.post("/filings/sync").status_code == 503
+
+    store = LocalEdgarStore()
+    app.dependency_overrides[get_sync_service] = lambda: FilingsSyncService(
+        stub, store, index_dir=tmp_path, state_path=tmp_path / "state.json"
+    )
+    assert client.post("/filings/sync").status_code == 503
+
+    store.mark_tenk_filings_loaded()
+    response = client.post("/filings/sync")
+    assert response.status_code == 200
+    assert response.json()["days_processed"] == 0
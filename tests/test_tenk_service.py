@@ -1,7 +1,10 @@
 from datetime import date
 
+import httpx
 import pytest
 
+from sec_edgar_api.clients.sec_client import TickerListing
+from sec_edgar_api.clients.validators import ResponseValidators
 from sec_edgar_api.config import Settings
 from sec_edgar_api.models.filings import CompanySummary, Filing
 from sec_edgar_api.services.tenk_service import TenKService
@@ -53,8 +56,18 @@ class StubClient:
     async def fetch_company_tickers(self) -> list[CompanySummary]:
         return self._summaries
 
-    async def fetch_recent_filings(self, cik: str) -> list[Filing]:
-        return self._filings_by_cik[cik]
+    async def fetch_ticker_listing(self, validators=None) -> TickerListing:
+        return TickerListing(companies=self._summaries, validators=ResponseValidators())
+
+    async def fetch_recent_filings(
+        self, cik: str, *, form_predicate=None, limit=None
+    ) -> list[Filing]:
+        filings = [
+            filing
+            for filing in self._filings_by_cik[cik]
+            if form_predicate is None or form_predicate(filing.form_type)
+        ]
+        return filings[:limit]
 
 
 @pytest.mark.asyncio
@@ -72,3 +85,29 @@ async def test_fetch_all_filings_limits_per_company():
     assert aggregated.companies_examined == 1
     assert aggregated.total_filings == 1
     assert aggregated.filings[0].ticker == "AAA"
+
+
+class FailingStubClient(StubClient):
+    async def fetch_recent_filings(self, cik: str, **options) -> list[Filing]:
+        if cik == "0000000001":
+            raise httpx.ConnectError("unreachable")
+        return await super().fetch_recent_filings(cik, **options)
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_filings_skips_companies_that_fail():
+    service = TenKService(client=FailingStubClient(), settings=Settings())
+    aggregated = await service.fetch_all_filings(limit_per_company=1)
+    assert aggregated.companies_examined == 2
+    assert aggregated.companies_failed == 1
+    assert [filing.ticker for filing in aggregated.filings] == ["BBB"]
+
+
+@pytest.mark.asyncio
+async def test_stream_filings_yields_tenk_filings_per_company():
+    service = TenKService(client=StubClient(), settings=Settings(max_concurrent_requests=1))
+    streamed = [filing async for filing in service.stream_filings(limit_per_company=5)]
+    assert sorted(filing.accession_number for filing in streamed) == [
+        "0000000001-23-000001",
+        "0000000002-23-000001",
+    ]
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sec_edgar_api.profiling import ProfilingMiddleware
+from sec_edgar_api.responses import FastJSONResponse
+from sec_edgar_api.timing import ServerTimingMiddleware, current_timings, phase
+
+
+def busy_extract() -> int:
+    deadline = time.perf_counter() + 0.05
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def build_app() -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/work")
+    async def work() -> dict[str, int]:
+        with phase("download"):
+            await asyncio.sleep(0.01)
+        with phase("extract"):
+            return {"iterations": busy_extract()}
+
+    return app
+
+
+def test_phase_outside_a_timed_request_is_a_no_op():
+    with phase("download"):
+        pass
+    assert current_timings() is None
+
+
+def test_server_timing_header_reports_phases_in_order():
+    app = build_app()
+    app.add_middleware(ServerTimingMiddleware)
+
+    response = TestClient(app).get("/work")
+
+    names = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+    assert names == ["download", "extract", "serialize", "render", "total"]
+    download = response.headers["server-timing"].split(", ")[0]
+    assert float(download.split("dur=")[1].split(";")[0]) >= 10
+
+
+def test_profile_query_returns_collapsed_stacks():
+    app = build_app()
+    app.add_middleware(ProfilingMiddleware, interval=0.001)
+    client = TestClient(app)
+
+    response = client.get("/work?profile=1")
+
+    assert response.headers["x-profiled-status"] == "200"
+    stacks = response.text.splitlines()
+    assert any("test_timing:busy_extract" in line for line in stacks)
+    stack, count = stacks[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+    assert client.get("/work").json()["iterations"] > 0